@@ -1,5 +1,8 @@
 """Configuration management for SimpleCRM backend."""
 
+from typing import Literal, Optional
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +13,104 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     SESSION_DURATION_DAYS: int = 7
 
+    # Apply pending migrations at startup (false: refuse to start until
+    # scripts/migrate.py has run, e.g. for rolling restarts)
+    SCHEMA_AUTO_MIGRATE: bool = True
+
+    # How long a process waits for another one to finish migrating
+    SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS: float = 600.0
+
+    # Batched migrations: rows per transaction and pause between batches so
+    # application writes can interleave
+    BACKFILL_BATCH_SIZE: int = 1000
+    BACKFILL_PAUSE_MS: float = 50.0
+
+    # Connection pool for pooled engines (file SQLite and server databases);
+    # recycle and pre-ping only apply to server databases
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Per-request SQL instrumentation: warn when one statement repeats this
+    # often in a request (0 disables) and log statements slower than
+    # SLOW_QUERY_MS (0 disables) with redacted parameters, optionally to
+    # their own file
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 10
+    SLOW_QUERY_MS: float = 200.0
+    SLOW_QUERY_LOG_FILE: Optional[str] = None
+
+    # Send per-phase timings (auth, db, handler, serialize) in a Server-Timing
+    # response header; per-route latency histograms are kept either way
+    SERVER_TIMING_HEADER: bool = True
+
+    # Prometheus /metrics endpoint. With several workers, point
+    # METRICS_MULTIPROC_DIR at a directory shared by all of them (emptied
+    # before start); each worker writes its counters there every
+    # METRICS_WRITE_INTERVAL_SECONDS and /metrics sums them
+    METRICS_ENABLED: bool = True
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_WRITE_INTERVAL_SECONDS: float = 5.0
+
+    # Shared secret for /api/admin endpoints (X-Admin-Token header); empty disables them
+    ADMIN_TOKEN: str = ""
+
+    # SQLite pragmas applied to every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_CACHE_SIZE: int = -65536  # negative = KiB, i.e. 64 MiB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_FOREIGN_KEYS: bool = True
+
+    # Connection split: GET/HEAD requests use a pool of read-only connections
+    # (0 disables it); write transactions are serialized in-process
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITER_TIMEOUT_SECONDS: float = 30.0
+
+    # Async read path: hot GET endpoints run as async handlers on an AsyncEngine
+    # (aiosqlite for SQLite). ASYNC_DATABASE_URL overrides the derived URL.
+    ASYNC_DB_ENABLED: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Issued token format: "database" (random token + sessions row) or "signed"
+    # (HMAC-signed, verified without a query). Both formats are always accepted.
+    SESSION_TOKEN_MODE: Literal["database", "signed"] = "database"
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 10.0
+
+    # Opt-in group commit: batch contact/activity/attachment inserts arriving
+    # within GROUP_COMMIT_WINDOW_MS into one transaction
+    GROUP_COMMIT_ENABLED: bool = False
+    GROUP_COMMIT_WINDOW_MS: float = 5.0
+    GROUP_COMMIT_MAX_BATCH: int = 100
+
+    # Sliding expiry: renew sessions used with less than this much lifetime left
+    # (0 disables), writing buffered renewals every SESSION_ACTIVITY_FLUSH_SECONDS
+    SESSION_RENEW_THRESHOLD_HOURS: float = 84.0
+    SESSION_ACTIVITY_FLUSH_SECONDS: float = 5.0
+
+    # Live sessions kept per user; the oldest are evicted on login (0 = unlimited)
+    MAX_SESSIONS_PER_USER: int = 10
+
+    # Background deletion of expired sessions (interval 0 disables the sweeper)
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 300.0
+    SESSION_SWEEP_BATCH_SIZE: int = 1000
+
+    # In-process cache of session token -> user (TTL 0 disables it)
+    AUTH_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_CACHE_MAX_SIZE: int = 10000
+
+    # bcrypt cost factor (log2 rounds, 4-31); calibrate with scripts/calibrate_password_cost.py
+    PASSWORD_BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+
+    # Dedicated bcrypt worker pool ("thread" or "process")
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,26 +1,418 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
+from app.services.query_stats import query_recorder
 
-# Create SQLAlchemy engine for SQLite
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+# HTTP methods served from the read-only connection pool
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Pragmas that only affect writes and cannot be set on read-only connections
+WRITE_ONLY_PRAGMAS = frozenset({"journal_mode", "synchronous", "foreign_keys"})
+
+
+def _is_file_sqlite(url: str) -> bool:
+    """Whether a database URL points at an on-disk SQLite file."""
+    parsed = make_url(url)
+    return (
+        parsed.get_backend_name() == "sqlite"
+        and parsed.database not in (None, "", ":memory:")
+        and not parsed.database.startswith("file:")
+    )
+
+
+# Async driver for each sync driver that has no async mode of its own
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+mysqldb": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    Derive the async driver URL for a database URL.
+
+    Args:
+        url: Sync database URL (e.g. sqlite:///./simplecrm.db)
+
+    Returns:
+        str: settings.ASYNC_DATABASE_URL if set, the URL unchanged if its
+            driver is already async, otherwise the URL with the matching
+            async driver (aiosqlite, asyncpg, aiomysql)
+
+    Raises:
+        ValueError: If no async driver is known for the URL's driver
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    parsed = make_url(url)
+    if parsed.drivername in ASYNC_DRIVERS:
+        return parsed.set(drivername=ASYNC_DRIVERS[parsed.drivername]).render_as_string(hide_password=False)
+    if getattr(parsed.get_dialect(), "is_async", False):
+        return url
+    raise ValueError(
+        f"No async driver known for '{parsed.drivername}'; set ASYNC_DATABASE_URL "
+        "to an async URL for this database or disable ASYNC_DB_ENABLED"
+    )
+
+
+class PoolWaitMetrics:
+    """Thread-safe counters of how long pool checkouts waited for a connection."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout and how long it waited."""
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Get the counters.
+
+        Returns:
+            dict: checkouts, timeouts, and average and maximum wait in milliseconds
+        """
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+                "max_wait_ms": self.max_wait * 1000
+            }
+
+
+class _MeteredPoolMixin:
+    """Times every checkout of a queue pool (including opening new connections)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_overflow = kwargs.get("max_overflow", 10)
+        self.wait_metrics = PoolWaitMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_metrics.record(time.perf_counter() - started)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+
+class MeteredAsyncAdaptedQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+
+
+def engine_options(
+    url: str,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    poolclass: type = MeteredQueuePool
+) -> dict:
+    """
+    Build dialect-aware create_engine keyword arguments for a database URL.
+
+    SQLite gets check_same_thread=False. Pooled engines (file SQLite and
+    server databases) get the DB_POOL_* settings; server databases also get
+    pool_recycle and pool_pre_ping, which guard against connections dropped
+    by the server or a proxy. In-memory SQLite keeps SQLAlchemy's
+    single-connection pool.
+
+    Args:
+        url: Database URL
+        pool_size: Override for settings.DB_POOL_SIZE
+        max_overflow: Override for settings.DB_MAX_OVERFLOW
+        poolclass: Queue pool class to use
 
-# Create SessionLocal factory for database sessions
+    Returns:
+        dict: Keyword arguments for create_engine / create_async_engine
+    """
+    options = {}
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+
+    if is_sqlite:
+        options["connect_args"] = {"check_same_thread": False}
+        if not _is_file_sqlite(url):
+            return options
+
+    options.update(
+        poolclass=poolclass,
+        pool_size=settings.DB_POOL_SIZE if pool_size is None else pool_size,
+        max_overflow=settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+    )
+    if not is_sqlite:
+        options.update(
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING
+        )
+    return options
+
+
+# Create SQLAlchemy engine (read-write)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+# Reader engine: a pool of query_only connections that, under WAL, read a
+# consistent snapshot concurrently with the writer. They are not opened with
+# mode=ro: such connections take no lock while idle, so when the last writer
+# closes SQLite deletes the -wal/-shm files and leaves readers on a stale
+# wal-index.
+read_engine: Optional[Engine] = None
+if settings.SQLITE_READ_POOL_SIZE > 0 and _is_file_sqlite(settings.DATABASE_URL):
+    read_engine = create_engine(
+        settings.DATABASE_URL,
+        **engine_options(settings.DATABASE_URL, pool_size=settings.SQLITE_READ_POOL_SIZE, max_overflow=0)
+    )
+
+# Async reader engine for the async route handlers. Only reads go through it:
+# writes stay on the sync engine, where they are serialized.
+async_engine: Optional[AsyncEngine] = None
+if settings.ASYNC_DB_ENABLED and _is_file_sqlite(settings.DATABASE_URL):
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        # Explicit queue pool: aiosqlite would default to NullPool
+        **engine_options(
+            settings.DATABASE_URL,
+            pool_size=max(settings.SQLITE_READ_POOL_SIZE, 1),
+            max_overflow=0,
+            poolclass=MeteredAsyncAdaptedQueuePool
+        )
+    )
+elif settings.ASYNC_DB_ENABLED and not settings.DATABASE_URL.startswith("sqlite"):
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL),
+        **engine_options(settings.DATABASE_URL, poolclass=MeteredAsyncAdaptedQueuePool)
+    )
+
+
+class WriteSerializer:
+    """
+    Serializes write transactions on an engine with an in-process lock.
+
+    The lock is taken when a connection issues its first INSERT, UPDATE or
+    DELETE and released when that transaction commits or rolls back (or the
+    connection returns to the pool). Concurrent writers therefore queue in
+    the application instead of polling SQLite's lock via busy_timeout,
+    while read-only work on the same engine never waits.
+    """
+
+    INFO_KEY = "holds_write_lock"
+    WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+    def __init__(self, timeout_seconds: float):
+        """
+        Initialize the serializer.
+
+        Args:
+            timeout_seconds: Maximum wait for the write lock before failing
+        """
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+
+    def install(self, bind: Engine) -> None:
+        """Register the serializer's events on an engine."""
+        event.listen(bind, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(bind, "commit", self._release)
+        event.listen(bind, "rollback", self._release)
+        event.listen(bind.pool, "checkin", self._checkin)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get(self.INFO_KEY):
+            return
+        if not statement.lstrip().upper().startswith(self.WRITE_PREFIXES):
+            return
+        if not self._lock.acquire(timeout=self.timeout_seconds):
+            raise TimeoutError("Timed out waiting for the database writer")
+        conn.info[self.INFO_KEY] = True
+
+    def _release(self, conn):
+        if conn.info.pop(self.INFO_KEY, False):
+            self._lock.release()
+
+    def _checkin(self, dbapi_connection, connection_record):
+        if connection_record.info.pop(self.INFO_KEY, False):
+            self._lock.release()
+
+
+write_serializer: Optional[WriteSerializer] = None
+if _is_file_sqlite(settings.DATABASE_URL):
+    write_serializer = WriteSerializer(settings.SQLITE_WRITER_TIMEOUT_SECONDS)
+    write_serializer.install(engine)
+
+# Create SessionLocal factory for database sessions (read-write)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only session factory (falls back to the writer when the pool is disabled)
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine if read_engine is not None else engine
+)
+
+# Async read-only session factory (None unless ASYNC_DB_ENABLED)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None else None
+)
+
 # Create Base declarative class for models
 Base = declarative_base()
 
 
-def get_db():
+def sqlite_pragmas() -> dict:
     """
-    Dependency function for FastAPI to inject database sessions.
+    Get the SQLite pragma profile configured in settings.
+
+    Returns:
+        dict: Pragma name -> value, in the order they are applied
+    """
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply the configured pragma profile to a new SQLite connection.
+
+    Registered as a connect event so every pooled connection gets the same
+    settings. journal_mode=WAL is persistent in the database file; the rest
+    are per connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def apply_read_only_pragmas(dbapi_connection, connection_record):
+    """
+    Apply the read-relevant part of the pragma profile to a reader connection.
+
+    query_only makes SQLite reject any write on the connection.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            if name not in WRITE_ONLY_PRAGMAS:
+                cursor.execute(f"PRAGMA {name}={value}")
+        cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def pool_status(bind: Engine) -> dict:
+    """
+    Report the live state of an engine's connection pool.
+
+    Args:
+        bind: Engine to inspect
+
+    Returns:
+        dict: Pool class, and for queue pools the size, checked-out and
+            overflow connection counts, plus checkout wait metrics when the
+            pool is metered
+    """
+    pool = bind.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=getattr(pool, "max_overflow", None),
+            timeout_seconds=pool.timeout()
+        )
+
+    metrics = getattr(pool, "wait_metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+
+    return status
+
+
+def get_effective_pragmas(bind: Engine) -> dict:
+    """
+    Read back the pragma values SQLite actually applied.
+
+    SQLite silently ignores unsupported values (e.g. WAL on an in-memory
+    database), so this can differ from sqlite_pragmas().
+
+    Args:
+        bind: Engine to inspect
+
+    Returns:
+        dict: Pragma name -> effective value (empty for non-SQLite engines)
+    """
+    if bind.dialect.name != "sqlite":
+        return {}
+
+    with bind.connect() as connection:
+        return {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in sqlite_pragmas()
+        }
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+
+if read_engine is not None:
+    event.listen(read_engine, "connect", apply_read_only_pragmas)
+
+if async_engine is not None and async_engine.dialect.name == "sqlite":
+    event.listen(async_engine.sync_engine, "connect", apply_read_only_pragmas)
+
+# Per-request statement counts and the slow-query log cover every engine
+for _bind in (engine, read_engine, async_engine.sync_engine if async_engine is not None else None):
+    if _bind is not None:
+        query_recorder.install(_bind)
+
+
+def get_write_db():
+    """
+    Dependency providing a read-write session (writes are serialized).
 
     Yields:
         Session: SQLAlchemy database session
@@ -30,3 +422,52 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency providing a session on the read-only connection pool.
+
+    Yields:
+        Session: SQLAlchemy database session that cannot write
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_db(request: Request):
+    """
+    Dependency function for FastAPI to inject database sessions.
+
+    Safe methods (GET, HEAD, OPTIONS) get a read-only session so reads scale
+    across the reader pool; everything else gets a read-write session whose
+    write transactions are serialized.
+
+    Args:
+        request: Incoming request (used for its HTTP method)
+
+    Yields:
+        Session: SQLAlchemy database session
+    """
+    factory = ReadSessionLocal if request.method in READ_ONLY_METHODS else SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    Dependency providing an AsyncSession on the async reader engine.
+
+    Used by the async route handlers enabled with ASYNC_DB_ENABLED.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session that cannot write
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
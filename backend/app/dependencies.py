@@ -1,13 +1,21 @@
 """FastAPI dependencies for authentication and database."""
 
-from typing import Optional
+import secrets
+from typing import Callable, Optional
 
 from fastapi import Depends, Header, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_async_db, get_db
 from app.models.user import User
+from app.services.auth_cache import auth_cache
+from app.services.request_timing import timed_phase
+from app.services.session_activity import session_activity
 from app.services.session_service import SessionService
+from app.services.signed_token_service import SignedTokenService
+from app.services.token_revocation import token_revocations
 from app.services.user_service import UserService
 
 
@@ -28,37 +36,153 @@ def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid or expired
     """
-    if not token:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid or expired session"
-        )
+    with timed_phase("auth"):
+        token = _extract_bearer_token(token)
+
+        if SignedTokenService.is_signed_token(token):
+            return _get_user_from_signed_token(db, token)
+
+        # Serve repeat requests from the in-process auth cache
+        cached = auth_cache.get_with_expiry(token)
+        if cached:
+            cached_user, expires_at = cached
+            session_activity.touch(token, expires_at)
+            return cached_user
+
+        # Validate session and load its user in one query
+        result = SessionService.validate_session_with_user(db, token)
+        if not result:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or expired session"
+            )
+
+        session, user = result
+
+        auth_cache.set(token, user, session.expires_at)
+        session_activity.touch(token, session.expires_at)
+
+        return user
+
+
+async def get_current_user_async(
+    token: Optional[str] = Header(None, alias="Authorization"),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Async counterpart of get_current_user for the async route handlers.
+
+    Cache hits never touch the database; misses await the async engine
+    instead of occupying a threadpool worker.
+
+    Args:
+        token: Authorization header containing "Bearer {token}"
+        db: Async database session
+
+    Returns:
+        Current User object
+
+    Raises:
+        HTTPException: 401 if token is invalid or expired
+    """
+    with timed_phase("auth"):
+        token = _extract_bearer_token(token)
+
+        if SignedTokenService.is_signed_token(token):
+            return await db.run_sync(_get_user_from_signed_token, token)
+
+        cached = auth_cache.get_with_expiry(token)
+        if cached:
+            cached_user, expires_at = cached
+            session_activity.touch(token, expires_at)
+            return cached_user
+
+        result = await SessionService.validate_session_with_user_async(db, token)
+        if not result:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or expired session"
+            )
+
+        session, user = result
+
+        auth_cache.set(token, user, session.expires_at)
+        session_activity.touch(token, session.expires_at)
+
+        return user
+
 
-    # Extract token from "Bearer {token}" format
-    if token.startswith("Bearer "):
-        token = token[7:]
-    else:
+def _extract_bearer_token(token: Optional[str]) -> str:
+    """
+    Extract the session token from a "Bearer {token}" Authorization header.
+
+    Raises:
+        HTTPException: 401 if the header is missing or not a bearer token
+    """
+    if not token or not token.startswith("Bearer "):
         raise HTTPException(
             status_code=401,
             detail="Invalid or expired session"
         )
 
-    # Validate session
-    session = SessionService.validate_session(db, token)
-    if not session:
+    return token[7:]
+
+
+def use_async_handler(async_handler: Callable) -> Callable:
+    """
+    Route decorator that swaps in an async handler when the async path is on.
+
+    Place it below the router decorator. With ASYNC_DB_ENABLED (and an async
+    engine available) the route is served by async_handler; otherwise the
+    decorated sync handler is registered unchanged.
+
+    Args:
+        async_handler: Async handler with the same parameters, using
+            get_current_user_async and get_async_db
+
+    Returns:
+        Decorator returning the handler to register
+    """
+    def decorator(handler: Callable) -> Callable:
+        if AsyncSessionLocal is None:
+            return handler
+        async_handler.__name__ = handler.__name__
+        async_handler.__doc__ = handler.__doc__
+        return async_handler
+
+    return decorator
+
+
+def _get_user_from_signed_token(db: DBSession, token: str) -> User:
+    """
+    Resolve the user for a signed session token.
+
+    Signature, expiry and revocation are checked in memory; the user row is
+    only loaded when it is not already in the auth cache.
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired or revoked
+    """
+    claims = SignedTokenService.verify_token(token)
+    if not claims or token_revocations.is_revoked(claims):
         raise HTTPException(
             status_code=401,
             detail="Invalid or expired session"
         )
 
-    # Get user
-    user = UserService.get_user_by_id(db, session.user_id)
+    cached_user = auth_cache.get(token)
+    if cached_user:
+        return cached_user
+
+    user = UserService.get_user_by_id(db, claims.user_id)
     if not user:
         raise HTTPException(
             status_code=401,
             detail="Invalid or expired session"
         )
 
+    auth_cache.set(token, user, claims.expires_at)
+
     return user
 
 
@@ -82,3 +206,23 @@ def get_current_user_optional(
         return get_current_user(token=token, db=db)
     except HTTPException:
         return None
+
+
+def require_admin_token(
+    admin_token: Optional[str] = Header(None, alias="X-Admin-Token")
+) -> None:
+    """
+    Guard admin endpoints with the shared ADMIN_TOKEN secret.
+
+    Args:
+        admin_token: X-Admin-Token header
+
+    Raises:
+        HTTPException: 404 if ADMIN_TOKEN is not configured (admin endpoints
+            are disabled), 403 if the header does not match
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    if not admin_token or not secrets.compare_digest(admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
@@ -1,16 +1,39 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-from app.database import Base, engine
-from app.models import Activity, Attachment, Contact, Session, User  # Import models to register them
-from app.routers import activities, attachments, auth, contacts, users
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.orm import Session as DBSession
+
+from app.config import settings
+from app.database import async_engine, engine, get_db, get_effective_pragmas, read_engine
+from app.middleware import QueryStatsMiddleware, ServerTimingMiddleware
+from app.migrations.runner import SCHEMA_VERSION, ensure_schema
+from app.models import Activity, Attachment, Contact, SchemaMigration, Session, TokenRevocation, User  # Import models to register them
+from app.routers import activities, admin, attachments, auth, contacts, users
+from app.routing import TimedRoute
+from app.services.auth_cache import auth_cache
+from app.services.group_commit import group_commit
+from app.services.metrics import metrics, run_metrics_writer
+from app.services.password_service import PasswordService
+from app.services.query_stats import configure_slow_query_log, query_recorder
+from app.services.session_activity import (
+    flush_session_activity,
+    run_session_activity_flusher,
+    session_activity,
+)
+from app.services.session_service import SessionService
+from app.services.session_sweeper import run_session_sweeper
+from app.services.token_revocation import (
+    reload_token_revocations,
+    run_revocation_refresher,
+    token_revocations,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -18,18 +41,72 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
+configure_slow_query_log(settings.SLOW_QUERY_LOG_FILE)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
-    # Startup: create database tables
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
+    # Startup: check the schema version (one query) and migrate if behind
+    applied = ensure_schema(engine, auto_migrate=settings.SCHEMA_AUTO_MIGRATE)
+    if applied:
+        logger.info("Recorded migrations: %s", ", ".join(applied))
+    logger.info("Database schema at version %d", SCHEMA_VERSION)
+
+    pragmas = get_effective_pragmas(engine)
+    if pragmas:
+        logger.info(
+            "SQLite pragmas: %s",
+            ", ".join(f"{name}={value}" for name, value in pragmas.items())
+        )
+    if read_engine is not None:
+        logger.info("Read-only connection pool: %d connections", settings.SQLITE_READ_POOL_SIZE)
+    if async_engine is not None:
+        logger.info("Async read handlers enabled (%s)", async_engine.url.drivername)
+
+    # Load signed-token revocations and keep them in sync with other workers
+    reload_token_revocations()
+    revocation_task = asyncio.create_task(
+        run_revocation_refresher(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+    )
+
+    # Start expired-session sweeper
+    sweeper_task = None
+    if settings.SESSION_SWEEP_INTERVAL_SECONDS > 0:
+        sweeper_task = asyncio.create_task(run_session_sweeper(
+            settings.SESSION_SWEEP_INTERVAL_SECONDS,
+            settings.SESSION_SWEEP_BATCH_SIZE
+        ))
+
+    # Start sliding-expiry renewal flusher
+    activity_task = None
+    if session_activity.enabled:
+        activity_task = asyncio.create_task(
+            run_session_activity_flusher(settings.SESSION_ACTIVITY_FLUSH_SECONDS)
+        )
+
+    # Publish this worker's metrics for /metrics served by other workers
+    metrics_task = None
+    if settings.METRICS_MULTIPROC_DIR:
+        metrics_task = asyncio.create_task(
+            run_metrics_writer(settings.METRICS_WRITE_INTERVAL_SECONDS)
+        )
     yield
     # Shutdown: cleanup if needed
     logger.info("Application shutting down")
+    for task in (sweeper_task, activity_task, revocation_task, metrics_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    if session_activity.enabled:
+        flush_session_activity()
+    group_commit.shutdown()
+    if settings.METRICS_MULTIPROC_DIR:
+        metrics.write_snapshot(settings.METRICS_MULTIPROC_DIR)
+    if async_engine is not None:
+        await async_engine.dispose()
+    PasswordService.shutdown_executor()
 
 
 # Create FastAPI application instance
@@ -39,16 +116,29 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan
 )
+# Time the routes declared here (/health, /metrics) like the routers' routes
+app.router.route_class = TimedRoute
+
+# Frontend origins (Vite default ports)
+ALLOWED_ORIGINS = ["http://localhost:5173", "http://localhost:3000"]
 
 # Configure CORS middleware for frontend communication
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],  # Vite default ports
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Server-Timing header and per-route latency histograms
+app.add_middleware(ServerTimingMiddleware, allow_origins=ALLOWED_ORIGINS)
+
+# Count SQL statements per request (N+1 warnings, slow-query log); added
+# last so it wraps ServerTimingMiddleware, which reports its DB time
+app.add_middleware(QueryStatsMiddleware)
+
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
@@ -85,6 +175,7 @@ app.include_router(users.router)
 app.include_router(contacts.router)
 app.include_router(activities.router)
 app.include_router(attachments.router)
+app.include_router(admin.router)
 
 
 @app.get("/health")
@@ -93,6 +184,47 @@ async def health_check():
     Health check endpoint.
 
     Returns:
-        dict: Health status
+        dict: Health status, auth cache counters, password pool metrics,
+            pending session renewals, revocation list size, group
+            commit counters and slow-query / N+1 warning counts
     """
-    return {"status": "ok", "message": "SimpleCRM API is running"}
+    return {
+        "status": "ok",
+        "message": "SimpleCRM API is running",
+        "auth_cache": auth_cache.stats(),
+        "password_pool": PasswordService.queue_stats(),
+        "session_renewals_pending": session_activity.pending_count(),
+        "token_revocations": token_revocations.stats(),
+        "group_commit": group_commit.stats(),
+        "query_stats": query_recorder.stats()
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics(db: DBSession = Depends(get_db)):
+    """
+    Prometheus scrape endpoint.
+
+    Exposes request counts and latency by route and status, database pool
+    usage, auth cache hit rate, bcrypt queue depth, attachment bytes in/out
+    and the sessions table size. With METRICS_MULTIPROC_DIR set, the
+    counters of every worker sharing the directory are summed.
+
+    Returns:
+        PlainTextResponse: Metrics in the Prometheus text format (404 when
+            METRICS_ENABLED is off)
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    total_sessions = SessionService.count_sessions(db)
+    expired_sessions = SessionService.count_expired_sessions(db)
+    session_rows = [
+        ("simplecrm_session_rows", (("state", "active"),), total_sessions - expired_sessions),
+        ("simplecrm_session_rows", (("state", "expired"),), expired_sessions),
+    ]
+
+    return PlainTextResponse(
+        metrics.collect(session_rows),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,97 @@
+"""ASGI middleware for request instrumentation."""
+
+from typing import Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.services.metrics import metrics
+from app.services.query_stats import query_recorder
+from app.services.request_timing import route_latency, timing_scope
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the SQL statements each HTTP request runs.
+
+    The request's RequestQueryStats is stored in scope["state"] (readable as
+    request.state.query_stats) and checked for N+1 patterns once the
+    response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not query_recorder.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with query_recorder.scope(f"{scope['method']} {scope['path']}") as stats:
+            scope.setdefault("state", {})["query_stats"] = stats
+            await self.app(scope, receive, send)
+
+
+class ServerTimingMiddleware:
+    """
+    Reports where each request's time went.
+
+    Phases: total (until the response starts), auth (get_current_user),
+    db (statement time from QueryStatsMiddleware, which must wrap this
+    middleware), handler (the endpoint function) and serialize (from the
+    endpoint's return to the response start). auth and handler include
+    their own database time. The phases are sent in a Server-Timing header
+    (unless SERVER_TIMING_HEADER is off) and recorded in the per-route
+    latency histograms; the request's status and total time also feed the
+    /metrics request counters.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = ()):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            allow_origins: Cross-origin frontends allowed to read the timings
+                (sent back in Timing-Allow-Origin)
+        """
+        self.app = app
+        self.allow_origins = frozenset(allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = None
+
+        with timing_scope() as timing:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    timing.finish()
+                    stats = scope.get("state", {}).get("query_stats")
+                    if stats is not None:
+                        timing.add("db", stats.db_seconds, f"{stats.statements} queries")
+                    if settings.SERVER_TIMING_HEADER:
+                        self._add_headers(scope, message, timing.header_value())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        if status_code is None:
+            return
+        if timing.route is not None:
+            route_latency.record(scope["method"], timing.route, timing)
+        metrics.observe_request(
+            scope["method"], timing.route or "unmatched", status_code, timing.phases["total"]
+        )
+
+    def _add_headers(self, scope: Scope, message: Message, value: str) -> None:
+        headers = MutableHeaders(scope=message)
+        headers.append("Server-Timing", value)
+        origin = Headers(scope=scope).get("origin")
+        if origin in self.allow_origins:
+            headers.append("Timing-Allow-Origin", origin)
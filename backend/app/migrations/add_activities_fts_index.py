@@ -0,0 +1,112 @@
+"""
+Migration: Add SQLite FTS5 full-text index for activity search.
+
+This migration creates the activities_fts virtual table (external content on
+activities, with prefix indexes) plus the triggers that keep it in sync, and
+populates it from existing rows. Activity search then uses BM25-ranked FTS5
+MATCH instead of leading-wildcard LIKE scans over subjects and notes.
+
+Note: make_activity_subject_nullable.py recreates the activities table,
+which drops these triggers; run this migration after it.
+
+Date: 2025-11-19
+"""
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import settings
+from app.models.activity import ACTIVITIES_FTS_DDL
+
+REBUILD_SQL = "INSERT INTO activities_fts(activities_fts) VALUES ('rebuild')"
+
+
+def upgrade():
+    """
+    Create activities_fts virtual table and sync triggers, then populate it.
+
+    - Creates virtual table: activities_fts (fts5, prefix='2 3')
+    - Creates triggers: activities_fts_ai, activities_fts_ad, activities_fts_au
+    - Rebuilds the index from the activities table
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Skipping migration (LIKE search fallback is used).")
+        return
+
+    inspector = inspect(engine)
+    if 'activities_fts' in inspector.get_table_names():
+        print("Table 'activities_fts' already exists. Skipping migration.")
+        return
+
+    with engine.connect() as conn:
+        for statement in ACTIVITIES_FTS_DDL:
+            conn.execute(text(statement))
+
+        # Index existing activities
+        conn.execute(text(REBUILD_SQL))
+
+        conn.commit()
+
+    print("Successfully created activities_fts full-text index.")
+
+
+def rebuild():
+    """
+    Rebuild activities_fts from the activities table.
+
+    Use after bulk imports that bypassed the triggers or if the index is
+    suspected to be out of sync.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Nothing to rebuild.")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text(REBUILD_SQL))
+        conn.commit()
+
+    print("Successfully rebuilt activities_fts full-text index.")
+
+
+def downgrade():
+    """
+    Drop activities_fts virtual table and its triggers.
+
+    Rollback strategy for reverting this migration.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Skipping rollback.")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("DROP TRIGGER IF EXISTS activities_fts_ai"))
+        conn.execute(text("DROP TRIGGER IF EXISTS activities_fts_ad"))
+        conn.execute(text("DROP TRIGGER IF EXISTS activities_fts_au"))
+        conn.execute(text("DROP TABLE IF EXISTS activities_fts"))
+
+        conn.commit()
+
+    print("Successfully removed activities_fts full-text index.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python add_activities_fts_index.py [upgrade|rebuild|downgrade]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "upgrade":
+        upgrade()
+    elif command == "rebuild":
+        rebuild()
+    elif command == "downgrade":
+        downgrade()
+    else:
+        print(f"Unknown command: {command}")
+        print("Usage: python add_activities_fts_index.py [upgrade|rebuild|downgrade]")
+        sys.exit(1)
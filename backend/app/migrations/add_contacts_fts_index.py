@@ -0,0 +1,109 @@
+"""
+Migration: Add SQLite FTS5 full-text index for contact search.
+
+This migration creates the contacts_fts virtual table (external content on
+contacts, with prefix indexes) plus the triggers that keep it in sync, and
+populates it from existing rows. Contact search then uses FTS5 MATCH
+instead of leading-wildcard LIKE scans over name, email and company.
+
+Date: 2025-11-19
+"""
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import settings
+from app.models.contact import CONTACTS_FTS_DDL
+
+REBUILD_SQL = "INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')"
+
+
+def upgrade():
+    """
+    Create contacts_fts virtual table and sync triggers, then populate it.
+
+    - Creates virtual table: contacts_fts (fts5, prefix='2 3')
+    - Creates triggers: contacts_fts_ai, contacts_fts_ad, contacts_fts_au
+    - Rebuilds the index from the contacts table
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Skipping migration (LIKE search fallback is used).")
+        return
+
+    inspector = inspect(engine)
+    if 'contacts_fts' in inspector.get_table_names():
+        print("Table 'contacts_fts' already exists. Skipping migration.")
+        return
+
+    with engine.connect() as conn:
+        for statement in CONTACTS_FTS_DDL:
+            conn.execute(text(statement))
+
+        # Index existing contacts
+        conn.execute(text(REBUILD_SQL))
+
+        conn.commit()
+
+    print("Successfully created contacts_fts full-text index.")
+
+
+def rebuild():
+    """
+    Rebuild contacts_fts from the contacts table.
+
+    Use after bulk imports that bypassed the triggers or if the index is
+    suspected to be out of sync.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Nothing to rebuild.")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text(REBUILD_SQL))
+        conn.commit()
+
+    print("Successfully rebuilt contacts_fts full-text index.")
+
+
+def downgrade():
+    """
+    Drop contacts_fts virtual table and its triggers.
+
+    Rollback strategy for reverting this migration.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    if engine.dialect.name != "sqlite":
+        print("FTS5 index is SQLite-only. Skipping rollback.")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("DROP TRIGGER IF EXISTS contacts_fts_ai"))
+        conn.execute(text("DROP TRIGGER IF EXISTS contacts_fts_ad"))
+        conn.execute(text("DROP TRIGGER IF EXISTS contacts_fts_au"))
+        conn.execute(text("DROP TABLE IF EXISTS contacts_fts"))
+
+        conn.commit()
+
+    print("Successfully removed contacts_fts full-text index.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python add_contacts_fts_index.py [upgrade|rebuild|downgrade]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "upgrade":
+        upgrade()
+    elif command == "rebuild":
+        rebuild()
+    elif command == "downgrade":
+        downgrade()
+    else:
+        print(f"Unknown command: {command}")
+        print("Usage: python add_contacts_fts_index.py [upgrade|rebuild|downgrade]")
+        sys.exit(1)
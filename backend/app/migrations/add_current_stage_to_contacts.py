@@ -0,0 +1,149 @@
+"""
+Migration: Add materialized current_pipeline_stage column to contacts table.
+
+This migration adds a current_pipeline_stage column to the contacts table that
+stores the pipeline stage of each contact's most recent activity. Persisting
+the value lets stage filtering, counting and pagination run inside the
+database instead of loading every contact and its activities into Python.
+
+The column is kept up to date by the Activity mapper events; the backfill
+command recomputes it for existing data in resumable batches of contacts.
+
+Date: 2025-11-19
+"""
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import settings
+from app.migrations.batched import BatchedMigration, backfill_in_batches, begin_immediate
+
+BACKFILL_NAME = "add_current_stage_to_contacts.backfill"
+
+BACKFILL_ASSIGNMENT = """
+    current_pipeline_stage = COALESCE(
+        (
+            SELECT activities.pipeline_stage
+            FROM activities
+            WHERE activities.contact_id = contacts.id
+            ORDER BY activities.activity_date DESC, activities.id DESC
+            LIMIT 1
+        ),
+        'Lead'
+    )
+"""
+
+
+def upgrade():
+    """
+    Add current_pipeline_stage column to contacts table and backfill it.
+
+    - Adds column: current_pipeline_stage (VARCHAR(50), NOT NULL, DEFAULT 'Lead')
+    - Creates composite index on (user_id, current_pipeline_stage, created_at)
+    - Backfills the column from each contact's most recent activity, in
+      resumable batches (see app/migrations/batched.py)
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    inspector = inspect(engine)
+
+    # Check if column already exists (resume the backfill if it was interrupted)
+    columns = [col['name'] for col in inspector.get_columns('contacts')]
+    if 'current_pipeline_stage' in columns:
+        checkpoint = BatchedMigration(engine, BACKFILL_NAME, "contacts").checkpoint()
+        if checkpoint and checkpoint["completed_at"] is None:
+            backfill_in_batches(engine, BACKFILL_NAME, "contacts", BACKFILL_ASSIGNMENT)
+            print("Successfully resumed current_pipeline_stage backfill.")
+            return
+        print("Column 'current_pipeline_stage' already exists in contacts table. Skipping migration.")
+        return
+
+    migration = BatchedMigration(engine, BACKFILL_NAME, "contacts")
+    migration.reset_if_complete()
+
+    # The backfill checkpoint is created with the column, so a crash before
+    # the backfill finishes is resumed above instead of skipped
+    with engine.begin() as conn:
+        begin_immediate(conn)
+
+        # Add current_pipeline_stage column with default value
+        conn.execute(text(
+            "ALTER TABLE contacts ADD COLUMN current_pipeline_stage VARCHAR(50) NOT NULL DEFAULT 'Lead'"
+        ))
+
+        # Create composite index for user-scoped stage filtering and ordering
+        conn.execute(text(
+            "CREATE INDEX ix_contacts_user_stage_created "
+            "ON contacts (user_id, current_pipeline_stage, created_at)"
+        ))
+
+        migration.start(conn)
+
+    # Populate from existing activities without holding the write lock throughout
+    backfill_in_batches(engine, BACKFILL_NAME, "contacts", BACKFILL_ASSIGNMENT)
+
+    print("Successfully added current_pipeline_stage column to contacts table.")
+
+
+def backfill():
+    """
+    Recompute current_pipeline_stage for every contact.
+
+    Safe to run repeatedly; use after bulk imports or manual data fixes that
+    bypassed the ORM. An interrupted run resumes where it stopped.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+    rows = backfill_in_batches(engine, BACKFILL_NAME, "contacts", BACKFILL_ASSIGNMENT, rerun=True)
+
+    print(f"Successfully backfilled current_pipeline_stage for {rows} contacts.")
+
+
+def downgrade():
+    """
+    Remove current_pipeline_stage column from contacts table.
+
+    Rollback strategy for reverting this migration.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+    inspector = inspect(engine)
+
+    # Check if column exists
+    columns = [col['name'] for col in inspector.get_columns('contacts')]
+    if 'current_pipeline_stage' not in columns:
+        print("Column 'current_pipeline_stage' does not exist in contacts table. Skipping rollback.")
+        return
+
+    with engine.connect() as conn:
+        # Drop index first
+        conn.execute(text(
+            "DROP INDEX IF EXISTS ix_contacts_user_stage_created"
+        ))
+
+        # SQLite supports DROP COLUMN since 3.35
+        conn.execute(text(
+            "ALTER TABLE contacts DROP COLUMN current_pipeline_stage"
+        ))
+
+        conn.commit()
+
+    print("Successfully removed current_pipeline_stage column from contacts table.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python add_current_stage_to_contacts.py [upgrade|backfill|downgrade]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "upgrade":
+        upgrade()
+    elif command == "backfill":
+        backfill()
+    elif command == "downgrade":
+        downgrade()
+    else:
+        print(f"Unknown command: {command}")
+        print("Usage: python add_current_stage_to_contacts.py [upgrade|backfill|downgrade]")
+        sys.exit(1)
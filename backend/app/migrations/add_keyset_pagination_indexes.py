@@ -0,0 +1,75 @@
+"""
+Migration: Add composite indexes backing keyset (cursor) pagination.
+
+Cursor pagination seeks on (created_at, id) for contacts and on
+(activity_date, id) for activities. These composite indexes let SQLite
+jump straight to the cursor position instead of scanning earlier pages.
+The user-wide activity listing has no contact_id to lead with; it seeks
+the existing ix_activities_activity_date index, which SQLite orders by
+(activity_date, rowid).
+
+Date: 2025-11-19
+"""
+
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+
+INDEXES = {
+    "ix_contacts_user_created_id": "contacts (user_id, created_at, id)",
+    "ix_activities_contact_date_id": "activities (contact_id, activity_date, id)",
+}
+
+
+def upgrade():
+    """
+    Create keyset pagination indexes.
+
+    - ix_contacts_user_created_id on contacts (user_id, created_at, id)
+    - ix_activities_contact_date_id on activities (contact_id, activity_date, id)
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+    with engine.connect() as conn:
+        for name, target in INDEXES.items():
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+
+        conn.commit()
+
+    print("Successfully created keyset pagination indexes.")
+
+
+def downgrade():
+    """
+    Drop keyset pagination indexes.
+
+    Rollback strategy for reverting this migration.
+    """
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+    with engine.connect() as conn:
+        for name in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        conn.commit()
+
+    print("Successfully dropped keyset pagination indexes.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python add_keyset_pagination_indexes.py [upgrade|downgrade]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "upgrade":
+        upgrade()
+    elif command == "downgrade":
+        downgrade()
+    else:
+        print(f"Unknown command: {command}")
+        print("Usage: python add_keyset_pagination_indexes.py [upgrade|downgrade]")
+        sys.exit(1)
@@ -0,0 +1,332 @@
+"""
+Batched, resumable backfills and table rebuilds for migrations.
+
+A whole-table UPDATE or table copy in one transaction holds SQLite's write
+lock until it finishes, stalling every request that writes. These helpers
+walk the table in primary-key order, one short transaction per batch, and
+record progress in migration_checkpoints in the same transaction. They
+pause between batches so application writes can interleave. A run that is
+interrupted resumes after the last committed batch.
+
+pysqlite only sends BEGIN before DML, so schema changes (CREATE, DROP,
+ALTER) would otherwise commit one statement at a time even inside
+Connection.begin(). Steps that must be atomic start the transaction
+explicitly with begin_immediate().
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.config import settings
+from app.models.migration_checkpoint import MigrationCheckpoint
+
+# apply_batch(conn, after_key, up_to_key) -> rows affected
+BatchFunction = Callable[[Connection, int, int], int]
+
+
+def begin_immediate(conn: Connection) -> None:
+    """
+    Open the SQLite transaction of the caller's Connection.begin() block now.
+
+    Takes the write lock up front, and keeps DDL that follows inside the
+    transaction so it commits or rolls back with the rest of the block.
+
+    Args:
+        conn: Connection inside a begin() block, before any statement ran
+    """
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+class BatchedMigration:
+    """Runs keyset-ordered batches over a table with a persisted checkpoint."""
+
+    def __init__(
+        self,
+        bind: Engine,
+        name: str,
+        table: str,
+        batch_size: Optional[int] = None,
+        pause_seconds: Optional[float] = None,
+        progress: Callable[[str], None] = print
+    ):
+        """
+        Initialize the migration.
+
+        Args:
+            bind: Engine for the database being migrated
+            name: Unique checkpoint name (e.g. "add_current_stage_to_contacts.backfill")
+            table: Table to walk; must have an integer id primary key
+            batch_size: Rows per transaction (default settings.BACKFILL_BATCH_SIZE)
+            pause_seconds: Sleep between batches (default settings.BACKFILL_PAUSE_MS)
+            progress: Callback receiving progress lines
+        """
+        self.bind = bind
+        self.name = name
+        self.table = table
+        self.batch_size = batch_size or settings.BACKFILL_BATCH_SIZE
+        self.pause_seconds = (
+            settings.BACKFILL_PAUSE_MS / 1000 if pause_seconds is None else pause_seconds
+        )
+        self.progress = progress
+        MigrationCheckpoint.__table__.create(bind, checkfirst=True)
+
+    def checkpoint(self) -> Optional[dict]:
+        """
+        Read the stored checkpoint.
+
+        Returns:
+            Dictionary with last_key, rows_done and completed_at, or None if
+            the migration has not started
+        """
+        with self.bind.connect() as conn:
+            row = conn.execute(
+                text(
+                    "SELECT last_key, rows_done, completed_at FROM migration_checkpoints "
+                    "WHERE name = :name"
+                ),
+                {"name": self.name}
+            ).mappings().first()
+        return dict(row) if row else None
+
+    def reset_if_complete(self) -> None:
+        """Delete a completed checkpoint so the next run starts from the beginning."""
+        with self.bind.begin() as conn:
+            conn.execute(
+                text(
+                    "DELETE FROM migration_checkpoints "
+                    "WHERE name = :name AND completed_at IS NOT NULL"
+                ),
+                {"name": self.name}
+            )
+
+    def start(self, conn: Connection) -> None:
+        """Create the checkpoint row inside the caller's transaction."""
+        conn.execute(
+            text(
+                "INSERT INTO migration_checkpoints (name, last_key, rows_done, updated_at) "
+                "VALUES (:name, 0, 0, :now)"
+            ),
+            {"name": self.name, "now": datetime.utcnow()}
+        )
+
+    def complete(self, conn: Connection) -> None:
+        """Mark the migration finished inside the caller's transaction."""
+        conn.execute(
+            text("UPDATE migration_checkpoints SET completed_at = :now WHERE name = :name"),
+            {"name": self.name, "now": datetime.utcnow()}
+        )
+
+    def run(self, apply_batch: BatchFunction) -> int:
+        """
+        Apply apply_batch to every key range after the checkpoint.
+
+        Args:
+            apply_batch: Function processing rows with after_key < id <= up_to_key
+
+        Returns:
+            Total rows processed by this and earlier (interrupted) runs
+        """
+        checkpoint = self.checkpoint()
+        if checkpoint is None:
+            with self.bind.begin() as conn:
+                self.start(conn)
+            checkpoint = self.checkpoint()
+        if checkpoint["completed_at"] is not None:
+            return checkpoint["rows_done"]
+
+        last_key, rows_done = checkpoint["last_key"], checkpoint["rows_done"]
+        with self.bind.connect() as conn:
+            remaining = conn.execute(
+                text(f"SELECT COUNT(*) FROM {self.table} WHERE id > :last_key"),
+                {"last_key": last_key}
+            ).scalar()
+        total = rows_done + remaining
+        if last_key:
+            self.progress(f"{self.name}: resuming after id {last_key} ({rows_done}/{total} rows)")
+
+        last_report = time.monotonic()
+        while True:
+            with self.bind.begin() as conn:
+                up_to_key = conn.execute(
+                    text(
+                        f"SELECT MAX(id) FROM (SELECT id FROM {self.table} "
+                        f"WHERE id > :last_key ORDER BY id LIMIT :limit)"
+                    ),
+                    {"last_key": last_key, "limit": self.batch_size}
+                ).scalar()
+                if up_to_key is None:
+                    break
+
+                rows_done += apply_batch(conn, last_key, up_to_key)
+                conn.execute(
+                    text(
+                        "UPDATE migration_checkpoints SET last_key = :last_key, "
+                        "rows_done = :rows_done, updated_at = :now WHERE name = :name"
+                    ),
+                    {"last_key": up_to_key, "rows_done": rows_done, "now": datetime.utcnow(), "name": self.name}
+                )
+            last_key = up_to_key
+
+            if time.monotonic() - last_report >= 1:
+                self.progress(f"{self.name}: {rows_done}/{total} rows")
+                last_report = time.monotonic()
+            if self.pause_seconds:
+                time.sleep(self.pause_seconds)
+
+        self.progress(f"{self.name}: {rows_done}/{total} rows")
+        return rows_done
+
+
+def backfill_in_batches(
+    bind: Engine,
+    name: str,
+    table: str,
+    assignments: str,
+    rerun: bool = False,
+    **options
+) -> int:
+    """
+    Run UPDATE table SET assignments over the whole table in batches.
+
+    Args:
+        bind: Engine for the database being migrated
+        name: Unique checkpoint name
+        table: Table to update (integer id primary key)
+        assignments: SET clause, e.g. "current_pipeline_stage = ..."
+        rerun: Start over if a previous run completed (an interrupted run
+            still resumes)
+        **options: batch_size, pause_seconds, progress (see BatchedMigration)
+
+    Returns:
+        Number of rows updated
+    """
+    migration = BatchedMigration(bind, name, table, **options)
+    if rerun:
+        migration.reset_if_complete()
+
+    update = text(
+        f"UPDATE {table} SET {assignments} "
+        f"WHERE {table}.id > :after_key AND {table}.id <= :up_to_key"
+    )
+
+    def apply_batch(conn: Connection, after_key: int, up_to_key: int) -> int:
+        return conn.execute(update, {"after_key": after_key, "up_to_key": up_to_key}).rowcount
+
+    rows = migration.run(apply_batch)
+    with bind.begin() as conn:
+        migration.complete(conn)
+    return rows
+
+
+def rebuild_table_in_batches(
+    bind: Engine,
+    name: str,
+    table: str,
+    create_sql: str,
+    columns: Sequence[str],
+    select_exprs: Optional[Sequence[str]] = None,
+    after_swap: Iterable[str] = (),
+    **options
+) -> int:
+    """
+    Rebuild a SQLite table with a new definition without a long write lock.
+
+    Rows are copied into {table}_new in batches. Triggers on the old table
+    mirror concurrent inserts, updates and deletes into the copy. A final
+    short transaction drops the old table, renames the copy, recreates the
+    old table's indexes and triggers, and runs after_swap.
+
+    Args:
+        bind: Engine for the database being migrated (SQLite)
+        name: Unique checkpoint name
+        table: Table to rebuild (integer id primary key)
+        create_sql: CREATE TABLE statement for {table}_new
+        columns: Columns of the new table to fill
+        select_exprs: Expressions over the old table for each column (default: same names)
+        after_swap: Extra statements run after the rename, in the same transaction
+        **options: batch_size, pause_seconds, progress (see BatchedMigration)
+
+    Returns:
+        Number of rows copied
+    """
+    migration = BatchedMigration(bind, name, table, **options)
+    new_table = f"{table}_new"
+    column_list = ", ".join(columns)
+    select_list = ", ".join(select_exprs or columns)
+    copy_rows = (
+        f"INSERT OR REPLACE INTO {new_table} ({column_list}) "
+        f"SELECT {select_list} FROM {table}"
+    )
+    mirror_triggers = {
+        f"{new_table}_mirror_ai": (
+            f"CREATE TRIGGER {new_table}_mirror_ai AFTER INSERT ON {table} BEGIN "
+            f"{copy_rows} WHERE id = NEW.id; END"
+        ),
+        f"{new_table}_mirror_au": (
+            f"CREATE TRIGGER {new_table}_mirror_au AFTER UPDATE ON {table} BEGIN "
+            f"{copy_rows} WHERE id = NEW.id; END"
+        ),
+        f"{new_table}_mirror_ad": (
+            f"CREATE TRIGGER {new_table}_mirror_ad AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM {new_table} WHERE id = OLD.id; END"
+        ),
+    }
+
+    checkpoint = migration.checkpoint()
+    if checkpoint is not None and checkpoint["completed_at"] is not None:
+        return checkpoint["rows_done"]
+
+    # Copy table, mirror triggers and checkpoint are created together, so a
+    # crash leaves either all of them or none
+    if checkpoint is None:
+        with bind.begin() as conn:
+            begin_immediate(conn)
+            conn.execute(text(f"DROP TABLE IF EXISTS {new_table}"))
+            conn.execute(text(create_sql))
+            for statement in mirror_triggers.values():
+                conn.execute(text(statement))
+            migration.start(conn)
+
+    copy_batch = text(f"{copy_rows} WHERE id > :after_key AND id <= :up_to_key")
+
+    def apply_batch(conn: Connection, after_key: int, up_to_key: int) -> int:
+        return conn.execute(copy_batch, {"after_key": after_key, "up_to_key": up_to_key}).rowcount
+
+    rows = migration.run(apply_batch)
+
+    # Dropping the old table must not cascade deletes into child tables
+    # (the pragma is ignored inside a transaction). The swap is one
+    # transaction: readers never see the table missing, and a failure
+    # leaves the old table and the copy as they were.
+    with bind.connect() as conn:
+        foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.commit()
+        try:
+            with conn.begin():
+                begin_immediate(conn)
+                for trigger in mirror_triggers:
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+                preserved = conn.execute(
+                    text(
+                        "SELECT sql FROM sqlite_master WHERE tbl_name = :table "
+                        "AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+                    ),
+                    {"table": table}
+                ).scalars().all()
+                conn.execute(text(f"DROP TABLE {table}"))
+                conn.execute(text(f"ALTER TABLE {new_table} RENAME TO {table}"))
+                for statement in [*preserved, *after_swap]:
+                    conn.execute(text(statement))
+                migration.complete(conn)
+        finally:
+            conn.exec_driver_sql(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}")
+            conn.commit()
+
+    migration.progress(f"{name}: swapped {new_table} into {table}")
+    return rows
@@ -11,6 +11,12 @@ Date: 2025-11-18
 from sqlalchemy import create_engine, inspect, text
 
 from app.config import settings
+from app.migrations.batched import rebuild_table_in_batches
+
+COLUMNS = [
+    "id", "contact_id", "type", "subject", "notes", "activity_date",
+    "pipeline_stage", "created_at", "updated_at",
+]
 
 
 def upgrade():
@@ -19,6 +25,7 @@ def upgrade():
 
     - Changes column: subject (VARCHAR(255), NULL, DEFAULT '')
     - Allows empty activities to be created
+    - Copies rows in resumable batches (see app/migrations/batched.py)
     """
     engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
     inspector = inspect(engine)
@@ -28,10 +35,21 @@ def upgrade():
         print("Table 'activities' does not exist. Skipping migration.")
         return
 
-    with engine.connect() as conn:
-        # SQLite doesn't support ALTER COLUMN directly, need to recreate table
-        # Create new table with nullable subject
-        conn.execute(text("""
+    # Already applied (or built from the current models); an interrupted
+    # rebuild still has the NOT NULL column and resumes below
+    subject = next(col for col in inspector.get_columns('activities') if col['name'] == 'subject')
+    if subject['nullable']:
+        print("Column 'subject' is already nullable in activities table. Skipping migration.")
+        return
+
+    # SQLite doesn't support ALTER COLUMN directly, need to recreate table.
+    # Copy in batches so writers are only blocked for one batch at a time;
+    # existing indexes and triggers are recreated on the new table.
+    rebuild_table_in_batches(
+        engine,
+        "make_activity_subject_nullable",
+        "activities",
+        create_sql="""
             CREATE TABLE activities_new (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 contact_id INTEGER NOT NULL,
@@ -44,34 +62,12 @@ def upgrade():
                 updated_at DATETIME NOT NULL,
                 FOREIGN KEY(contact_id) REFERENCES contacts (id) ON DELETE CASCADE
             )
-        """))
-
-        # Copy data from old table to new table
-        conn.execute(text("""
-            INSERT INTO activities_new (
-                id, contact_id, type, subject, notes, activity_date,
-                pipeline_stage, created_at, updated_at
-            )
-            SELECT
-                id, contact_id, type,
-                COALESCE(subject, '') as subject,
-                notes, activity_date, pipeline_stage, created_at, updated_at
-            FROM activities
-        """))
-
-        # Drop old table
-        conn.execute(text("DROP TABLE activities"))
-
-        # Rename new table to original name
-        conn.execute(text("ALTER TABLE activities_new RENAME TO activities"))
-
-        # Recreate indexes
-        conn.execute(text("CREATE INDEX ix_activities_contact_id ON activities (contact_id)"))
-        conn.execute(text("CREATE INDEX ix_activities_type ON activities (type)"))
-        conn.execute(text("CREATE INDEX ix_activities_activity_date ON activities (activity_date)"))
-        conn.execute(text("CREATE INDEX ix_activities_pipeline_stage ON activities (pipeline_stage)"))
-
-        conn.commit()
+        """,
+        columns=COLUMNS,
+        select_exprs=[
+            "COALESCE(subject, '')" if column == "subject" else column for column in COLUMNS
+        ]
+    )
 
     print("Successfully made subject column nullable in activities table.")
 
@@ -0,0 +1,232 @@
+"""
+Migration runner that tracks applied migrations in the schema_migrations table.
+
+MIGRATIONS lists the migration modules of this package in the order they
+must run; each exposes an idempotent upgrade(). The database's schema
+version is the highest version recorded in schema_migrations, so startup
+can tell whether anything needs doing with one query instead of reflecting
+every table through create_all.
+
+- Fresh database: create_all builds the current schema (which already
+  includes every migration) and all versions are recorded.
+- Database created before version tracking: create_all adds missing tables,
+  then every migration runs (each skips work that is already done).
+- Tracked database: only migrations above the recorded version run.
+
+Every worker checks the version at startup, so migrate() holds an exclusive
+migration lock and re-reads the version under it: the first worker migrates
+and the others wait, then find the schema current.
+
+Migrations connect via settings.DATABASE_URL, so bind must point at the same
+database.
+"""
+
+import importlib
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import inspect, insert, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+
+from app.config import settings
+from app.models import Base, SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+# (version, module name) in application order; append new migrations here
+MIGRATIONS = (
+    (1, "add_pipeline_stage_to_activities"),
+    (2, "make_activity_subject_nullable"),
+    (3, "add_current_stage_to_contacts"),
+    (4, "add_keyset_pagination_indexes"),
+    (5, "add_contacts_fts_index"),
+    (6, "add_activities_fts_index"),
+)
+
+# Schema version the code expects
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Name (and PostgreSQL advisory lock key) of the cross-process migration lock
+LOCK_NAME = "simplecrm_migrations"
+LOCK_KEY = 0x5C4D
+
+
+@contextmanager
+def migration_lock(bind: Engine) -> Iterator[None]:
+    """
+    Hold the database's migration lock, waiting for other processes.
+
+    SQLite files are locked through an exclusive transaction on a
+    <database>.migrate-lock file next to them (migrations themselves need
+    the database's own write lock); PostgreSQL and MySQL use an advisory
+    lock. In-memory SQLite databases belong to one process and need none.
+
+    Args:
+        bind: Engine for the database being migrated
+
+    Raises:
+        RuntimeError: If the lock is not acquired within
+            SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS
+    """
+    timeout = settings.SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS
+    timed_out = RuntimeError(
+        f"Timed out after {timeout:g}s waiting for another process to finish migrating"
+    )
+    dialect = bind.dialect.name
+    database = bind.url.database
+
+    if dialect == "sqlite":
+        if not database or database == ":memory:" or database.startswith("file:"):
+            yield
+            return
+        lock = sqlite3.connect(f"{database}.migrate-lock", timeout=timeout, isolation_level=None)
+        try:
+            try:
+                lock.execute("BEGIN EXCLUSIVE")
+            except sqlite3.OperationalError as exc:
+                raise timed_out from exc
+            yield
+        finally:
+            # Closing rolls the lock transaction back and releases it
+            lock.close()
+    elif dialect == "postgresql":
+        with bind.connect() as conn:
+            conn.exec_driver_sql(f"SET LOCAL lock_timeout = {int(timeout * 1000)}")
+            try:
+                conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": LOCK_KEY})
+            except OperationalError as exc:
+                raise timed_out from exc
+            conn.commit()
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": LOCK_KEY})
+                conn.commit()
+    elif dialect == "mysql":
+        with bind.connect() as conn:
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"), {"name": LOCK_NAME, "timeout": timeout}
+            ).scalar()
+            if acquired != 1:
+                raise timed_out
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+    else:
+        logger.warning("No migration lock for dialect %s; run migrations from one process", dialect)
+        yield
+
+
+def get_schema_version(bind: Engine) -> Optional[int]:
+    """
+    Read the database's schema version with a single query.
+
+    Args:
+        bind: Engine to inspect
+
+    Returns:
+        Highest applied migration version (0 if none), or None if the
+        schema_migrations table does not exist yet
+    """
+    try:
+        with bind.connect() as conn:
+            return conn.execute(text("SELECT MAX(version) FROM schema_migrations")).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return None
+
+
+def pending_migrations(version: Optional[int]) -> list[tuple[int, str]]:
+    """
+    List migrations above a schema version.
+
+    Args:
+        version: Current schema version (None or 0 for untracked databases)
+
+    Returns:
+        List of (version, module name) still to apply, in order
+    """
+    return [(v, name) for v, name in MIGRATIONS if v > (version or 0)]
+
+
+def migrate(bind: Engine) -> list[str]:
+    """
+    Bring the database schema up to SCHEMA_VERSION.
+
+    Runs under migration_lock(), and reads the schema version only once the
+    lock is held, so concurrent callers migrate one after the other and the
+    later ones find nothing left to do.
+
+    Args:
+        bind: Engine for settings.DATABASE_URL
+
+    Returns:
+        Names of the migrations recorded by this call (on a fresh database
+        these are recorded without running, since create_all already built
+        the current schema)
+    """
+    with migration_lock(bind):
+        version = get_schema_version(bind)
+
+        if version is None:
+            fresh = "users" not in inspect(bind).get_table_names()
+            Base.metadata.create_all(bind=bind)
+            if fresh:
+                _record(bind, MIGRATIONS)
+                return [name for _, name in MIGRATIONS]
+
+        applied = []
+        for migration_version, name in pending_migrations(version):
+            logger.info("Applying migration %d: %s", migration_version, name)
+            importlib.import_module(f"app.migrations.{name}").upgrade()
+            _record(bind, [(migration_version, name)])
+            applied.append(name)
+
+        return applied
+
+
+def ensure_schema(bind: Engine, auto_migrate: bool = True) -> list[str]:
+    """
+    Check the schema version at startup and migrate if it is behind.
+
+    When the database is current this costs one query and create_all is
+    skipped entirely.
+
+    Args:
+        bind: Engine for settings.DATABASE_URL
+        auto_migrate: Apply pending migrations instead of refusing to start
+
+    Returns:
+        Names of the migrations recorded (empty if the schema was current)
+
+    Raises:
+        RuntimeError: If the schema is behind and auto_migrate is False
+    """
+    version = get_schema_version(bind)
+    if version is not None and version >= SCHEMA_VERSION:
+        return []
+
+    if not auto_migrate:
+        raise RuntimeError(
+            f"Database schema is at version {version or 0}, expected {SCHEMA_VERSION}. "
+            "Run backend/scripts/migrate.py before starting the application."
+        )
+
+    return migrate(bind)
+
+
+def _record(bind: Engine, migrations) -> None:
+    """Record migrations as applied (another process may have done so already)."""
+    rows = [
+        {"version": version, "name": name, "applied_at": datetime.utcnow()}
+        for version, name in migrations
+    ]
+    try:
+        with bind.begin() as conn:
+            conn.execute(insert(SchemaMigration.__table__), rows)
+    except IntegrityError:
+        logger.info("Migrations already recorded by another process")
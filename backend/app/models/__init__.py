@@ -4,7 +4,11 @@ from app.database import Base
 from app.models.activity import Activity
 from app.models.attachment import Attachment
 from app.models.contact import Contact
+from app.models.migration_checkpoint import MigrationCheckpoint
+from app.models.schema_migration import SchemaMigration
 from app.models.session import Session
+from app.models.token_revocation import TokenRevocation
 from app.models.user import User
 
-__all__ = ["Base", "User", "Session", "Contact", "Activity", "Attachment"]
+__all__ = ["Base", "User", "Session", "Contact", "Activity", "Attachment", "TokenRevocation",
+           "SchemaMigration", "MigrationCheckpoint"]
@@ -2,16 +2,38 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    inspect,
+    select,
+    update,
+)
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.contact import Contact
 
 
 class Activity(Base):
     """Activity model representing interactions with contacts."""
 
     __tablename__ = "activities"
+    __table_args__ = (
+        # Keyset pagination: WHERE contact_id = ? ORDER BY activity_date DESC, id DESC.
+        # The user-wide listing (joined through contacts) seeks the single-column
+        # activity_date index instead, whose entries SQLite orders by (activity_date, id)
+        Index("ix_activities_contact_date_id", "contact_id", "activity_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     contact_id = Column(
@@ -49,3 +71,103 @@ class Activity(Base):
         back_populates="activity",
         cascade="all, delete-orphan"
     )
+
+
+def sync_contact_current_stage(connection, contact_id: int) -> None:
+    """
+    Recompute a contact's denormalized current_pipeline_stage.
+
+    The stage is taken from the contact's most recent activity (by
+    activity_date, then id), falling back to "Lead" when none exist.
+
+    Args:
+        connection: Connection participating in the current transaction
+        contact_id: ID of the contact to refresh
+    """
+    contacts = Contact.__table__
+    latest_stage = (
+        select(Activity.pipeline_stage)
+        .where(Activity.contact_id == contact_id)
+        .order_by(Activity.activity_date.desc(), Activity.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    connection.execute(
+        update(contacts)
+        .where(contacts.c.id == contact_id)
+        .values(
+            current_pipeline_stage=func.coalesce(latest_stage, "Lead"),
+            # Preserve updated_at: activity changes are not contact edits
+            updated_at=contacts.c.updated_at
+        )
+    )
+
+
+@event.listens_for(Activity, "after_insert")
+@event.listens_for(Activity, "after_delete")
+def _activity_changed(mapper, connection, target):
+    """Keep the owning contact's current stage in sync on insert/delete."""
+    sync_contact_current_stage(connection, target.contact_id)
+
+
+@event.listens_for(Activity, "after_update")
+def _activity_updated(mapper, connection, target):
+    """Keep current stage in sync when stage, date or owner changes."""
+    state = inspect(target)
+    contact_history = state.attrs.contact_id.history
+    if not (
+        contact_history.has_changes()
+        or state.attrs.pipeline_stage.history.has_changes()
+        or state.attrs.activity_date.history.has_changes()
+    ):
+        return
+
+    sync_contact_current_stage(connection, target.contact_id)
+    for previous_contact_id in contact_history.deleted or ():
+        if previous_contact_id is not None:
+            sync_contact_current_stage(connection, previous_contact_id)
+
+
+# SQLite FTS5 index over activity subjects and markdown notes, used for
+# BM25-ranked search with snippets. External-content table kept in sync by
+# triggers so each write only touches the changed row's postings.
+ACTIVITIES_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS activities_fts USING fts5(
+        subject, notes,
+        content='activities',
+        content_rowid='id',
+        prefix='2 3',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS activities_fts_ai AFTER INSERT ON activities BEGIN
+        INSERT INTO activities_fts(rowid, subject, notes)
+        VALUES (new.id, new.subject, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS activities_fts_ad AFTER DELETE ON activities BEGIN
+        INSERT INTO activities_fts(activities_fts, rowid, subject, notes)
+        VALUES ('delete', old.id, old.subject, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS activities_fts_au AFTER UPDATE OF subject, notes ON activities BEGIN
+        INSERT INTO activities_fts(activities_fts, rowid, subject, notes)
+        VALUES ('delete', old.id, old.subject, old.notes);
+        INSERT INTO activities_fts(rowid, subject, notes)
+        VALUES (new.id, new.subject, new.notes);
+    END
+    """,
+]
+
+for _statement in ACTIVITIES_FTS_DDL:
+    event.listen(Activity.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    Activity.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS activities_fts").execute_if(dialect="sqlite")
+)
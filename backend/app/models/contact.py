@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -12,6 +12,11 @@ class Contact(Base):
     """Contact model representing business contacts."""
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_stage_created", "user_id", "current_pipeline_stage", "created_at"),
+        # Keyset pagination: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_contacts_user_created_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False, index=True)
@@ -22,6 +27,14 @@ class Contact(Base):
     website = Column(String(500), nullable=True)
     notes = Column(Text(5000), nullable=True)
     pipeline_stage = Column(String(50), nullable=False, default="Lead", index=True)
+    # Denormalized stage of the most recent activity, kept in sync by the
+    # Activity mapper events so stage filters can run inside the database.
+    current_pipeline_stage = Column(
+        String(50),
+        nullable=False,
+        default="Lead",
+        server_default="Lead"
+    )
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(
@@ -39,17 +52,47 @@ class Contact(Base):
         cascade="all, delete-orphan"
     )
 
-    @property
-    def current_pipeline_stage(self) -> str:
-        """
-        Compute current pipeline stage from most recent activity.
 
-        Returns:
-            Pipeline stage from the most recent activity, or "Lead" if no activities exist.
-        """
-        if not self.activities:
-            return "Lead"
+# SQLite FTS5 index over the searchable contact columns. It is an
+# external-content table (rows live in contacts) with 2- and 3-character
+# prefix indexes, kept in sync by triggers.
+CONTACTS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+        name, email, company,
+        content='contacts',
+        content_rowid='id',
+        prefix='2 3',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+        INSERT INTO contacts_fts(rowid, name, email, company)
+        VALUES (new.id, new.name, new.email, new.company);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, email, company)
+        VALUES ('delete', old.id, old.name, old.email, old.company);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE OF name, email, company ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, email, company)
+        VALUES ('delete', old.id, old.name, old.email, old.company);
+        INSERT INTO contacts_fts(rowid, name, email, company)
+        VALUES (new.id, new.name, new.email, new.company);
+    END
+    """,
+]
+
+for _statement in CONTACTS_FTS_DDL:
+    event.listen(Contact.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
 
-        # Get the most recent activity by activity_date
-        latest_activity = max(self.activities, key=lambda a: a.activity_date)
-        return latest_activity.pipeline_stage
+event.listen(
+    Contact.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS contacts_fts").execute_if(dialect="sqlite")
+)
@@ -0,0 +1,24 @@
+"""Migration checkpoint model for SimpleCRM."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from app.database import Base
+
+
+class MigrationCheckpoint(Base):
+    """
+    Progress of a batched backfill or table rebuild.
+
+    Updated in the same transaction as each batch, so an interrupted run
+    resumes after the last committed batch.
+    """
+
+    __tablename__ = "migration_checkpoints"
+
+    name = Column(String(255), primary_key=True)
+    last_key = Column(BigInteger, nullable=False, default=0)
+    rows_done = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,22 @@
+"""Schema migration model for SimpleCRM."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.database import Base
+
+
+class SchemaMigration(Base):
+    """
+    Record of an applied migration.
+
+    The highest version is the database's schema version; startup compares
+    it with the code's SCHEMA_VERSION in one query.
+    """
+
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(255), nullable=False)
+    applied_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,27 @@
+"""Token revocation model for SimpleCRM."""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+
+from app.database import Base
+
+
+class TokenRevocation(Base):
+    """
+    Persisted revocation of signed session tokens.
+
+    A row either revokes one token (jti set, e.g. on logout) or every token
+    a user was issued before revoked_before (e.g. on password change). Rows
+    are only needed until expires_at, after which the tokens they cover have
+    expired on their own.
+    """
+
+    __tablename__ = "token_revocations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    jti = Column(String(64), unique=True, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    revoked_before = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
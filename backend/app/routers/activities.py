@@ -2,12 +2,14 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.database import get_async_db, get_db
+from app.dependencies import get_current_user, get_current_user_async, use_async_handler
 from app.models.user import User
+from app.routing import TimedRoute
 from app.schemas import (
     ActivityCreateSchema,
     ActivityListResponseSchema,
@@ -16,7 +18,56 @@ from app.schemas import (
 )
 from app.services.activity_service import ActivityService
 
-router = APIRouter(prefix="/api", tags=["activities"])
+router = APIRouter(prefix="/api", tags=["activities"], route_class=TimedRoute)
+
+
+async def _list_contact_activities_async(
+    contact_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async variant of list_contact_activities (ASYNC_DB_ENABLED)."""
+    if limit is None and not cursor:
+        activities = await ActivityService.get_activities_for_contact_async(
+            db, contact_id, current_user.id
+        )
+
+        if activities is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Contact not found"
+            )
+
+        return ActivityListResponseSchema(
+            activities=activities,
+            total=len(activities)
+        )
+
+    try:
+        result = await ActivityService.get_activities_for_contact_after_cursor_async(
+            db, contact_id, current_user.id, cursor, limit or 50
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found"
+        )
+
+    activities, total, next_cursor = result
+
+    return ActivityListResponseSchema(
+        activities=activities,
+        total=total,
+        next_cursor=next_cursor
+    )
 
 
 @router.get(
@@ -26,43 +77,81 @@ router = APIRouter(prefix="/api", tags=["activities"])
     description="""
     Retrieve all activities for a specific contact.
 
+    Pass `limit` (and then `cursor`) to page through long timelines with keyset
+    pagination instead of loading every activity at once.
+
     **Authentication:** Required (Bearer token in Authorization header)
 
     **Path Parameters:**
     - `contact_id` (required): Contact ID
 
+    **Query Parameters:**
+    - `limit` (optional): Page size (max: 100). Enables cursor pagination.
+    - `cursor` (optional): Opaque `next_cursor` from a previous response (`total`
+      is only returned on the first page and is null after it)
+
     **Success Response (200):**
     ```json
     {
       "activities": [...],
-      "total": 10
+      "total": 10,
+      "next_cursor": null
     }
     ```
 
     **Error Responses:**
+    - `400 Bad Request`: Malformed cursor
     - `401 Unauthorized`: Missing, invalid, or expired session token
     - `404 Not Found`: Contact not found or not owned by current user
     """
 )
+@use_async_handler(_list_contact_activities_async)
 def list_contact_activities(
     contact_id: int,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: DBSession = Depends(get_db)
 ):
     """List all activities for a contact."""
-    activities = ActivityService.get_activities_for_contact(
-        db, contact_id, current_user.id
-    )
+    if limit is None and not cursor:
+        activities = ActivityService.get_activities_for_contact(
+            db, contact_id, current_user.id
+        )
 
-    if activities is None:
+        if activities is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Contact not found"
+            )
+
+        return ActivityListResponseSchema(
+            activities=activities,
+            total=len(activities)
+        )
+
+    try:
+        result = ActivityService.get_activities_for_contact_after_cursor(
+            db, contact_id, current_user.id, cursor, limit or 50
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
 
+    activities, total, next_cursor = result
+
     return ActivityListResponseSchema(
         activities=activities,
-        total=len(activities)
+        total=total,
+        next_cursor=next_cursor
     )
 
 
@@ -115,6 +204,37 @@ def create_activity(
     return activity
 
 
+async def _list_all_activities_async(
+    response: Response,
+    type: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async variant of list_all_activities (ASYNC_DB_ENABLED)."""
+    if limit is None and not cursor:
+        return await ActivityService.get_all_activities_for_user_async(
+            db, current_user.id, activity_type=type, search=search
+        )
+
+    try:
+        activities, next_cursor = await ActivityService.get_all_activities_for_user_after_cursor_async(
+            db, current_user.id, cursor, limit or 50, activity_type=type, search=search
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    return activities
+
+
 @router.get(
     "/activities",
     response_model=list[ActivityResponseSchema],
@@ -122,32 +242,78 @@ def create_activity(
     description="""
     Retrieve all activities across all contacts for the authenticated user.
 
+    Pass `limit` (and then `cursor`) to use keyset pagination. The cursor for
+    the next page is returned in the `X-Next-Cursor` response header so the
+    body stays a plain array.
+
     **Authentication:** Required (Bearer token in Authorization header)
 
     **Query Parameters:**
     - `type` (optional): Filter by activity type (Call, Meeting, Email, Note, All)
-    - `search` (optional): Search term for subject and notes (case-insensitive)
+    - `search` (optional): Full-text search over subject and notes (word prefixes,
+      case- and accent-insensitive). Without `limit`, results are ordered by relevance.
+    - `limit` (optional): Page size (max: 100). Enables cursor pagination.
+    - `cursor` (optional): Opaque cursor from a previous `X-Next-Cursor` header
 
     **Success Response (200):**
-    Returns array of activity objects.
+    Returns array of activity objects. When searching, each object includes a
+    `search_snippet` excerpt with matches wrapped in `**` (markdown bold).
 
     **Error Responses:**
+    - `400 Bad Request`: Malformed cursor
     - `401 Unauthorized`: Missing, invalid, or expired session token
     """
 )
+@use_async_handler(_list_all_activities_async)
 def list_all_activities(
+    response: Response,
     type: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: DBSession = Depends(get_db)
 ):
     """List all activities across all contacts for user."""
-    activities = ActivityService.get_all_activities_for_user(
-        db, current_user.id, activity_type=type, search=search
-    )
+    if limit is None and not cursor:
+        activities = ActivityService.get_all_activities_for_user(
+            db, current_user.id, activity_type=type, search=search
+        )
+        return activities
+
+    try:
+        activities, next_cursor = ActivityService.get_all_activities_for_user_after_cursor(
+            db, current_user.id, cursor, limit or 50, activity_type=type, search=search
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
     return activities
 
 
+async def _get_activity_async(
+    activity_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async variant of get_activity (ASYNC_DB_ENABLED)."""
+    activity = await ActivityService.get_activity_by_id_async(db, activity_id, current_user.id)
+
+    if not activity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Activity not found"
+        )
+
+    return activity
+
+
 @router.get(
     "/activities/{activity_id}",
     response_model=ActivityResponseSchema,
@@ -168,6 +334,7 @@ def list_all_activities(
     - `404 Not Found`: Activity not found or not owned by current user
     """
 )
+@use_async_handler(_get_activity_async)
 def get_activity(
     activity_id: int,
     current_user: User = Depends(get_current_user),
@@ -0,0 +1,126 @@
+"""Admin routes for operational status."""
+
+from fastapi import APIRouter, Depends
+
+from app.database import async_engine, engine, pool_status, read_engine
+from app.dependencies import require_admin_token
+from app.routing import TimedRoute
+from app.services.request_timing import route_latency
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+    route_class=TimedRoute
+)
+
+
+@router.get(
+    "/db-pool",
+    summary="Database connection pool status",
+    description="""
+    Report the live state of every database connection pool in this worker.
+
+    Use it to size `DB_POOL_SIZE` / `DB_MAX_OVERFLOW`: a pool that often has
+    all connections checked out, runs in overflow, or shows growing checkout
+    wait times is too small for the load (or connections are held too long).
+
+    **Authentication:** `X-Admin-Token` header matching the `ADMIN_TOKEN`
+    setting. The endpoint returns 404 while `ADMIN_TOKEN` is unset.
+
+    **Success Response (200):**
+    ```json
+    {
+      "engines": {
+        "write": {
+          "pool_class": "MeteredQueuePool",
+          "size": 5,
+          "checked_out": 2,
+          "checked_in": 3,
+          "overflow": 0,
+          "max_overflow": 10,
+          "timeout_seconds": 30.0,
+          "checkouts": 1520,
+          "timeouts": 0,
+          "avg_wait_ms": 0.04,
+          "max_wait_ms": 12.5
+        },
+        "read": {...}
+      }
+    }
+    ```
+
+    `read` and `async` are only present when the read-only pool and the
+    async engine are enabled. Counters are per worker process and reset when
+    the pool is disposed.
+
+    **Error Responses:**
+    - `403 Forbidden`: Missing or wrong admin token
+    - `404 Not Found`: Admin endpoints disabled
+    """
+)
+def get_db_pool_status():
+    """Get connection pool status for each engine."""
+    engines = {"write": pool_status(engine)}
+    if read_engine is not None:
+        engines["read"] = pool_status(read_engine)
+    if async_engine is not None:
+        engines["async"] = pool_status(async_engine.sync_engine)
+
+    return {"engines": engines}
+
+
+@router.get(
+    "/latency",
+    summary="Per-route latency histograms",
+    description="""
+    Report latency percentiles for every route served by this worker, split
+    into the same phases as the `Server-Timing` response header.
+
+    Phases:
+    - `total`: request start until the response starts
+    - `auth`: resolving the session token (`get_current_user`)
+    - `db`: time spent executing SQL statements
+    - `handler`: the endpoint function
+    - `serialize`: endpoint return until the response starts (response
+      model validation and JSON encoding)
+
+    `auth` and `handler` include their own database time, so phases overlap
+    and do not add up to `total`. Percentiles come from HDR-style histograms
+    with under 2% relative error.
+
+    **Authentication:** `X-Admin-Token` header matching the `ADMIN_TOKEN`
+    setting. The endpoint returns 404 while `ADMIN_TOKEN` is unset.
+
+    **Success Response (200):**
+    ```json
+    {
+      "routes": {
+        "GET /api/contacts": {
+          "total": {
+            "count": 1250,
+            "mean_ms": 8.4,
+            "p50_ms": 6.1,
+            "p90_ms": 14.2,
+            "p99_ms": 41.0,
+            "max_ms": 96.3
+          },
+          "auth": {...},
+          "db": {...},
+          "handler": {...},
+          "serialize": {...}
+        }
+      }
+    }
+    ```
+
+    Histograms are per worker process and reset on restart.
+
+    **Error Responses:**
+    - `403 Forbidden`: Missing or wrong admin token
+    - `404 Not Found`: Admin endpoints disabled
+    """
+)
+def get_route_latency():
+    """Get latency percentiles per route and phase."""
+    return {"routes": route_latency.snapshot()}
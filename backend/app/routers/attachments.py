@@ -6,15 +6,18 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session as DBSession
+from starlette.concurrency import run_in_threadpool
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
+from app.routing import TimedRoute
 from app.schemas import AttachmentResponseSchema
 from app.services.activity_service import ActivityService
 from app.services.attachment_service import AttachmentService
+from app.services.metrics import metrics
 
-router = APIRouter(prefix="/api", tags=["attachments"])
+router = APIRouter(prefix="/api", tags=["attachments"], route_class=TimedRoute)
 
 
 @router.post(
@@ -77,14 +80,18 @@ async def upload_attachment(
         content = await file.read()
         file_path.write_bytes(content)
         file_size = len(content)
+        metrics.inc("simplecrm_attachment_bytes_total", file_size, direction="in")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
 
-    # Save attachment metadata to database
-    attachment = AttachmentService.save_attachment_metadata(
+    # Save attachment metadata to database. On the threadpool: with group
+    # commit the insert waits for its batch, which must not block the event
+    # loop (or concurrent uploads could never share a batch)
+    attachment = await run_in_threadpool(
+        AttachmentService.save_attachment_metadata,
         db,
         activity_id=activity_id,
         original_filename=file.filename or "unnamed",
@@ -146,6 +153,8 @@ def download_attachment(
     # Sanitize original filename for download
     sanitized_filename = AttachmentService.sanitize_filename(attachment.original_filename)
 
+    metrics.inc("simplecrm_attachment_bytes_total", file_path.stat().st_size, direction="out")
+
     # Serve file with sanitized original filename
     return FileResponse(
         path=str(file_path),
@@ -8,10 +8,12 @@ from sqlalchemy.orm import Session as DBSession
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
+from app.routing import TimedRoute
 from app.schemas import AuthResponseSchema, UserLoginSchema, UserRegisterSchema
 from app.services.auth_service import AuthService
+from app.services.password_service import PasswordQueueFullError
 
-router = APIRouter(prefix="/api/auth", tags=["auth"])
+router = APIRouter(prefix="/api/auth", tags=["auth"], route_class=TimedRoute)
 
 
 @router.post(
@@ -50,15 +52,16 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
     - `400 Bad Request`: Invalid input data (malformed email, password too short, etc.)
     - `409 Conflict`: Email already exists in the database
     - `500 Internal Server Error`: Unexpected server error
+    - `503 Service Unavailable`: Password hashing queue is full (retry later)
     """
 )
-def register(
+async def register(
     user_data: UserRegisterSchema,
     db: DBSession = Depends(get_db)
 ):
     """Register a new user and create session."""
     try:
-        user, session = AuthService.register(
+        user, session = await AuthService.register_async(
             db,
             full_name=user_data.full_name,
             email=user_data.email,
@@ -69,6 +72,11 @@ def register(
             "user": user,
             "session_token": session.session_token
         }
+    except PasswordQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please retry"
+        )
     except ValueError as e:
         if "Email already exists" in str(e):
             raise HTTPException(
@@ -115,21 +123,28 @@ def register(
     - `400 Bad Request`: Missing required fields
     - `401 Unauthorized`: Invalid email or password (generic message for security)
     - `500 Internal Server Error`: Unexpected server error
+    - `503 Service Unavailable`: Password hashing queue is full (retry later)
 
     **Security Note:** Error message is intentionally generic ("Invalid email or password")
     to prevent email enumeration attacks.
     """
 )
-def login(
+async def login(
     credentials: UserLoginSchema,
     db: DBSession = Depends(get_db)
 ):
     """Login user and create session."""
-    result = AuthService.login(
-        db,
-        email=credentials.email,
-        password=credentials.password
-    )
+    try:
+        result = await AuthService.login_async(
+            db,
+            email=credentials.email,
+            password=credentials.password
+        )
+    except PasswordQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please retry"
+        )
 
     if not result:
         raise HTTPException(
@@ -154,6 +169,9 @@ def login(
     Only deletes the current session. Other sessions for the same user
     (from other devices/browsers) will remain active.
 
+    Signed tokens (SESSION_TOKEN_MODE=signed) are added to the revocation
+    list instead of being deleted.
+
     **Authentication:** Required (Bearer token in Authorization header)
 
     **Headers:**
@@ -183,3 +201,45 @@ def logout(
         AuthService.logout(db, session_token)
 
     return {"message": "Logged out successfully"}
+
+
+@router.post(
+    "/logout-all",
+    summary="Logout from all devices",
+    description="""
+    Logout the current user everywhere by revoking all of their sessions,
+    including the one used for this request.
+
+    All database sessions are deleted in a single statement and all signed
+    tokens issued so far are revoked. Clients on every device must log in
+    again.
+
+    **Authentication:** Required (Bearer token in Authorization header)
+
+    **Headers:**
+    - `Authorization` (required): Bearer token, e.g., "Bearer abc123...xyz"
+
+    **Success Response (200):**
+    ```json
+    {
+      "message": "Logged out from all devices",
+      "sessions_revoked": 3
+    }
+    ```
+
+    **Error Responses:**
+    - `401 Unauthorized`: Missing, invalid, or expired session token
+    - `500 Internal Server Error`: Unexpected server error
+    """
+)
+def logout_all(
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_db)
+):
+    """Logout user from every device by revoking all of their sessions."""
+    count = AuthService.logout_everywhere(db, current_user.id)
+
+    return {
+        "message": "Logged out from all devices",
+        "sessions_revoked": count
+    }
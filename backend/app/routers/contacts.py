@@ -3,22 +3,26 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.database import get_async_db, get_db
+from app.dependencies import get_current_user, get_current_user_async, use_async_handler
 from app.models.user import User
+from app.routing import TimedRoute
 from app.schemas import (
     ContactCreateSchema,
     ContactListResponseSchema,
     ContactResponseSchema,
+    ContactSuggestResponseSchema,
     ContactUpdateSchema,
     FilterCountsResponseSchema,
     PipelineStatsResponseSchema,
 )
 from app.services.contact_service import ContactService
+from app.services.cursor_service import CursorService
 
-router = APIRouter(prefix="/api/contacts", tags=["contacts"])
+router = APIRouter(prefix="/api/contacts", tags=["contacts"], route_class=TimedRoute)
 
 
 @router.post(
@@ -124,6 +128,47 @@ def get_pipeline_stats(
     return PipelineStatsResponseSchema(**stats)
 
 
+@router.get(
+    "/suggest",
+    response_model=ContactSuggestResponseSchema,
+    summary="Typeahead suggestions for contacts",
+    description="""
+    Return the top matching contacts for a search-box prefix.
+
+    Lightweight alternative to the full contact list for typeahead: only
+    `id`, `name`, `email` and `company` are returned and activities are never
+    loaded. Matching is by word prefix, case- and accent-insensitive.
+
+    **Authentication:** Required (Bearer token in Authorization header)
+
+    **Query Parameters:**
+    - `q` (required): Text typed so far
+    - `limit` (optional): Maximum number of suggestions (default: 10, max: 25)
+
+    **Success Response (200):**
+    ```json
+    {
+      "suggestions": [
+        {"id": 1, "name": "John Doe", "email": "john@example.com", "company": "Acme Corp"}
+      ]
+    }
+    ```
+
+    **Error Responses:**
+    - `401 Unauthorized`: Missing, invalid, or expired session token
+    """
+)
+def suggest_contacts(
+    q: str = Query(..., max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    current_user: User = Depends(get_current_user),
+    db: DBSession = Depends(get_db)
+):
+    """Get typeahead suggestions for contacts."""
+    suggestions = ContactService.suggest_contacts(db, current_user.id, q, limit)
+    return ContactSuggestResponseSchema(suggestions=suggestions)
+
+
 @router.get(
     "/filter-counts",
     response_model=FilterCountsResponseSchema,
@@ -169,6 +214,46 @@ def get_filter_counts(
     return FilterCountsResponseSchema(**counts)
 
 
+async def _list_contacts_async(
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    stage: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async variant of list_contacts (ASYNC_DB_ENABLED)."""
+    if cursor:
+        try:
+            contacts, total, next_cursor = await ContactService.get_contacts_after_cursor_async(
+                db, current_user.id, cursor, limit, search, stage
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        has_more = next_cursor is not None
+    else:
+        contacts, total = await ContactService.get_contacts_for_user_async(
+            db, current_user.id, page, limit, search, stage
+        )
+        has_more = (page * limit) < total
+        next_cursor = None
+        if has_more and contacts:
+            next_cursor = CursorService.encode_cursor(contacts[-1].created_at, contacts[-1].id)
+
+    return ContactListResponseSchema(
+        contacts=contacts,
+        total=total,
+        page=page,
+        limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor
+    )
+
+
 @router.get(
     "",
     response_model=ContactListResponseSchema,
@@ -185,6 +270,9 @@ def get_filter_counts(
     - `limit` (optional): Items per page (default: 50, max: 100)
     - `search` (optional): Search term for name, email, or company (case-insensitive)
     - `stage` (optional): Filter by pipeline stage (Lead, Qualified, Proposal, Client, All)
+    - `cursor` (optional): Opaque `next_cursor` from a previous response. When given,
+      keyset pagination is used, `page` is ignored and `total` is null (it is not
+      recounted on every page).
 
     **Success Response (200):**
     ```json
@@ -193,38 +281,75 @@ def get_filter_counts(
       "total": 100,
       "page": 1,
       "limit": 50,
-      "has_more": true
+      "has_more": true,
+      "next_cursor": "WyIyMDI1LTExLTE3VDEwOjMwOjAwIiw0Ml0"
     }
     ```
 
     **Error Responses:**
+    - `400 Bad Request`: Malformed cursor
     - `401 Unauthorized`: Missing, invalid, or expired session token
     """
 )
+@use_async_handler(_list_contacts_async)
 def list_contacts(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=100),
     search: Optional[str] = Query(None),
     stage: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: DBSession = Depends(get_db)
 ):
     """List all contacts for current user with pagination, search, and filter."""
-    contacts, total = ContactService.get_contacts_for_user(
-        db, current_user.id, page, limit, search, stage
-    )
-
-    has_more = (page * limit) < total
+    if cursor:
+        try:
+            contacts, total, next_cursor = ContactService.get_contacts_after_cursor(
+                db, current_user.id, cursor, limit, search, stage
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        has_more = next_cursor is not None
+    else:
+        contacts, total = ContactService.get_contacts_for_user(
+            db, current_user.id, page, limit, search, stage
+        )
+        has_more = (page * limit) < total
+        # Let offset clients switch to keyset pagination from any page
+        next_cursor = None
+        if has_more and contacts:
+            next_cursor = CursorService.encode_cursor(contacts[-1].created_at, contacts[-1].id)
 
     return ContactListResponseSchema(
         contacts=contacts,
         total=total,
         page=page,
         limit=limit,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
+async def _get_contact_async(
+    contact_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Async variant of get_contact (ASYNC_DB_ENABLED)."""
+    contact = await ContactService.get_contact_by_id_async(db, contact_id, current_user.id)
+
+    if not contact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found"
+        )
+
+    return contact
+
+
 @router.get(
     "/{contact_id}",
     response_model=ContactResponseSchema,
@@ -245,6 +370,7 @@ def list_contacts(
     - `404 Not Found`: Contact not found or not owned by current user
     """
 )
+@use_async_handler(_get_contact_async)
 def get_contact(
     contact_id: int,
     current_user: User = Depends(get_current_user),
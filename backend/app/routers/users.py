@@ -2,14 +2,17 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session as DBSession
+from starlette.concurrency import run_in_threadpool
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
+from app.routing import TimedRoute
 from app.schemas import UserResponseSchema, UserUpdateSchema
+from app.services.password_service import PasswordQueueFullError, PasswordService
 from app.services.user_service import UserService
 
-router = APIRouter(prefix="/api/users", tags=["users"])
+router = APIRouter(prefix="/api/users", tags=["users"], route_class=TimedRoute)
 
 
 @router.get(
@@ -85,6 +88,7 @@ def get_current_user_profile(
     - `401 Unauthorized`: Missing, invalid, or expired session token
     - `409 Conflict`: Email already exists (belongs to another user)
     - `500 Internal Server Error`: Unexpected server error
+    - `503 Service Unavailable`: Password hashing queue is full (retry later)
 
     **Examples:**
 
@@ -124,7 +128,7 @@ def get_current_user_profile(
     - Email uniqueness is enforced (case-insensitive)
     """
 )
-def update_current_user_profile(
+async def update_current_user_profile(
     update_data: UserUpdateSchema,
     current_user: User = Depends(get_current_user),
     db: DBSession = Depends(get_db)
@@ -138,8 +142,21 @@ def update_current_user_profile(
         return current_user
 
     try:
-        updated_user = UserService.update_user(db, current_user.id, update_dict)
+        # Hash a new password on the password worker pool, not a request thread
+        if "password" in update_dict:
+            update_dict["hashed_password"] = await PasswordService.hash_password_async(
+                update_dict.pop("password")
+            )
+
+        updated_user = await run_in_threadpool(
+            UserService.update_user, db, current_user.id, update_dict
+        )
         return updated_user
+    except PasswordQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, please retry"
+        )
     except ValueError as e:
         if "Email already exists" in str(e):
             raise HTTPException(
@@ -12,6 +12,8 @@ from app.schemas.contact import (
     ContactCreateSchema,
     ContactListResponseSchema,
     ContactResponseSchema,
+    ContactSuggestionSchema,
+    ContactSuggestResponseSchema,
     ContactUpdateSchema,
     FilterCountsResponseSchema,
     PipelineStatsResponseSchema,
@@ -35,6 +37,8 @@ __all__ = [
     "ContactCreateSchema",
     "ContactListResponseSchema",
     "ContactResponseSchema",
+    "ContactSuggestionSchema",
+    "ContactSuggestResponseSchema",
     "ContactUpdateSchema",
     "FilterCountsResponseSchema",
     "PipelineStatsResponseSchema",
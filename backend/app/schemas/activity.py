@@ -40,10 +40,12 @@ class ActivityResponseSchema(BaseModel):
     pipeline_stage: str
     created_at: datetime
     updated_at: datetime
+    search_snippet: Optional[str] = Field(None, description="Highlighted match excerpt (full-text search only)")
 
 
 class ActivityListResponseSchema(BaseModel):
-    """Schema for activity list response (no pagination for simplicity)."""
+    """Schema for activity list response (optionally cursor-paginated)."""
 
     activities: list[ActivityResponseSchema]
-    total: int
+    total: Optional[int] = Field(..., description="Total activities (null on cursor pages after the first)")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page (keyset pagination)")
@@ -56,10 +56,11 @@ class ContactListResponseSchema(BaseModel):
     """Schema for paginated contact list response."""
 
     contacts: list[ContactResponseSchema]
-    total: int
+    total: Optional[int] = Field(..., description="Total matching contacts (null on cursor pages)")
     page: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page (keyset pagination)")
 
 
 class PipelineStatsResponseSchema(BaseModel):
@@ -76,3 +77,20 @@ class FilterCountsResponseSchema(BaseModel):
 
     stage_counts: Dict[str, int] = Field(..., description="Counts by pipeline stage")
     activity_type_counts: Dict[str, int] = Field(..., description="Counts by activity type")
+
+
+class ContactSuggestionSchema(BaseModel):
+    """Schema for a lightweight contact typeahead suggestion."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    email: str
+    company: Optional[str]
+
+
+class ContactSuggestResponseSchema(BaseModel):
+    """Schema for contact typeahead response."""
+
+    suggestions: list[ContactSuggestionSchema]
@@ -1,19 +1,32 @@
 """Activity service for activity-related operations."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session as DBSession, joinedload
+from sqlalchemy import column, func, literal_column, or_, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session as DBSession, joinedload
 
 from app.models.activity import Activity
 from app.models.contact import Contact
 from app.schemas.activity import ActivityCreateSchema, ActivityUpdateSchema
+from app.services.cursor_service import CursorService
+from app.services.group_commit import group_commit
+from app.services.search_service import SearchService
+
+
+# Lightweight handle on the activities_fts virtual table for joins
+activities_fts = table("activities_fts", column("rowid"))
 
 
 class ActivityService:
     """Service for activity-related operations."""
 
+    # Search snippets are markdown, like the notes they are cut from
+    SNIPPET_START = "**"
+    SNIPPET_END = "**"
+    SNIPPET_TOKENS = 16
+
     @staticmethod
     def create_activity(
         db: DBSession,
@@ -53,20 +66,16 @@ class ActivityService:
         if activity_dict.get("subject") is None:
             activity_dict["subject"] = ""
 
-        # Handle pipeline_stage inheritance
+        # Handle pipeline_stage inheritance from the contact's current stage
+        # (the most recent activity's stage, or "Lead" if there are none)
         if not activity_dict.get("pipeline_stage"):
-            # Query contact's most recent activity to inherit pipeline_stage
-            latest_activity = db.query(Activity).filter(
-                Activity.contact_id == contact_id
-            ).order_by(
-                Activity.activity_date.desc()
-            ).first()
-
-            if latest_activity:
-                activity_dict["pipeline_stage"] = latest_activity.pipeline_stage
-            else:
-                # No previous activities, default to "Lead"
-                activity_dict["pipeline_stage"] = "Lead"
+            activity_dict["pipeline_stage"] = contact.current_pipeline_stage
+
+        if group_commit.enabled:
+            activity_id = group_commit.insert(
+                lambda: Activity(contact_id=contact_id, **activity_dict)
+            )
+            return db.query(Activity).filter(Activity.id == activity_id).first()
 
         activity = Activity(
             contact_id=contact_id,
@@ -110,20 +119,85 @@ class ActivityService:
         ).filter(
             Activity.contact_id == contact_id
         ).order_by(
-            Activity.activity_date.desc()
+            Activity.activity_date.desc(),
+            Activity.id.desc()
         ).all()
 
         return activities
 
     @staticmethod
-    def get_all_activities_for_user(
+    def get_activities_for_contact_after_cursor(
+        db: DBSession,
+        contact_id: int,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Optional[Tuple[list[Activity], Optional[int], Optional[str]]]:
+        """
+        Get one keyset-paginated page of a contact's activities.
+
+        Args:
+            db: Database session
+            contact_id: Contact ID
+            user_id: User ID for ownership verification
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+
+        Returns:
+            Tuple of (activities sorted by activity_date desc, total count
+            (first page only, None when a cursor is given), next cursor or
+            None), or None if contact not owned
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Enforce max limit
+        limit = min(limit, 100)
+
+        # Verify contact ownership
+        contact = db.query(Contact).filter(
+            Contact.id == contact_id,
+            Contact.user_id == user_id
+        ).first()
+
+        if not contact:
+            return None
+
+        query = db.query(Activity).filter(Activity.contact_id == contact_id)
+        # Counted once on the first page; later pages only seek
+        total = None if cursor else query.count()
+
+        if cursor:
+            query = CursorService.apply_cursor(query, Activity.activity_date, Activity.id, cursor)
+
+        # Fetch one extra row to learn whether another page exists
+        activities = query.options(
+            joinedload(Activity.attachments)
+        ).order_by(
+            Activity.activity_date.desc(),
+            Activity.id.desc()
+        ).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_cursor = CursorService.encode_cursor(activities[-1].activity_date, activities[-1].id)
+
+        return activities, total, next_cursor
+
+    @staticmethod
+    def _build_user_activities_query(
         db: DBSession,
         user_id: int,
         activity_type: Optional[str] = None,
         search: Optional[str] = None
-    ) -> list[Activity]:
+    ) -> Tuple[Query, bool]:
         """
-        Get all activities across all user's contacts with optional filtering.
+        Build the filtered activities query shared by full and cursor listings.
+
+        On SQLite, searches go through the activities_fts index and the query
+        yields (Activity, snippet, rank) rows; otherwise it yields Activity
+        rows filtered with a case-insensitive LIKE.
 
         Args:
             db: Database session
@@ -132,7 +206,8 @@ class ActivityService:
             search: Optional search term for subject and notes
 
         Returns:
-            List of activities sorted by activity_date desc
+            Tuple of (query for the user's matching activities (unordered),
+            whether the query is full-text ranked)
         """
         # Query activities through contact relationship
         query = db.query(Activity).join(Contact).filter(
@@ -145,21 +220,149 @@ class ActivityService:
         if activity_type and activity_type != "All":
             query = query.filter(Activity.type == activity_type)
 
-        # Search in subject and notes if search term provided
-        if search:
-            search_term = f"%{search.lower()}%"
-            query = query.filter(
-                or_(
-                    func.lower(Activity.subject).like(search_term),
-                    func.lower(Activity.notes).like(search_term)
-                )
+        if not search:
+            return query, False
+
+        match = SearchService.build_fts_match(search)
+        if match and SearchService.fts_available(db):
+            fts = literal_column("activities_fts")
+            query = query.join(
+                activities_fts, activities_fts.c.rowid == Activity.id
+            ).filter(
+                text("activities_fts MATCH :activity_search").bindparams(activity_search=match)
+            ).add_columns(
+                func.snippet(
+                    fts, -1,
+                    ActivityService.SNIPPET_START, ActivityService.SNIPPET_END,
+                    "…", ActivityService.SNIPPET_TOKENS
+                ).label("search_snippet"),
+                # Subject matches weigh twice as much as notes matches
+                func.bm25(fts, 2.0, 1.0).label("search_rank")
+            )
+            return query, True
+
+        # Fallback: substring search in subject and notes
+        search_term = f"%{search.lower()}%"
+        query = query.filter(
+            or_(
+                func.lower(Activity.subject).like(search_term),
+                func.lower(Activity.notes).like(search_term)
             )
+        )
+        return query, False
+
+    @staticmethod
+    def _attach_snippets(rows) -> list[Activity]:
+        """
+        Copy search snippets from full-text result rows onto the activities.
+
+        Args:
+            rows: (Activity, snippet, rank) rows from a ranked query
+
+        Returns:
+            List of activities with search_snippet set
+        """
+        activities = []
+        for activity, snippet, _rank in rows:
+            activity.search_snippet = snippet
+            activities.append(activity)
+        return activities
+
+    @staticmethod
+    def get_all_activities_for_user(
+        db: DBSession,
+        user_id: int,
+        activity_type: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> list[Activity]:
+        """
+        Get all activities across all user's contacts with optional filtering.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            activity_type: Optional filter by activity type
+            search: Optional search term for subject and notes
+
+        Returns:
+            List of activities sorted by activity_date desc, or by BM25
+            relevance (with search_snippet set) for full-text searches
+        """
+        query, ranked = ActivityService._build_user_activities_query(
+            db, user_id, activity_type, search
+        )
+
+        if ranked:
+            rows = query.order_by(
+                literal_column("search_rank"),
+                Activity.activity_date.desc(),
+                Activity.id.desc()
+            ).all()
+            return ActivityService._attach_snippets(rows)
 
         # Sort by activity date descending
-        activities = query.order_by(Activity.activity_date.desc()).all()
+        activities = query.order_by(
+            Activity.activity_date.desc(),
+            Activity.id.desc()
+        ).all()
 
         return activities
 
+    @staticmethod
+    def get_all_activities_for_user_after_cursor(
+        db: DBSession,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        activity_type: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Tuple[list[Activity], Optional[str]]:
+        """
+        Get one keyset-paginated page of activities across all user's contacts.
+
+        Pages are always ordered by activity_date desc so the cursor stays
+        stable; full-text searches still filter through the index and set
+        search_snippet.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+            activity_type: Optional filter by activity type
+            search: Optional search term for subject and notes
+
+        Returns:
+            Tuple of (activities sorted by activity_date desc, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        # Enforce max limit
+        limit = min(limit, 100)
+
+        query, ranked = ActivityService._build_user_activities_query(
+            db, user_id, activity_type, search
+        )
+
+        if cursor:
+            query = CursorService.apply_cursor(query, Activity.activity_date, Activity.id, cursor)
+
+        # Fetch one extra row to learn whether another page exists
+        rows = query.order_by(
+            Activity.activity_date.desc(),
+            Activity.id.desc()
+        ).limit(limit + 1).all()
+
+        activities = ActivityService._attach_snippets(rows) if ranked else rows
+
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_cursor = CursorService.encode_cursor(activities[-1].activity_date, activities[-1].id)
+
+        return activities, next_cursor
+
     @staticmethod
     def get_activity_by_id(
         db: DBSession,
@@ -244,3 +447,129 @@ class ActivityService:
         db.commit()
 
         return True
+
+    # Async counterparts for the async read handlers (ASYNC_DB_ENABLED); see
+    # ContactService for how they reuse the sync query code.
+
+    @staticmethod
+    async def get_activities_for_contact_async(
+        db: AsyncSession,
+        contact_id: int,
+        user_id: int
+    ) -> Optional[list[Activity]]:
+        """
+        Async counterpart of get_activities_for_contact.
+
+        Args:
+            db: Async database session
+            contact_id: Contact ID
+            user_id: User ID for ownership verification
+
+        Returns:
+            List of activities sorted by activity_date desc, or None if contact not owned
+        """
+        return await db.run_sync(ActivityService.get_activities_for_contact, contact_id, user_id)
+
+    @staticmethod
+    async def get_activities_for_contact_after_cursor_async(
+        db: AsyncSession,
+        contact_id: int,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> Optional[Tuple[list[Activity], Optional[int], Optional[str]]]:
+        """
+        Async counterpart of get_activities_for_contact_after_cursor.
+
+        Args:
+            db: Async database session
+            contact_id: Contact ID
+            user_id: User ID for ownership verification
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+
+        Returns:
+            Tuple of (activities, total count or None after the first page,
+            next cursor or None), or None if contact not owned
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await db.run_sync(
+            ActivityService.get_activities_for_contact_after_cursor,
+            contact_id, user_id, cursor, limit
+        )
+
+    @staticmethod
+    async def get_all_activities_for_user_async(
+        db: AsyncSession,
+        user_id: int,
+        activity_type: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> list[Activity]:
+        """
+        Async counterpart of get_all_activities_for_user.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            activity_type: Optional filter by activity type
+            search: Optional search term for subject and notes
+
+        Returns:
+            List of activities sorted by activity_date desc, or by relevance
+            for full-text searches
+        """
+        return await db.run_sync(
+            ActivityService.get_all_activities_for_user, user_id, activity_type, search
+        )
+
+    @staticmethod
+    async def get_all_activities_for_user_after_cursor_async(
+        db: AsyncSession,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        activity_type: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Tuple[list[Activity], Optional[str]]:
+        """
+        Async counterpart of get_all_activities_for_user_after_cursor.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+            activity_type: Optional filter by activity type
+            search: Optional search term for subject and notes
+
+        Returns:
+            Tuple of (activities sorted by activity_date desc, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await db.run_sync(
+            ActivityService.get_all_activities_for_user_after_cursor,
+            user_id, cursor, limit, activity_type, search
+        )
+
+    @staticmethod
+    async def get_activity_by_id_async(
+        db: AsyncSession,
+        activity_id: int,
+        user_id: int
+    ) -> Optional[Activity]:
+        """
+        Async counterpart of get_activity_by_id.
+
+        Args:
+            db: Async database session
+            activity_id: Activity ID
+            user_id: User ID for ownership verification
+
+        Returns:
+            Activity object if found and owned by user, None otherwise
+        """
+        return await db.run_sync(ActivityService.get_activity_by_id, activity_id, user_id)
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session as DBSession
 from app.models.activity import Activity
 from app.models.attachment import Attachment
 from app.models.contact import Contact
+from app.services.group_commit import group_commit
 
 
 class AttachmentService:
@@ -40,14 +41,21 @@ class AttachmentService:
         Returns:
             Created Attachment object
         """
-        attachment = Attachment(
-            activity_id=activity_id,
-            original_filename=original_filename,
-            stored_filename=stored_filename,
-            file_path=file_path,
-            file_size=file_size,
-            mime_type=mime_type
-        )
+        def build_attachment() -> Attachment:
+            return Attachment(
+                activity_id=activity_id,
+                original_filename=original_filename,
+                stored_filename=stored_filename,
+                file_path=file_path,
+                file_size=file_size,
+                mime_type=mime_type
+            )
+
+        if group_commit.enabled:
+            attachment_id = group_commit.insert(build_attachment)
+            return db.query(Attachment).filter(Attachment.id == attachment_id).first()
+
+        attachment = build_attachment()
 
         db.add(attachment)
         db.commit()
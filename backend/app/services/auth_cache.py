@@ -0,0 +1,187 @@
+"""In-process cache of authenticated users keyed by session token."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Collection, Optional, Tuple
+
+from app.config import settings
+from app.models.user import User
+
+# User columns copied into cached snapshots (hashed_password is deliberately excluded)
+SNAPSHOT_FIELDS = ("id", "email", "full_name", "created_at", "updated_at")
+
+
+class AuthCache:
+    """
+    Bounded LRU cache mapping session tokens to user snapshots.
+
+    Entries live for at most ttl_seconds and never past the session's own
+    expires_at. The cache is per process: logout and profile updates
+    invalidate entries in the current worker immediately, other workers
+    pick up changes when their entries expire.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached tokens (least recently used evicted first)
+            ttl_seconds: Maximum age of an entry in seconds (0 disables caching)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores entries at all."""
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, token: str) -> Optional[User]:
+        """
+        Look up the user for a session token.
+
+        Args:
+            token: Session token
+
+        Returns:
+            Detached User snapshot if cached and fresh, None otherwise
+        """
+        entry = self.get_with_expiry(token)
+        return entry[0] if entry else None
+
+    def get_with_expiry(self, token: str) -> Optional[Tuple[User, datetime]]:
+        """
+        Look up the user and session expiry for a session token.
+
+        Args:
+            token: Session token
+
+        Returns:
+            Tuple of (detached User snapshot, session expires_at) if cached
+            and fresh, None otherwise
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            valid_until, snapshot, expires_at = entry
+            if valid_until <= time.monotonic():
+                del self._entries[token]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(token)
+            self.hits += 1
+
+        # Fresh transient instance per request so callers never share state
+        return User(**snapshot), expires_at
+
+    def set(self, token: str, user: User, expires_at: datetime) -> None:
+        """
+        Cache a user snapshot for a session token.
+
+        Args:
+            token: Session token
+            user: Authenticated user
+            expires_at: Session expiry (UTC); the entry never outlives it
+        """
+        if not self.enabled:
+            return
+
+        session_remaining = (expires_at - datetime.utcnow()).total_seconds()
+        lifetime = min(self.ttl_seconds, session_remaining)
+        if lifetime <= 0:
+            return
+
+        snapshot = {field: getattr(user, field) for field in SNAPSHOT_FIELDS}
+
+        with self._lock:
+            self._entries[token] = (time.monotonic() + lifetime, snapshot, expires_at)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def extend_expiry(self, token: str, expires_at: datetime) -> None:
+        """
+        Record a renewed session expiry on a cached entry.
+
+        The entry's own lifetime is unchanged; only the expiry handed to
+        callers moves forward.
+
+        Args:
+            token: Session token
+            expires_at: New session expiry (UTC)
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[2] < expires_at:
+                self._entries[token] = (entry[0], entry[1], expires_at)
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Drop the cached entry for a session token.
+
+        Args:
+            token: Session token
+        """
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def invalidate_user(self, user_id: int, keep: Collection[str] = ()) -> None:
+        """
+        Drop every cached entry belonging to a user.
+
+        Args:
+            user_id: User ID
+            keep: Tokens whose entries stay cached (sessions still valid)
+        """
+        with self._lock:
+            stale = [
+                token for token, (_, snapshot, _) in self._entries.items()
+                if snapshot["id"] == user_id and token not in keep
+            ]
+            for token in stale:
+                del self._entries[token]
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with size, max_size, ttl_seconds, hits, misses and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+auth_cache = AuthCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS
+)
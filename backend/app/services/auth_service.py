@@ -3,11 +3,15 @@
 from typing import Optional, Tuple
 
 from sqlalchemy.orm import Session as DBSession
+from starlette.concurrency import run_in_threadpool
 
 from app.models.session import Session
 from app.models.user import User
-from app.services.password_service import PasswordService
+from app.services.auth_cache import auth_cache
+from app.services.password_service import PasswordQueueFullError, PasswordService
 from app.services.session_service import SessionService
+from app.services.signed_token_service import SignedTokenService
+from app.services.token_revocation import token_revocations
 from app.services.user_service import UserService
 
 
@@ -44,7 +48,95 @@ class AuthService:
         # Hash password
         hashed_password = PasswordService.hash_password(password)
 
-        # Create user
+        # Create user and session
+        return AuthService._create_user_with_session(db, full_name, email, hashed_password)
+
+    @staticmethod
+    def login(
+        db: DBSession,
+        email: str,
+        password: str
+    ) -> Optional[Tuple[User, Session]]:
+        """
+        Authenticate user and create a session.
+
+        Args:
+            db: Database session
+            email: User's email
+            password: User's plain text password
+
+        Returns:
+            Tuple of (User, Session) if valid, None if invalid credentials
+
+        Note:
+            A stored hash whose cost differs from settings.PASSWORD_BCRYPT_ROUNDS
+            is transparently replaced after a successful password check.
+        """
+        # Get user by email (case-insensitive)
+        user = UserService.get_user_by_email(db, email)
+        if not user:
+            return None
+
+        # Verify password
+        if not PasswordService.verify_password(password, user.hashed_password):
+            return None
+
+        # Upgrade (or downgrade) the stored hash to the configured cost
+        if PasswordService.needs_rehash(user.hashed_password):
+            AuthService._store_rehashed_password(
+                db, user, PasswordService.hash_password(password)
+            )
+
+        # Create new session
+        session = SessionService.create_session(db, user.id)
+
+        return user, session
+
+    @staticmethod
+    async def register_async(
+        db: DBSession,
+        full_name: str,
+        email: str,
+        password: str
+    ) -> Tuple[User, Session]:
+        """
+        Register a new user, hashing the password on the password worker pool.
+
+        Database work runs on the request threadpool; only bcrypt runs on the
+        dedicated pool, so slow hashing never holds a request thread.
+
+        Args:
+            db: Database session
+            full_name: User's full name
+            email: User's email
+            password: User's plain text password
+
+        Returns:
+            Tuple of (User, Session)
+
+        Raises:
+            ValueError: If email already exists
+            PasswordQueueFullError: If the password worker pool is saturated
+        """
+        # Check email uniqueness
+        existing_user = await run_in_threadpool(UserService.get_user_by_email, db, email)
+        if existing_user:
+            raise ValueError("Email already exists")
+
+        hashed_password = await PasswordService.hash_password_async(password)
+
+        return await run_in_threadpool(
+            AuthService._create_user_with_session, db, full_name, email, hashed_password
+        )
+
+    @staticmethod
+    def _create_user_with_session(
+        db: DBSession,
+        full_name: str,
+        email: str,
+        hashed_password: str
+    ) -> Tuple[User, Session]:
+        """Insert a user with an already-hashed password and open a session."""
         user = User(
             email=email,
             full_name=full_name,
@@ -55,19 +147,18 @@ class AuthService:
         db.commit()
         db.refresh(user)
 
-        # Create session
         session = SessionService.create_session(db, user.id)
 
         return user, session
 
     @staticmethod
-    def login(
+    async def login_async(
         db: DBSession,
         email: str,
         password: str
     ) -> Optional[Tuple[User, Session]]:
         """
-        Authenticate user and create a session.
+        Authenticate user, verifying the password on the password worker pool.
 
         Args:
             db: Database session
@@ -76,31 +167,87 @@ class AuthService:
 
         Returns:
             Tuple of (User, Session) if valid, None if invalid credentials
+
+        Raises:
+            PasswordQueueFullError: If the password worker pool is saturated
         """
         # Get user by email (case-insensitive)
-        user = UserService.get_user_by_email(db, email)
+        user = await run_in_threadpool(UserService.get_user_by_email, db, email)
         if not user:
             return None
 
         # Verify password
-        if not PasswordService.verify_password(password, user.hashed_password):
+        if not await PasswordService.verify_password_async(password, user.hashed_password):
             return None
 
+        # Upgrade (or downgrade) the stored hash to the configured cost. A busy
+        # pool must not fail the login; the rehash is retried next time.
+        if PasswordService.needs_rehash(user.hashed_password):
+            try:
+                hashed_password = await PasswordService.hash_password_async(password)
+            except PasswordQueueFullError:
+                hashed_password = None
+            if hashed_password:
+                await run_in_threadpool(
+                    AuthService._store_rehashed_password, db, user, hashed_password
+                )
+
         # Create new session
-        session = SessionService.create_session(db, user.id)
+        session = await run_in_threadpool(SessionService.create_session, db, user.id)
 
         return user, session
 
+    @staticmethod
+    def _store_rehashed_password(db: DBSession, user: User, hashed_password: str) -> None:
+        """Persist a password hash recomputed at the configured cost."""
+        user.hashed_password = hashed_password
+        db.commit()
+        db.refresh(user)
+
+    @staticmethod
+    def logout_everywhere(db: DBSession, user_id: int) -> int:
+        """
+        Revoke all of a user's sessions on every device.
+
+        Deletes every database session in one statement, revokes every signed
+        token issued so far, and drops the user's auth cache entries in this
+        process (other workers follow within AUTH_CACHE_TTL_SECONDS).
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+
+        Returns:
+            Number of database sessions deleted
+        """
+        count = SessionService.delete_all_sessions(db, user_id)
+        token_revocations.revoke_user(db, user_id)
+        auth_cache.invalidate_user(user_id)
+
+        return count
+
     @staticmethod
     def logout(db: DBSession, session_token: str) -> bool:
         """
         Logout user by deleting the session.
 
+        Signed tokens cannot be deleted, so they are added to the revocation
+        list instead.
+
         Args:
             db: Database session
             session_token: Session token to delete
 
         Returns:
-            True if session was deleted, False if not found
+            True if session was deleted or revoked, False if not found
         """
+        auth_cache.invalidate_token(session_token)
+
+        if SignedTokenService.is_signed_token(session_token):
+            claims = SignedTokenService.verify_token(session_token)
+            if not claims:
+                return False
+            token_revocations.revoke_token(db, claims.jti, claims.expires_at)
+            return True
+
         return SessionService.delete_session(db, session_token)
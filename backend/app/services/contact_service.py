@@ -2,12 +2,16 @@
 
 from typing import Optional, Tuple
 
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
 from app.models.activity import Activity
 from app.models.contact import Contact
 from app.schemas.contact import ContactCreateSchema, ContactUpdateSchema
+from app.services.cursor_service import CursorService
+from app.services.group_commit import group_commit
+from app.services.search_service import SearchService
 
 
 class ContactService:
@@ -39,6 +43,12 @@ class ContactService:
         if contact_dict.get("website"):
             contact_dict["website"] = str(contact_dict["website"])
 
+        if group_commit.enabled:
+            contact_id = group_commit.insert(
+                lambda: Contact(**contact_dict, user_id=user_id)
+            )
+            return db.query(Contact).filter(Contact.id == contact_id).first()
+
         contact = Contact(
             **contact_dict,
             user_id=user_id
@@ -67,14 +77,93 @@ class ContactService:
         Returns:
             Contact object if found and owned by user, None otherwise
         """
-        from sqlalchemy.orm import joinedload
-        return db.query(Contact).options(
-            joinedload(Contact.activities)
-        ).filter(
+        return db.query(Contact).filter(
             Contact.id == contact_id,
             Contact.user_id == user_id
         ).first()
 
+    @staticmethod
+    def _search_filter(db: DBSession, search: str):
+        """
+        Build the SQL criterion for a contact search term.
+
+        Uses the contacts_fts index on SQLite and falls back to a
+        case-insensitive substring match on other dialects, or when the
+        term has no indexable words.
+
+        Args:
+            db: Database session
+            search: Raw search term
+
+        Returns:
+            SQLAlchemy boolean expression on Contact
+        """
+        match = SearchService.build_fts_match(search)
+        if match and SearchService.fts_available(db):
+            matching_ids = select(text("rowid")).select_from(
+                text("contacts_fts")
+            ).where(
+                text("contacts_fts MATCH :contact_search").bindparams(contact_search=match)
+            )
+            return Contact.id.in_(matching_ids)
+
+        search_term = f"%{search.lower()}%"
+        return or_(
+            func.lower(Contact.name).like(search_term),
+            func.lower(Contact.email).like(search_term),
+            func.lower(Contact.company).like(search_term)
+        )
+
+    @staticmethod
+    def rebuild_search_index(db: DBSession) -> None:
+        """
+        Rebuild the contacts_fts index from the contacts table.
+
+        Needed after bulk changes that bypassed the sync triggers or after
+        restoring a database file. No-op on non-SQLite dialects.
+
+        Args:
+            db: Database session
+        """
+        if not SearchService.fts_available(db):
+            return
+
+        db.execute(text("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')"))
+        db.commit()
+
+    @staticmethod
+    def _build_contacts_query(
+        db: DBSession,
+        user_id: int,
+        search: Optional[str] = None,
+        stage: Optional[str] = None
+    ):
+        """
+        Build the filtered contacts query shared by offset and cursor listings.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            search: Optional search term (searches name, email, company)
+            stage: Optional pipeline stage filter (comma-separated for multiple)
+
+        Returns:
+            SQLAlchemy query for the user's matching contacts (unordered)
+        """
+        query = db.query(Contact).filter(Contact.user_id == user_id)
+
+        # Apply search filter (full-text on SQLite, case-insensitive LIKE elsewhere)
+        if search:
+            query = query.filter(ContactService._search_filter(db, search))
+
+        # Apply pipeline stage filter against the materialized current stage
+        if stage and stage != "All":
+            # Support comma-separated stage values for multi-stage filtering
+            stages = [s.strip() for s in stage.split(',')]
+            query = query.filter(Contact.current_pipeline_stage.in_(stages))
+
+        return query
+
     @staticmethod
     def get_contacts_for_user(
         db: DBSession,
@@ -98,51 +187,117 @@ class ContactService:
         Returns:
             Tuple of (list of contacts, total count)
         """
-        from sqlalchemy.orm import joinedload
-        from sqlalchemy import select
+        # Enforce max limit
+        limit = min(limit, 100)
+
+        query = ContactService._build_contacts_query(db, user_id, search, stage)
+
+        total = query.count()
+
+        offset = (page - 1) * limit
+        contacts = query.order_by(
+            Contact.created_at.desc(),
+            Contact.id.desc()
+        ).offset(offset).limit(limit).all()
+
+        return contacts, total
+
+    @staticmethod
+    def get_contacts_after_cursor(
+        db: DBSession,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        search: Optional[str] = None,
+        stage: Optional[str] = None
+    ) -> Tuple[list[Contact], Optional[int], Optional[str]]:
+        """
+        Get contacts for user with keyset (cursor) pagination.
+
+        Rows are ordered by created_at desc, id desc, and each page seeks
+        directly past the previous page's last row, so deep pages cost the
+        same as the first one and concurrent inserts do not shift results.
+        The total is only counted for the first page (no cursor); counting
+        the whole filtered set again on every page would make each page O(N).
+
+        Args:
+            db: Database session
+            user_id: User ID
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+            search: Optional search term (searches name, email, company)
+            stage: Optional pipeline stage filter
+
+        Returns:
+            Tuple of (list of contacts, total count or None after the first
+            page, next cursor or None)
 
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         # Enforce max limit
         limit = min(limit, 100)
 
-        # Base query with user filter and eager load activities for current_pipeline_stage
-        query = db.query(Contact).options(
-            joinedload(Contact.activities)
-        ).filter(Contact.user_id == user_id)
+        query = ContactService._build_contacts_query(db, user_id, search, stage)
 
-        # Apply search filter (case-insensitive OR search)
-        if search:
-            search_term = f"%{search.lower()}%"
-            query = query.filter(
-                or_(
-                    func.lower(Contact.name).like(search_term),
-                    func.lower(Contact.email).like(search_term),
-                    func.lower(Contact.company).like(search_term)
-                )
-            )
+        total = None if cursor else query.count()
 
-        # For pipeline stage filtering, we need to filter in Python since current_pipeline_stage
-        # is computed from activities. Get all contacts first, then filter.
-        # This is acceptable for small datasets; for large datasets, we'd need a different approach.
+        if cursor:
+            query = CursorService.apply_cursor(query, Contact.created_at, Contact.id, cursor)
 
-        # Get all matching contacts (before stage filter)
-        all_contacts = query.order_by(Contact.created_at.desc()).all()
+        # Fetch one extra row to learn whether another page exists
+        contacts = query.order_by(
+            Contact.created_at.desc(),
+            Contact.id.desc()
+        ).limit(limit + 1).all()
 
-        # Apply pipeline stage filter in Python
-        if stage and stage != "All":
-            # Support comma-separated stage values for multi-stage filtering
-            stages = [s.strip() for s in stage.split(',')]
-            filtered_contacts = [c for c in all_contacts if c.current_pipeline_stage in stages]
-        else:
-            filtered_contacts = all_contacts
+        next_cursor = None
+        if len(contacts) > limit:
+            contacts = contacts[:limit]
+            next_cursor = CursorService.encode_cursor(contacts[-1].created_at, contacts[-1].id)
 
-        # Get total count after stage filter
-        total = len(filtered_contacts)
+        return contacts, total, next_cursor
 
-        # Apply pagination to filtered results
-        offset = (page - 1) * limit
-        contacts = filtered_contacts[offset:offset + limit]
+    @staticmethod
+    def suggest_contacts(
+        db: DBSession,
+        user_id: int,
+        prefix: str,
+        limit: int = 10
+    ) -> list:
+        """
+        Get typeahead suggestions for contacts matching a prefix.
 
-        return contacts, total
+        Selects only the columns needed for suggestions and never touches
+        activities. Matching uses the contacts_fts prefix index, which is
+        lowercased and accent-folded.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            prefix: Text typed so far (word prefixes across name, email, company)
+            limit: Maximum number of suggestions (max 25)
+
+        Returns:
+            List of rows with id, name, email and company, ordered by name
+        """
+        limit = min(limit, 25)
+
+        if not prefix.strip():
+            return []
+
+        return db.query(
+            Contact.id,
+            Contact.name,
+            Contact.email,
+            Contact.company
+        ).filter(
+            Contact.user_id == user_id,
+            ContactService._search_filter(db, prefix)
+        ).order_by(
+            Contact.name,
+            Contact.id
+        ).limit(limit).all()
 
     @staticmethod
     def update_contact(
@@ -225,33 +380,25 @@ class ContactService:
         Returns:
             Dictionary with active_stages, passive_stages, active_count, passive_count
         """
-        # Get all contacts for the user with optional search filter
-        contacts = db.query(Contact).filter(Contact.user_id == user_id)
-
-        # Apply search filter if provided
-        if search:
-            search_term = f"%{search.lower()}%"
-            contacts = contacts.filter(
-                or_(
-                    func.lower(Contact.name).like(search_term),
-                    func.lower(Contact.email).like(search_term),
-                    func.lower(Contact.company).like(search_term)
-                )
-            )
-
-        contacts = contacts.all()
+        # Count contacts per materialized current stage in a single GROUP BY
+        stage_rows = ContactService._build_contacts_query(
+            db, user_id, search
+        ).with_entities(
+            Contact.current_pipeline_stage,
+            func.count(Contact.id)
+        ).group_by(
+            Contact.current_pipeline_stage
+        ).all()
 
         # Initialize stage counts
         active_stages = {stage: 0 for stage in ContactService.ACTIVE_STAGES}
         passive_stages = {stage: 0 for stage in ContactService.PASSIVE_STAGES}
 
-        # Count contacts by their current pipeline stage
-        for contact in contacts:
-            current_stage = contact.current_pipeline_stage
+        for current_stage, count in stage_rows:
             if current_stage in active_stages:
-                active_stages[current_stage] += 1
+                active_stages[current_stage] = count
             elif current_stage in passive_stages:
-                passive_stages[current_stage] += 1
+                passive_stages[current_stage] = count
 
         # Calculate totals
         active_count = sum(active_stages.values())
@@ -281,53 +428,120 @@ class ContactService:
         Returns:
             Dictionary with stage_counts and activity_type_counts
         """
-        # Get all contacts for the user with optional search filter
-        contacts_query = db.query(Contact).filter(Contact.user_id == user_id)
+        contacts_query = ContactService._build_contacts_query(db, user_id, search)
 
-        # Apply search filter if provided
-        if search:
-            search_term = f"%{search.lower()}%"
-            contacts_query = contacts_query.filter(
-                or_(
-                    func.lower(Contact.name).like(search_term),
-                    func.lower(Contact.email).like(search_term),
-                    func.lower(Contact.company).like(search_term)
-                )
-            )
-
-        contacts = contacts_query.all()
+        # Count contacts per materialized current stage in a single GROUP BY
+        stage_rows = contacts_query.with_entities(
+            Contact.current_pipeline_stage,
+            func.count(Contact.id)
+        ).group_by(
+            Contact.current_pipeline_stage
+        ).all()
 
-        # Initialize stage counts with all possible stages
+        # Keep known stages only; stages with zero counts are omitted
         all_stages = ContactService.ACTIVE_STAGES + ContactService.PASSIVE_STAGES
-        stage_counts = {stage: 0 for stage in all_stages}
-
-        # Get contact IDs for activity filtering
-        contact_ids = [contact.id for contact in contacts]
-
-        # Count contacts by their current pipeline stage
-        for contact in contacts:
-            current_stage = contact.current_pipeline_stage
-            if current_stage in stage_counts:
-                stage_counts[current_stage] += 1
-
-        # Get activity type counts for the filtered contacts
-        activity_type_counts = {}
-        if contact_ids:
-            activity_counts = (
-                db.query(Activity.type, func.count(Activity.id))
-                .filter(Activity.contact_id.in_(contact_ids))
-                .group_by(Activity.type)
-                .all()
-            )
+        stage_counts = {
+            stage: count for stage, count in stage_rows
+            if stage in all_stages and count > 0
+        }
+
+        if stage_rows:
+            # Count activity types by joining the same filtered contacts in SQL
+            activity_counts = contacts_query.join(
+                Activity, Activity.contact_id == Contact.id
+            ).with_entities(
+                Activity.type,
+                func.count(Activity.id)
+            ).group_by(
+                Activity.type
+            ).all()
             activity_type_counts = {activity_type: count for activity_type, count in activity_counts}
         else:
             # If no contacts match, return empty activity counts
             activity_type_counts = {"Call": 0, "Meeting": 0, "Email": 0, "Note": 0}
 
-        # Remove stages with zero counts for cleaner response
-        stage_counts = {stage: count for stage, count in stage_counts.items() if count > 0}
-
         return {
             "stage_counts": stage_counts,
             "activity_type_counts": activity_type_counts
         }
+
+    # Async counterparts for the async read handlers (ASYNC_DB_ENABLED). They
+    # run the sync query code above on an AsyncSession's connection, so the
+    # database I/O awaits aiosqlite instead of blocking a threadpool worker.
+
+    @staticmethod
+    async def get_contact_by_id_async(
+        db: AsyncSession,
+        contact_id: int,
+        user_id: int
+    ) -> Optional[Contact]:
+        """
+        Async counterpart of get_contact_by_id.
+
+        Args:
+            db: Async database session
+            contact_id: Contact ID
+            user_id: User ID for ownership verification
+
+        Returns:
+            Contact object if found and owned by user, None otherwise
+        """
+        return await db.run_sync(ContactService.get_contact_by_id, contact_id, user_id)
+
+    @staticmethod
+    async def get_contacts_for_user_async(
+        db: AsyncSession,
+        user_id: int,
+        page: int = 1,
+        limit: int = 50,
+        search: Optional[str] = None,
+        stage: Optional[str] = None
+    ) -> Tuple[list[Contact], int]:
+        """
+        Async counterpart of get_contacts_for_user.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            page: Page number (1-indexed)
+            limit: Items per page (max 100)
+            search: Optional search term (searches name, email, company)
+            stage: Optional pipeline stage filter
+
+        Returns:
+            Tuple of (list of contacts, total count)
+        """
+        return await db.run_sync(
+            ContactService.get_contacts_for_user, user_id, page, limit, search, stage
+        )
+
+    @staticmethod
+    async def get_contacts_after_cursor_async(
+        db: AsyncSession,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        search: Optional[str] = None,
+        stage: Optional[str] = None
+    ) -> Tuple[list[Contact], Optional[int], Optional[str]]:
+        """
+        Async counterpart of get_contacts_after_cursor.
+
+        Args:
+            db: Async database session
+            user_id: User ID
+            cursor: Cursor from a previous page's next_cursor (None for first page)
+            limit: Items per page (max 100)
+            search: Optional search term (searches name, email, company)
+            stage: Optional pipeline stage filter
+
+        Returns:
+            Tuple of (list of contacts, total count or None after the first
+            page, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return await db.run_sync(
+            ContactService.get_contacts_after_cursor, user_id, cursor, limit, search, stage
+        )
@@ -0,0 +1,76 @@
+"""Opaque cursor encoding for keyset pagination."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import and_, or_
+
+
+class CursorService:
+    """Service for encoding, decoding and applying keyset pagination cursors."""
+
+    @staticmethod
+    def encode_cursor(sort_value: datetime, row_id: int) -> str:
+        """
+        Encode a sort key into an opaque, URL-safe cursor token.
+
+        Args:
+            sort_value: Timestamp of the last row on the current page
+            row_id: ID of the last row on the current page (tie-breaker)
+
+        Returns:
+            URL-safe cursor string
+        """
+        payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        """
+        Decode a cursor token back into its sort key.
+
+        Args:
+            cursor: Cursor string previously returned as next_cursor
+
+        Returns:
+            Tuple of (sort value, row ID)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return datetime.fromisoformat(sort_value), int(row_id)
+        except (TypeError, ValueError, UnicodeError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    @staticmethod
+    def apply_cursor(query, sort_column, id_column, cursor: str):
+        """
+        Restrict a descending (sort_column, id_column) query to rows after a cursor.
+
+        Args:
+            query: SQLAlchemy query ordered by sort_column desc, id_column desc
+            sort_column: Timestamp column the listing is sorted by
+            id_column: Primary key column used as tie-breaker
+            cursor: Cursor string previously returned as next_cursor
+
+        Returns:
+            Filtered query
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        sort_value, row_id = CursorService.decode_cursor(cursor)
+        return query.filter(
+            # Redundant with the OR below, but a plain range SQLite can seek
+            # an index on (sort_column, id_column) with
+            sort_column <= sort_value,
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            )
+        )
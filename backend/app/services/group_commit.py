@@ -0,0 +1,165 @@
+"""Group-commit writer that batches single-row inserts into shared transactions."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session as DBSession
+
+from app.config import settings
+from app.database import Base, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+InsertFactory = Callable[[], Base]
+
+
+class GroupCommitWriter:
+    """
+    Batches inserts from concurrent requests into one transaction.
+
+    Callers hand over a factory that builds a new ORM instance; a single
+    writer thread collects the factories that arrive within window_ms (up to
+    max_batch), inserts them in one transaction and commits once, so a burst
+    of N inserts costs one commit instead of N. Each caller blocks until its
+    batch commits and receives its own row ID.
+
+    If a batch fails, its inserts are retried one transaction each, so only
+    the offending insert raises. Callers must not hold an open write
+    transaction while waiting, since the writer needs the write lock.
+    """
+
+    def __init__(self, session_factory: Callable[[], DBSession], window_ms: float, max_batch: int):
+        """
+        Initialize the writer (the thread starts on first use).
+
+        Args:
+            session_factory: Factory for the writer thread's database sessions
+            window_ms: How long to wait for more inserts after the first one
+            max_batch: Maximum inserts per transaction
+        """
+        self.session_factory = session_factory
+        self.window_seconds = window_ms / 1000
+        self.max_batch = max_batch
+        self.batches = 0
+        self.inserts = 0
+        self._queue: "queue.Queue[Optional[Tuple[InsertFactory, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether services should route inserts through the writer."""
+        return settings.GROUP_COMMIT_ENABLED
+
+    def insert(self, factory: InsertFactory) -> int:
+        """
+        Insert a row as part of the next group commit.
+
+        Args:
+            factory: Callable returning a new, transient ORM instance
+
+        Returns:
+            Primary key of the inserted row
+
+        Raises:
+            Exception: Whatever the insert raised (e.g. IntegrityError)
+        """
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((factory, future))
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Commit queued inserts and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def stats(self) -> dict:
+        """
+        Get writer counters.
+
+        Returns:
+            Dictionary with batches, inserts, average batch size and queue depth
+        """
+        return {
+            "batches": self.batches,
+            "inserts": self.inserts,
+            "avg_batch_size": self.inserts / self.batches if self.batches else 0.0,
+            "queued": self._queue.qsize()
+        }
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            job = self._queue.get()
+            if job is None:
+                break
+
+            batch = [job]
+            deadline = time.monotonic() + self.window_seconds
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch: List[Tuple[InsertFactory, Future]]) -> None:
+        try:
+            ids = self._insert_all([factory for factory, _ in batch])
+        except Exception:
+            logger.warning("Group commit of %d inserts failed; retrying individually", len(batch))
+            for factory, future in batch:
+                try:
+                    future.set_result(self._insert_all([factory])[0])
+                except Exception as e:
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.inserts += len(batch)
+        for (_, future), row_id in zip(batch, ids):
+            future.set_result(row_id)
+
+    def _insert_all(self, factories: List[InsertFactory]) -> List[int]:
+        db = self.session_factory()
+        try:
+            instances = [factory() for factory in factories]
+            db.add_all(instances)
+            db.flush()
+            ids = [instance.id for instance in instances]
+            db.commit()
+            return ids
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+group_commit = GroupCommitWriter(
+    session_factory=SessionLocal,
+    window_ms=settings.GROUP_COMMIT_WINDOW_MS,
+    max_batch=settings.GROUP_COMMIT_MAX_BATCH
+)
@@ -0,0 +1,318 @@
+"""In-process metrics exported at /metrics in the Prometheus text format."""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import async_engine, engine, pool_status, read_engine
+from app.services.auth_cache import auth_cache
+from app.services.password_service import PasswordService
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name -> (type, help text)
+METRICS = {
+    "simplecrm_http_requests_total": ("counter", "HTTP requests by route and status"),
+    "simplecrm_http_request_duration_seconds": (
+        "histogram", "Time until the response starts, by route and status"
+    ),
+    "simplecrm_attachment_bytes_total": ("counter", "Attachment bytes uploaded (in) and downloaded (out)"),
+    "simplecrm_db_pool_connections": ("gauge", "Database pool connections by engine and state"),
+    "simplecrm_db_pool_checkouts_total": ("counter", "Database pool checkouts by engine"),
+    "simplecrm_db_pool_checkout_timeouts_total": ("counter", "Database pool checkouts that timed out"),
+    "simplecrm_auth_cache_lookups_total": ("counter", "Auth cache lookups by result"),
+    "simplecrm_auth_cache_hit_ratio": ("gauge", "Auth cache hits / lookups"),
+    "simplecrm_auth_cache_entries": ("gauge", "Sessions held in the auth cache"),
+    "simplecrm_password_pool_tasks": ("gauge", "bcrypt tasks by state (in_flight, queued)"),
+    "simplecrm_password_pool_rejected_total": ("counter", "bcrypt tasks rejected because the queue was full"),
+    "simplecrm_session_rows": ("gauge", "Rows in the sessions table by state"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Labels, float]
+
+
+def _labels(**labels) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class MetricsRegistry:
+    """
+    Counters and latency histograms updated by the request path.
+
+    Gauges (pool usage, cache and bcrypt queue state) are read from their
+    owners when a snapshot is taken. With METRICS_MULTIPROC_DIR set, every
+    worker writes its snapshot to <dir>/<pid>.json and /metrics sums the
+    samples of all workers; gauges of workers that have exited are dropped,
+    their counters are kept.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Metric name (a counter in METRICS)
+            amount: Increment
+            **labels: Label values
+        """
+        key = (name, _labels(**labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """
+        Count a request and record its latency.
+
+        Args:
+            method: HTTP method
+            route: Route path template
+            status: Response status code
+            seconds: Time until the response started
+        """
+        labels = _labels(method=method, route=route, status=status)
+        with self._lock:
+            key = ("simplecrm_http_requests_total", labels)
+            self._counters[key] = self._counters.get(key, 0) + 1
+            # Per-bucket counts, then sum; made cumulative when rendered
+            histogram = self._histograms.setdefault(labels, [0] * (len(LATENCY_BUCKETS) + 2))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    histogram[index] += 1
+                    break
+            else:
+                histogram[len(LATENCY_BUCKETS)] += 1
+            histogram[-1] += seconds
+
+    def clear(self) -> None:
+        """Drop all counters and histograms."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Get this process's samples.
+
+        Returns:
+            dict: pid, counters and gauges as [name, labels, value] lists and
+                histograms as [labels, bucket counts + sum]
+        """
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [[list(labels), list(values)] for labels, values in self._histograms.items()]
+
+        gauges = []
+        for name, labels, value in collect_process_samples():
+            if METRICS[name][0] == "counter":
+                counters.append([name, list(labels), value])
+            else:
+                gauges.append([name, list(labels), value])
+
+        return {"pid": os.getpid(), "counters": counters, "gauges": gauges, "histograms": histograms}
+
+    def write_snapshot(self, directory: str) -> None:
+        """
+        Atomically write this process's snapshot for the other workers.
+
+        Args:
+            directory: Shared metrics directory
+        """
+        path = Path(directory) / f"{os.getpid()}.json"
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self.snapshot()))
+        os.replace(temp_path, path)
+
+    def collect(self, extra: Iterable[Sample] = ()) -> str:
+        """
+        Render all workers' metrics in the Prometheus text format.
+
+        Args:
+            extra: Process-independent samples (e.g. session table size)
+
+        Returns:
+            str: Exposition text
+        """
+        directory = settings.METRICS_MULTIPROC_DIR
+        if directory:
+            self.write_snapshot(directory)
+            snapshots = _read_snapshots(directory)
+        else:
+            snapshots = [self.snapshot()]
+        return render(snapshots, extra)
+
+
+def collect_process_samples() -> List[Sample]:
+    """Read the gauges and counters owned by other components of this process."""
+    samples: List[Sample] = []
+
+    engines = {"write": engine, "read": read_engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    for name, bind in engines.items():
+        if bind is None:
+            continue
+        status = pool_status(bind)
+        if "size" in status:
+            samples += [
+                ("simplecrm_db_pool_connections", _labels(engine=name, state="checked_out"), status["checked_out"]),
+                ("simplecrm_db_pool_connections", _labels(engine=name, state="idle"), status["checked_in"]),
+                ("simplecrm_db_pool_connections", _labels(engine=name, state="overflow"), status["overflow"]),
+                ("simplecrm_db_pool_connections", _labels(engine=name, state="size"), status["size"]),
+            ]
+        if "checkouts" in status:
+            samples += [
+                ("simplecrm_db_pool_checkouts_total", _labels(engine=name), status["checkouts"]),
+                ("simplecrm_db_pool_checkout_timeouts_total", _labels(engine=name), status["timeouts"]),
+            ]
+
+    cache = auth_cache.stats()
+    samples += [
+        ("simplecrm_auth_cache_lookups_total", _labels(result="hit"), cache["hits"]),
+        ("simplecrm_auth_cache_lookups_total", _labels(result="miss"), cache["misses"]),
+        ("simplecrm_auth_cache_entries", (), cache["size"]),
+    ]
+
+    queue = PasswordService.queue_stats()
+    samples += [
+        ("simplecrm_password_pool_tasks", _labels(state="in_flight"), queue["in_flight"]),
+        ("simplecrm_password_pool_tasks", _labels(state="queued"), queue["queued"]),
+        ("simplecrm_password_pool_rejected_total", (), queue["rejected"]),
+    ]
+
+    return samples
+
+
+def _read_snapshots(directory: str) -> List[dict]:
+    """Load every worker's snapshot, dropping gauges of exited workers."""
+    snapshots = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable metrics snapshot %s", path)
+            continue
+        if not _process_alive(snapshot.get("pid")):
+            snapshot["gauges"] = []
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def _process_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    labels = list(labels)
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(snapshots: List[dict], extra: Iterable[Sample] = ()) -> str:
+    """
+    Sum worker snapshots and render them in the Prometheus text format.
+
+    Args:
+        snapshots: Snapshots from MetricsRegistry.snapshot()
+        extra: Samples added once (not per worker)
+
+    Returns:
+        str: Exposition text ending in a newline
+    """
+    samples: Dict[str, Dict[Labels, float]] = {name: {} for name in METRICS}
+    histograms: Dict[Labels, List[float]] = {}
+
+    def add(name, labels, value):
+        labels = tuple(tuple(pair) for pair in labels)
+        samples[name][labels] = samples[name].get(labels, 0) + value
+
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"] + snapshot["gauges"]:
+            add(name, labels, value)
+        for labels, values in snapshot["histograms"]:
+            labels = tuple(tuple(pair) for pair in labels)
+            merged = histograms.setdefault(labels, [0] * len(values))
+            histograms[labels] = [total + value for total, value in zip(merged, values)]
+    for name, labels, value in extra:
+        add(name, labels, value)
+
+    lookups = samples["simplecrm_auth_cache_lookups_total"]
+    hits = lookups.get(_labels(result="hit"), 0)
+    total = hits + lookups.get(_labels(result="miss"), 0)
+    samples["simplecrm_auth_cache_hit_ratio"][()] = hits / total if total else 0.0
+
+    lines = []
+    for name, (metric_type, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        if metric_type == "histogram":
+            for labels, values in sorted(histograms.items()):
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), values):
+                    cumulative += count
+                    bucket_labels = labels + (("le", str(bound)),)
+                    lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+            continue
+        for labels, value in sorted(samples[name].items()):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+async def run_metrics_writer(interval_seconds: float) -> None:
+    """
+    Periodically write this worker's snapshot to METRICS_MULTIPROC_DIR.
+
+    Errors are logged and the next write is attempted on schedule.
+
+    Args:
+        interval_seconds: Delay between writes
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(metrics.write_snapshot, settings.METRICS_MULTIPROC_DIR)
+        except Exception:
+            logger.exception("Metrics snapshot write failed")
+
+
+metrics = MetricsRegistry()
@@ -1,26 +1,59 @@
 """Password hashing and verification service."""
 
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
 import bcrypt
 
+from app.config import settings
+
+
+class PasswordQueueFullError(RuntimeError):
+    """Raised when the password hashing queue is at capacity."""
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    """Hash a password (module-level so process pools can pickle it)."""
+    salt = bcrypt.gensalt(rounds=rounds)
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password (module-level so process pools can pickle it)."""
+    return bcrypt.checkpw(
+        plain_password.encode('utf-8'),
+        hashed_password.encode('utf-8')
+    )
+
 
 class PasswordService:
     """Service for handling password hashing and verification."""
 
+    _executor: Optional[Executor] = None
+    _lock = threading.Lock()
+    _pending = 0
+    _completed = 0
+    _rejected = 0
+
     @staticmethod
     def hash_password(password: str) -> str:
         """
         Hash a plain text password using bcrypt.
 
+        Uses the cost factor configured in settings.PASSWORD_BCRYPT_ROUNDS.
+
         Args:
             password: Plain text password to hash
 
         Returns:
             Hashed password as string
         """
-        # Generate salt with 12 rounds and hash password
-        salt = bcrypt.gensalt(rounds=12)
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return _hash_password(password, settings.PASSWORD_BCRYPT_ROUNDS)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -36,7 +69,170 @@ class PasswordService:
         Returns:
             True if passwords match, False otherwise
         """
-        return bcrypt.checkpw(
-            plain_password.encode('utf-8'),
-            hashed_password.encode('utf-8')
+        return _verify_password(plain_password, hashed_password)
+
+    @staticmethod
+    def get_rounds(hashed_password: str) -> Optional[int]:
+        """
+        Read the cost factor from a bcrypt hash.
+
+        Args:
+            hashed_password: bcrypt hash in modular crypt format ($2b$12$...)
+
+        Returns:
+            Cost factor, or None if the hash is not in a recognised format
+        """
+        parts = hashed_password.split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a stored hash uses a different cost than configured.
+
+        Args:
+            hashed_password: Stored bcrypt hash
+
+        Returns:
+            True if the hash should be replaced on next successful login
+        """
+        return PasswordService.get_rounds(hashed_password) != settings.PASSWORD_BCRYPT_ROUNDS
+
+    @staticmethod
+    def measure_hash_time(rounds: int, samples: int = 3) -> float:
+        """
+        Measure the median time to hash a password at a given cost on this host.
+
+        Args:
+            rounds: bcrypt cost factor to measure
+            samples: Number of hashes to time
+
+        Returns:
+            Median hash time in milliseconds
+        """
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            _hash_password("calibration-password", rounds)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hash a password on the dedicated password worker pool.
+
+        Args:
+            password: Plain text password to hash
+
+        Returns:
+            Hashed password as string
+
+        Raises:
+            PasswordQueueFullError: If too many password operations are queued
+        """
+        return await PasswordService._run(
+            _hash_password, password, settings.PASSWORD_BCRYPT_ROUNDS
         )
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the dedicated password worker pool.
+
+        Args:
+            plain_password: Plain text password to verify
+            hashed_password: Hashed password to compare against
+
+        Returns:
+            True if passwords match, False otherwise
+
+        Raises:
+            PasswordQueueFullError: If too many password operations are queued
+        """
+        return await PasswordService._run(_verify_password, plain_password, hashed_password)
+
+    @staticmethod
+    async def _run(func, *args):
+        """
+        Submit password work to the bounded executor and await the result.
+
+        Keeps bcrypt off the request threadpool so a burst of logins cannot
+        starve other endpoints, and rejects work beyond the configured queue
+        depth instead of letting latency grow without bound.
+
+        A job's slot is released when the job finishes, not when the awaiting
+        request does: a cancelled request whose bcrypt is already running
+        keeps counting against the queue depth until the worker is free.
+        """
+        with PasswordService._lock:
+            capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+            if PasswordService._pending >= capacity:
+                PasswordService._rejected += 1
+                raise PasswordQueueFullError("Password hashing queue is full")
+            PasswordService._pending += 1
+
+        try:
+            future = PasswordService._get_executor().submit(func, *args)
+        except BaseException:
+            PasswordService._release(None)
+            raise
+
+        future.add_done_callback(PasswordService._release)
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def _release(future: Optional[Future]) -> None:
+        """Free a job's queue slot (the job future's done callback)."""
+        with PasswordService._lock:
+            PasswordService._pending -= 1
+            if future is not None and not future.cancelled():
+                PasswordService._completed += 1
+
+    @staticmethod
+    def _get_executor() -> Executor:
+        """Create the password executor on first use."""
+        with PasswordService._lock:
+            if PasswordService._executor is None:
+                if settings.PASSWORD_HASH_EXECUTOR == "process":
+                    PasswordService._executor = ProcessPoolExecutor(
+                        max_workers=settings.PASSWORD_HASH_WORKERS
+                    )
+                else:
+                    PasswordService._executor = ThreadPoolExecutor(
+                        max_workers=settings.PASSWORD_HASH_WORKERS,
+                        thread_name_prefix="password"
+                    )
+            return PasswordService._executor
+
+    @staticmethod
+    def shutdown_executor() -> None:
+        """Shut down the password executor (called on application shutdown)."""
+        with PasswordService._lock:
+            executor, PasswordService._executor = PasswordService._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def queue_stats() -> dict:
+        """
+        Get password worker pool metrics.
+
+        Returns:
+            Dictionary with executor, workers, in_flight, queued, max_queue,
+            completed and rejected counts
+        """
+        with PasswordService._lock:
+            workers = settings.PASSWORD_HASH_WORKERS
+            pending = PasswordService._pending
+            return {
+                "executor": settings.PASSWORD_HASH_EXECUTOR,
+                "workers": workers,
+                "in_flight": min(pending, workers),
+                "queued": max(pending - workers, 0),
+                "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+                "completed": PasswordService._completed,
+                "rejected": PasswordService._rejected
+            }
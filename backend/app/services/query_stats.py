@@ -0,0 +1,211 @@
+"""Per-request SQL statement counting, N+1 detection and slow-query logging."""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Dedicated logger so slow queries can be routed to their own file
+slow_query_logger = logging.getLogger("app.slow_queries")
+
+# Collapses whitespace and expanded IN lists so repeats share one pattern
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def statement_pattern(statement: str) -> str:
+    """
+    Normalize a SQL statement into the pattern used to detect repeats.
+
+    Bound parameters are already placeholders, so a lazy load issued once
+    per row produces the same pattern every time.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        str: Statement with whitespace collapsed and IN lists shortened to (?)
+    """
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def redact_parameters(parameters, executemany: bool = False) -> str:
+    """
+    Describe bound parameters without their values.
+
+    Args:
+        parameters: DBAPI parameters (sequence, mapping, or list of either)
+        executemany: Whether parameters holds one set per row
+
+    Returns:
+        str: Parameter types, e.g. "(int, str)", or the row count for executemany
+    """
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    return "(" + ", ".join(type(value).__name__ for value in parameters or ()) + ")"
+
+
+class RequestQueryStats:
+    """SQL statements executed while handling one request."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.patterns: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Record one executed statement and how long it took."""
+        self.statements += 1
+        self.db_seconds += seconds
+        self.patterns[statement_pattern(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Get the statement patterns executed at least threshold times.
+
+        Args:
+            threshold: Minimum number of executions
+
+        Returns:
+            List of (pattern, count), most repeated first
+        """
+        return [
+            (pattern, count) for pattern, count in self.patterns.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("query_stats", default=None)
+
+
+class QueryRecorder:
+    """
+    Times every statement on instrumented engines.
+
+    Statements run while a request scope is open (see scope()) count towards
+    that request's RequestQueryStats; the scope is a context variable, so it
+    follows the request into threadpool handlers and async sessions. Any
+    statement slower than SLOW_QUERY_MS is written to the app.slow_queries
+    log with its bound parameters redacted, inside a request or not.
+    """
+
+    def __init__(self):
+        """Initialize the recorder (engines are instrumented with install())."""
+        self.slow_queries = 0
+        self.n_plus_one_warnings = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether statements are timed at all."""
+        return settings.QUERY_STATS_ENABLED
+
+    def install(self, bind: Engine) -> None:
+        """Register the recorder's cursor events on an engine."""
+        event.listen(bind, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(bind, "after_cursor_execute", self._after_cursor_execute)
+
+    @contextmanager
+    def scope(self, label: str) -> Iterator[RequestQueryStats]:
+        """
+        Collect the statements of one request.
+
+        Logs a warning when a statement pattern repeats at least
+        QUERY_N_PLUS_ONE_THRESHOLD times, the signature of a lazy load in a loop.
+
+        Args:
+            label: Request description used in log messages (e.g. "GET /api/contacts")
+
+        Yields:
+            RequestQueryStats: Counters filled in as statements run
+        """
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            _current_stats.reset(token)
+            self._check_repeats(label, stats)
+
+    def _check_repeats(self, label: str, stats: RequestQueryStats) -> None:
+        threshold = settings.QUERY_N_PLUS_ONE_THRESHOLD
+        if threshold <= 0:
+            return
+        for pattern, count in stats.repeated(threshold):
+            with self._lock:
+                self.n_plus_one_warnings += 1
+            logger.warning(
+                "Possible N+1 in %s: statement ran %d times (%d statements, %.1f ms total): %s",
+                label, count, stats.statements, stats.db_seconds * 1000, pattern
+            )
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_started", None)
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+
+        threshold_ms = settings.SLOW_QUERY_MS
+        if threshold_ms > 0 and seconds * 1000 >= threshold_ms:
+            with self._lock:
+                self.slow_queries += 1
+            slow_query_logger.warning(
+                "Slow query (%.1f ms): %s params=%s",
+                seconds * 1000,
+                statement_pattern(statement),
+                redact_parameters(parameters, executemany)
+            )
+
+    def stats(self) -> dict:
+        """
+        Get process-wide counters.
+
+        Returns:
+            dict: enabled, slow_queries and n_plus_one_warnings
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "slow_queries": self.slow_queries,
+                "n_plus_one_warnings": self.n_plus_one_warnings
+            }
+
+
+def configure_slow_query_log(path: Optional[str]) -> None:
+    """
+    Write the slow-query log to its own file.
+
+    Args:
+        path: Log file path (None or empty keeps the default application log)
+    """
+    if not path:
+        return
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.propagate = False
+
+
+query_recorder = QueryRecorder()
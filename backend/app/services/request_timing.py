@@ -0,0 +1,225 @@
+"""Per-request phase timing and per-route latency histograms."""
+
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+# Mantissa bits kept per power of two: values are recorded with a relative
+# error below 2 ** -(SUB_BUCKET_BITS - 1), i.e. under 1.6%
+SUB_BUCKET_BITS = 7
+
+# Percentiles reported by LatencyHistogram.summary()
+PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram with log-linear buckets.
+
+    Values are recorded in microseconds. Below 2 ** SUB_BUCKET_BITS every
+    value has its own bucket; above that each power of two is split into
+    2 ** (SUB_BUCKET_BITS - 1) buckets, so memory grows with the logarithm
+    of the range while percentiles keep a bounded relative error. Buckets
+    are stored sparsely.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+        self._buckets: Dict[int, int] = defaultdict(int)
+
+    @staticmethod
+    def _bucket(value: int) -> int:
+        """Map a value to its bucket key (keys sort like the values)."""
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+    @staticmethod
+    def _highest_equivalent(key: int) -> int:
+        """Get the largest value that falls into a bucket."""
+        shift = key >> SUB_BUCKET_BITS
+        mantissa = key & ((1 << SUB_BUCKET_BITS) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample."""
+        value = max(int(seconds * 1_000_000), 0)
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self._buckets[self._bucket(value)] += 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in milliseconds (0.0 for an empty histogram)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen >= rank:
+                return min(self._highest_equivalent(key), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> dict:
+        """
+        Summarize the histogram.
+
+        Returns:
+            dict: count, mean_ms, p50_ms, p90_ms, p99_ms and max_ms
+        """
+        summary = {
+            "count": self.count,
+            "mean_ms": self.total_us / self.count / 1000 if self.count else 0.0
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent}_ms"] = self.percentile(percent)
+        summary["max_ms"] = self.max_us / 1000
+        return summary
+
+
+class RequestTiming:
+    """Phase durations of one request, reported in its Server-Timing header."""
+
+    def __init__(self):
+        """Start timing a request."""
+        self.started = time.perf_counter()
+        self.route: Optional[str] = None
+        self.handler_finished: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+        self.descriptions: Dict[str, str] = {}
+
+    def add(self, phase: str, seconds: float, description: Optional[str] = None) -> None:
+        """Add time to a phase (phases entered several times accumulate)."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        if description is not None:
+            self.descriptions[phase] = description
+
+    def finish(self) -> None:
+        """Close the request's timing when the response starts."""
+        now = time.perf_counter()
+        if self.handler_finished is not None:
+            self.add("serialize", now - self.handler_finished)
+        self.phases["total"] = now - self.started
+
+    def header_value(self) -> str:
+        """
+        Render the phases as a Server-Timing header value.
+
+        Returns:
+            str: e.g. 'total;dur=12.5, db;dur=3.1;desc="4 queries"'
+        """
+        entries = []
+        for phase, seconds in self.phases.items():
+            entry = f"{phase};dur={seconds * 1000:.1f}"
+            if phase in self.descriptions:
+                entry += f';desc="{self.descriptions[phase]}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Get the timing of the request being handled, if any."""
+    return _current_timing.get()
+
+
+@contextmanager
+def timing_scope() -> Iterator[RequestTiming]:
+    """
+    Time one request.
+
+    Yields:
+        RequestTiming: Filled in by timed_phase() and the timed route class
+    """
+    timing = RequestTiming()
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+@contextmanager
+def timed_phase(phase: str) -> Iterator[None]:
+    """
+    Attribute the enclosed block's duration to a phase of the current request.
+
+    Does nothing outside a request.
+
+    Args:
+        phase: Server-Timing metric name (e.g. "auth")
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started)
+
+
+class RouteLatency:
+    """In-memory latency histograms per route and phase, per worker process."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._histograms: Dict[Tuple[str, str], Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, timing: RequestTiming) -> None:
+        """
+        Record a finished request's phases.
+
+        Args:
+            method: HTTP method
+            route: Route path template (e.g. /api/contacts/{contact_id})
+            timing: The request's timing
+        """
+        with self._lock:
+            histograms = self._histograms.setdefault((method, route), {})
+            for phase, seconds in timing.phases.items():
+                if phase not in histograms:
+                    histograms[phase] = LatencyHistogram()
+                histograms[phase].record(seconds)
+
+    def snapshot(self) -> dict:
+        """
+        Summarize every route's histograms.
+
+        Returns:
+            dict: "METHOD /route" -> phase -> LatencyHistogram.summary()
+        """
+        with self._lock:
+            return {
+                f"{method} {route}": {
+                    phase: histogram.summary() for phase, histogram in histograms.items()
+                }
+                for (method, route), histograms in sorted(self._histograms.items())
+            }
+
+    def clear(self) -> None:
+        """Drop all histograms."""
+        with self._lock:
+            self._histograms.clear()
+
+
+route_latency = RouteLatency()
@@ -0,0 +1,43 @@
+"""Full-text search helpers shared by contact and activity search."""
+
+import re
+from typing import Optional
+
+from sqlalchemy.orm import Session as DBSession
+
+
+class SearchService:
+    """Service for building SQLite FTS5 queries."""
+
+    @staticmethod
+    def build_fts_match(search: str) -> Optional[str]:
+        """
+        Convert a free-text search term into an FTS5 MATCH expression.
+
+        Each word becomes a quoted prefix query, so "acme co" matches rows
+        containing words starting with "acme" and "co". Quoting keeps FTS5
+        operators in user input from being interpreted.
+
+        Args:
+            search: Raw search term
+
+        Returns:
+            MATCH expression, or None if the term contains no word characters
+        """
+        tokens = re.findall(r"\w+", search.lower())
+        if not tokens:
+            return None
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    @staticmethod
+    def fts_available(db: DBSession) -> bool:
+        """
+        Check whether the session's database supports the FTS5 indexes.
+
+        Args:
+            db: Database session
+
+        Returns:
+            True for SQLite, False for dialects that use the LIKE fallback
+        """
+        return db.get_bind().dialect.name == "sqlite"
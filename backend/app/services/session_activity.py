@@ -0,0 +1,161 @@
+"""Sliding session expiry with buffered, batched renewals."""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session as DBSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.session import Session
+from app.services.auth_cache import auth_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SessionActivityBuffer:
+    """
+    In-memory buffer of session "last seen" times awaiting renewal.
+
+    Authenticated requests record activity only for sessions whose remaining
+    lifetime has dropped below the renewal threshold, so most requests never
+    touch the buffer. A periodic flush extends every buffered session to
+    last_seen + duration with a single executemany UPDATE, instead of one
+    write per request. The buffer is per process; a session seen by several
+    workers is simply renewed by whichever flushes last.
+    """
+
+    def __init__(self, duration_days: float, renew_threshold_seconds: float):
+        """
+        Initialize the buffer.
+
+        Args:
+            duration_days: Session lifetime granted on renewal
+            renew_threshold_seconds: Renew once remaining lifetime drops below
+                this many seconds (0 disables sliding expiry)
+        """
+        self.duration = timedelta(days=duration_days)
+        self.renew_threshold = timedelta(seconds=renew_threshold_seconds)
+        self.flushed = 0
+        self._pending: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether sessions are renewed at all."""
+        return self.renew_threshold > timedelta(0)
+
+    def touch(self, token: str, expires_at: datetime, now: Optional[datetime] = None) -> bool:
+        """
+        Record activity on a session if it is due for renewal.
+
+        Args:
+            token: Session token
+            expires_at: Session's current expiry (UTC)
+            now: Time of the activity (defaults to utcnow)
+
+        Returns:
+            True if the session was queued for renewal
+        """
+        if not self.enabled:
+            return False
+
+        now = now or datetime.utcnow()
+        if expires_at - now >= self.renew_threshold:
+            return False
+
+        with self._lock:
+            self._pending[token] = now
+        return True
+
+    def pending_count(self) -> int:
+        """Number of sessions waiting to be renewed."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, db: DBSession) -> int:
+        """
+        Write all buffered renewals in one batched UPDATE.
+
+        Expiry only ever moves forward, and unknown or deleted tokens are
+        ignored by the WHERE clause. Cached expiries of the renewed sessions
+        are moved forward too, so cache hits stop queueing them again.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of sessions submitted for renewal
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        statement = update(Session).where(
+            Session.session_token == bindparam("b_token"),
+            Session.expires_at < bindparam("b_expires_at")
+        ).values(expires_at=bindparam("b_expires_at"))
+
+        params = [
+            {"b_token": token, "b_expires_at": last_seen + self.duration}
+            for token, last_seen in pending.items()
+        ]
+
+        try:
+            db.connection().execute(statement, params)
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Keep the renewals for the next attempt unless newer ones exist
+            with self._lock:
+                for token, last_seen in pending.items():
+                    self._pending.setdefault(token, last_seen)
+            raise
+
+        for param in params:
+            auth_cache.extend_expiry(param["b_token"], param["b_expires_at"])
+
+        self.flushed += len(params)
+        return len(params)
+
+
+def flush_session_activity() -> int:
+    """
+    Flush the process-wide buffer using a dedicated database session.
+
+    Returns:
+        Number of sessions submitted for renewal
+    """
+    db = SessionLocal()
+    try:
+        return session_activity.flush(db)
+    finally:
+        db.close()
+
+
+async def run_session_activity_flusher(interval_seconds: float) -> None:
+    """
+    Periodically flush buffered session renewals until cancelled.
+
+    Args:
+        interval_seconds: Delay between flushes
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(flush_session_activity)
+        except Exception:
+            logger.exception("Session activity flush failed")
+
+
+session_activity = SessionActivityBuffer(
+    duration_days=settings.SESSION_DURATION_DAYS,
+    renew_threshold_seconds=settings.SESSION_RENEW_THRESHOLD_HOURS * 3600
+)
@@ -2,11 +2,17 @@
 
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 
+from app.config import settings
 from app.models.session import Session
+from app.models.user import User
+from app.services.auth_cache import auth_cache
+from app.services.signed_token_service import SignedTokenService
 
 
 class SessionService:
@@ -31,6 +37,12 @@ class SessionService:
         """
         Create a new session for a user.
 
+        With settings.SESSION_TOKEN_MODE == "signed" a signed token is issued
+        instead and the returned Session is transient (not persisted).
+
+        If the user would exceed settings.MAX_SESSIONS_PER_USER live sessions,
+        their oldest sessions are deleted in the same transaction.
+
         Args:
             db: Database session
             user_id: ID of the user
@@ -39,6 +51,15 @@ class SessionService:
         Returns:
             Created Session object
         """
+        if settings.SESSION_TOKEN_MODE == "signed":
+            token, claims = SignedTokenService.issue_token(user_id, duration_days)
+            return Session(
+                session_token=token,
+                user_id=user_id,
+                expires_at=claims.expires_at,
+                created_at=claims.issued_at
+            )
+
         # Generate unique token
         token = SessionService.generate_token()
 
@@ -53,11 +74,55 @@ class SessionService:
         )
 
         db.add(session)
+        db.flush()
+
+        evicted = SessionService._evict_oldest_sessions(
+            db, user_id, settings.MAX_SESSIONS_PER_USER
+        )
+
         db.commit()
         db.refresh(session)
 
+        if evicted:
+            # At most max_sessions remain, so the tokens to keep cached are
+            # a bounded read however many sessions were evicted
+            kept = db.query(Session.session_token).filter(Session.user_id == user_id).all()
+            auth_cache.invalidate_user(user_id, keep={row.session_token for row in kept})
+
         return session
 
+    @staticmethod
+    def _evict_oldest_sessions(db: DBSession, user_id: int, max_sessions: int) -> int:
+        """
+        Delete a user's sessions beyond the newest max_sessions (no commit).
+
+        One DELETE keyed on the newest sessions' ids, so an account with any
+        number of stale sessions is trimmed without loading them.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+            max_sessions: Number of sessions to keep (0 or less keeps all)
+
+        Returns:
+            Number of sessions deleted
+        """
+        if max_sessions <= 0:
+            return 0
+
+        # Derived table: MySQL rejects LIMIT directly inside IN (...)
+        newest = select(Session.id).where(
+            Session.user_id == user_id
+        ).order_by(
+            Session.created_at.desc(),
+            Session.id.desc()
+        ).limit(max_sessions).subquery()
+
+        return db.query(Session).filter(
+            Session.user_id == user_id,
+            Session.id.notin_(select(newest.c.id))
+        ).delete(synchronize_session=False)
+
     @staticmethod
     def validate_session(db: DBSession, token: str) -> Optional[Session]:
         """
@@ -83,6 +148,37 @@ class SessionService:
 
         return session
 
+    @staticmethod
+    def validate_session_with_user(
+        db: DBSession,
+        token: str
+    ) -> Optional[Tuple[Session, User]]:
+        """
+        Validate a session token and load its user in a single query.
+
+        The expiry check runs in SQL, so expired or unknown tokens and their
+        users are resolved with one round trip.
+
+        Args:
+            db: Database session
+            token: Session token to validate
+
+        Returns:
+            Tuple of (Session, User) if valid and not expired, None otherwise
+        """
+        result = db.query(Session, User).join(
+            User, Session.user_id == User.id
+        ).filter(
+            Session.session_token == token,
+            Session.expires_at > datetime.utcnow()
+        ).first()
+
+        if not result:
+            return None
+
+        session, user = result
+        return session, user
+
     @staticmethod
     def delete_session(db: DBSession, token: str) -> bool:
         """
@@ -106,3 +202,112 @@ class SessionService:
         db.commit()
 
         return True
+
+    @staticmethod
+    def delete_all_sessions(db: DBSession, user_id: int) -> int:
+        """
+        Delete every session belonging to a user with one set-based DELETE.
+
+        Rows are matched through the user_id index and never loaded into the
+        ORM, so the cost does not grow with per-row Python work.
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+
+        Returns:
+            Number of sessions deleted
+        """
+        count = db.query(Session).filter(
+            Session.user_id == user_id
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        return count
+
+    @staticmethod
+    def purge_expired_sessions(
+        db: DBSession,
+        batch_size: int = 1000,
+        max_batches: Optional[int] = None
+    ) -> int:
+        """
+        Delete expired sessions in bounded batches.
+
+        Each batch selects the oldest expired rows through the expires_at
+        index and commits on its own, so the write lock is released between
+        batches and concurrent logins are not blocked for the whole sweep.
+
+        Args:
+            db: Database session
+            batch_size: Maximum rows deleted per batch
+            max_batches: Stop after this many batches (None = until none remain)
+
+        Returns:
+            Number of sessions deleted
+        """
+        now = datetime.utcnow()
+        deleted = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            expired_ids = select(Session.id).where(
+                Session.expires_at <= now
+            ).order_by(Session.expires_at).limit(batch_size)
+
+            count = db.query(Session).filter(
+                Session.id.in_(expired_ids)
+            ).delete(synchronize_session=False)
+            db.commit()
+
+            deleted += count
+            batches += 1
+            if count < batch_size:
+                break
+
+        return deleted
+
+    @staticmethod
+    def count_sessions(db: DBSession) -> int:
+        """
+        Count all rows in the sessions table, expired or not.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of sessions
+        """
+        return db.query(Session).count()
+
+    @staticmethod
+    def count_expired_sessions(db: DBSession) -> int:
+        """
+        Count sessions that have expired but not yet been purged.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of expired sessions
+        """
+        return db.query(Session).filter(
+            Session.expires_at <= datetime.utcnow()
+        ).count()
+
+    @staticmethod
+    async def validate_session_with_user_async(
+        db: AsyncSession,
+        token: str
+    ) -> Optional[Tuple[Session, User]]:
+        """
+        Async counterpart of validate_session_with_user.
+
+        Args:
+            db: Async database session
+            token: Session token to validate
+
+        Returns:
+            Tuple of (Session, User) if valid and not expired, None otherwise
+        """
+        return await db.run_sync(SessionService.validate_session_with_user, token)
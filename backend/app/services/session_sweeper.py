@@ -0,0 +1,52 @@
+"""Background deletion of expired sessions."""
+
+import asyncio
+import logging
+
+from starlette.concurrency import run_in_threadpool
+
+from app.database import SessionLocal
+from app.services.session_service import SessionService
+from app.services.token_revocation import TokenRevocationList
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_expired_sessions(batch_size: int) -> int:
+    """
+    Delete all expired sessions and token revocations using a dedicated
+    database session.
+
+    Args:
+        batch_size: Maximum rows deleted per batch
+
+    Returns:
+        Number of sessions deleted
+    """
+    db = SessionLocal()
+    try:
+        TokenRevocationList.purge_expired(db)
+        return SessionService.purge_expired_sessions(db, batch_size=batch_size)
+    finally:
+        db.close()
+
+
+async def run_session_sweeper(interval_seconds: float, batch_size: int) -> None:
+    """
+    Periodically purge expired sessions until cancelled.
+
+    Runs the blocking sweep on the threadpool so the event loop keeps serving
+    requests. Errors are logged and the next sweep is attempted on schedule.
+
+    Args:
+        interval_seconds: Delay between sweeps
+        batch_size: Maximum rows deleted per batch
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            deleted = await run_in_threadpool(sweep_expired_sessions, batch_size)
+            if deleted:
+                logger.info("Session sweeper deleted %d expired sessions", deleted)
+        except Exception:
+            logger.exception("Session sweep failed")
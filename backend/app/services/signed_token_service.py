@@ -0,0 +1,137 @@
+"""Stateless HMAC-signed session tokens."""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional, Tuple
+
+from app.config import settings
+
+# Prefix distinguishing signed tokens from random database session tokens
+TOKEN_PREFIX = "st1"
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class TokenClaims(NamedTuple):
+    """Claims carried by a signed session token."""
+
+    user_id: int
+    issued_at: datetime
+    expires_at: datetime
+    jti: str
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode((data + "=" * (-len(data) % 4)).encode("ascii"))
+
+
+class SignedTokenService:
+    """Service for issuing and verifying signed session tokens."""
+
+    @staticmethod
+    def is_signed_token(token: str) -> bool:
+        """
+        Check whether a token uses the signed format.
+
+        Database session tokens are URL-safe base64 without dots, so the two
+        formats can be told apart without a lookup.
+
+        Args:
+            token: Session token
+
+        Returns:
+            True if the token should be verified as a signed token
+        """
+        return token.startswith(TOKEN_PREFIX + ".")
+
+    @staticmethod
+    def issue_token(user_id: int, duration_days: int = 7) -> Tuple[str, TokenClaims]:
+        """
+        Issue a signed token for a user.
+
+        Args:
+            user_id: ID of the user
+            duration_days: Token lifetime in days (default: 7)
+
+        Returns:
+            Tuple of (token string, claims)
+        """
+        issued_ms = int(time.time() * 1000)
+        expires_s = issued_ms // 1000 + int(timedelta(days=duration_days).total_seconds())
+        jti = secrets.token_urlsafe(12)
+
+        payload = json.dumps(
+            {"sub": user_id, "iat": issued_ms, "exp": expires_s, "jti": jti},
+            separators=(",", ":")
+        )
+        body = f"{TOKEN_PREFIX}.{_b64encode(payload.encode('utf-8'))}"
+        token = f"{body}.{SignedTokenService._sign(body)}"
+
+        claims = TokenClaims(
+            user_id=user_id,
+            issued_at=EPOCH + timedelta(milliseconds=issued_ms),
+            expires_at=EPOCH + timedelta(seconds=expires_s),
+            jti=jti
+        )
+        return token, claims
+
+    @staticmethod
+    def verify_token(token: str) -> Optional[TokenClaims]:
+        """
+        Verify a signed token's signature and expiry without database access.
+
+        Revocation is checked separately against the revocation list.
+
+        Args:
+            token: Signed token string
+
+        Returns:
+            TokenClaims if the signature is valid and the token has not
+            expired, None otherwise
+        """
+        # Base64url and the prefix are ASCII; anything else is malformed and
+        # would make encoding or compare_digest raise
+        if not token.isascii():
+            return None
+
+        body, _, signature = token.rpartition(".")
+        if not body.startswith(TOKEN_PREFIX + "."):
+            return None
+
+        if not hmac.compare_digest(signature, SignedTokenService._sign(body)):
+            return None
+
+        try:
+            payload = json.loads(_b64decode(body[len(TOKEN_PREFIX) + 1:]))
+            claims = TokenClaims(
+                user_id=int(payload["sub"]),
+                issued_at=EPOCH + timedelta(milliseconds=int(payload["iat"])),
+                expires_at=EPOCH + timedelta(seconds=int(payload["exp"])),
+                jti=str(payload["jti"])
+            )
+        except (KeyError, TypeError, ValueError, UnicodeError):
+            return None
+
+        if claims.expires_at <= datetime.utcnow():
+            return None
+
+        return claims
+
+    @staticmethod
+    def _sign(body: str) -> str:
+        """HMAC-SHA256 of the token body with settings.SECRET_KEY."""
+        digest = hmac.new(
+            settings.SECRET_KEY.encode("utf-8"),
+            body.encode("ascii"),
+            hashlib.sha256
+        ).digest()
+        return _b64encode(digest)
@@ -0,0 +1,192 @@
+"""Revocation list for signed session tokens."""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as DBSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.token_revocation import TokenRevocation
+from app.services.signed_token_service import TokenClaims
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    """
+    In-memory view of persisted token revocations.
+
+    Checked on every signed-token request, so lookups are dictionary hits.
+    Revocations made in this process apply immediately; other workers pick
+    them up on their next periodic reload from the token_revocations table.
+    Only unexpired revocations are kept, which bounds the set by the number
+    of logouts and password changes within one token lifetime.
+    """
+
+    def __init__(self):
+        """Initialize an empty revocation list."""
+        self._jtis: dict[str, datetime] = {}
+        self._user_cutoffs: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def is_revoked(self, claims: TokenClaims) -> bool:
+        """
+        Check whether a verified token has been revoked.
+
+        Args:
+            claims: Claims of a token with a valid signature
+
+        Returns:
+            True if the token was revoked individually or issued before its
+            user's revocation cutoff
+        """
+        with self._lock:
+            if claims.jti in self._jtis:
+                return True
+            cutoff = self._user_cutoffs.get(claims.user_id)
+        return cutoff is not None and claims.issued_at < cutoff
+
+    def revoke_token(self, db: DBSession, jti: str, expires_at: datetime) -> None:
+        """
+        Revoke a single token (e.g. on logout).
+
+        Args:
+            db: Database session
+            jti: Token ID
+            expires_at: Token expiry; the revocation is dropped after it
+        """
+        if not db.query(TokenRevocation.id).filter(TokenRevocation.jti == jti).first():
+            db.add(TokenRevocation(jti=jti, expires_at=expires_at))
+            try:
+                db.commit()
+            except IntegrityError:
+                # A concurrent logout with the same token revoked it first
+                db.rollback()
+
+        with self._lock:
+            self._jtis[jti] = expires_at
+
+    def revoke_user(self, db: DBSession, user_id: int) -> None:
+        """
+        Revoke every token issued to a user until now (e.g. on password change).
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+        """
+        cutoff = datetime.utcnow()
+        db.add(TokenRevocation(
+            user_id=user_id,
+            revoked_before=cutoff,
+            expires_at=cutoff + timedelta(days=settings.SESSION_DURATION_DAYS)
+        ))
+        db.commit()
+
+        with self._lock:
+            self._user_cutoffs[user_id] = max(cutoff, self._user_cutoffs.get(user_id, cutoff))
+
+    def load(self, db: DBSession) -> int:
+        """
+        Replace the in-memory list with the unexpired persisted revocations.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of revocations loaded
+        """
+        rows = db.query(
+            TokenRevocation.jti,
+            TokenRevocation.user_id,
+            TokenRevocation.revoked_before,
+            TokenRevocation.expires_at
+        ).filter(TokenRevocation.expires_at > datetime.utcnow()).all()
+
+        jtis: dict[str, datetime] = {}
+        user_cutoffs: dict[int, datetime] = {}
+        for row in rows:
+            if row.jti is not None:
+                jtis[row.jti] = row.expires_at
+            elif row.user_id is not None and row.revoked_before is not None:
+                previous = user_cutoffs.get(row.user_id)
+                if previous is None or row.revoked_before > previous:
+                    user_cutoffs[row.user_id] = row.revoked_before
+
+        with self._lock:
+            self._jtis = jtis
+            self._user_cutoffs = user_cutoffs
+
+        return len(rows)
+
+    @staticmethod
+    def purge_expired(db: DBSession) -> int:
+        """
+        Delete revocations whose tokens have expired anyway.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of revocations deleted
+        """
+        count = db.query(TokenRevocation).filter(
+            TokenRevocation.expires_at <= datetime.utcnow()
+        ).delete(synchronize_session=False)
+        db.commit()
+        return count
+
+    def clear(self) -> None:
+        """Drop all in-memory revocations."""
+        with self._lock:
+            self._jtis.clear()
+            self._user_cutoffs.clear()
+
+    def stats(self) -> dict:
+        """
+        Get revocation list size.
+
+        Returns:
+            Dictionary with revoked token and revoked user counts
+        """
+        with self._lock:
+            return {
+                "tokens": len(self._jtis),
+                "users": len(self._user_cutoffs)
+            }
+
+
+def reload_token_revocations() -> int:
+    """
+    Reload the process-wide revocation list using a dedicated database session.
+
+    Returns:
+        Number of revocations loaded
+    """
+    db = SessionLocal()
+    try:
+        return token_revocations.load(db)
+    finally:
+        db.close()
+
+
+async def run_revocation_refresher(interval_seconds: float) -> None:
+    """
+    Periodically reload revocations made by other workers until cancelled.
+
+    Args:
+        interval_seconds: Delay between reloads
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(reload_token_revocations)
+        except Exception:
+            logger.exception("Token revocation reload failed")
+
+
+token_revocations = TokenRevocationList()
@@ -6,7 +6,9 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session as DBSession
 
 from app.models.user import User
+from app.services.auth_cache import auth_cache
 from app.services.password_service import PasswordService
+from app.services.token_revocation import token_revocations
 
 
 class UserService:
@@ -54,7 +56,8 @@ class UserService:
         Args:
             db: Database session
             user_id: User ID to update
-            update_data: Dictionary of fields to update
+            update_data: Dictionary of fields to update (full_name, email, and
+                either password or a pre-computed hashed_password)
 
         Returns:
             Updated User object
@@ -83,8 +86,18 @@ class UserService:
             user.hashed_password = PasswordService.hash_password(
                 update_data["password"]
             )
+        elif "hashed_password" in update_data:
+            # Already hashed by the caller (e.g. on the password worker pool)
+            user.hashed_password = update_data["hashed_password"]
 
         db.commit()
         db.refresh(user)
 
+        # A new password invalidates every signed token issued so far
+        if "password" in update_data or "hashed_password" in update_data:
+            token_revocations.revoke_user(db, user_id)
+
+        # Cached snapshots of this user are now stale
+        auth_cache.invalidate_user(user_id)
+
         return user
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Write-throughput benchmark for SimpleCRM activity inserts.
+
+Inserts activities from concurrent threads into a throwaway SQLite database,
+once committing every row on its own (the default code path) and once
+through the group-commit writer (GROUP_COMMIT_ENABLED=true), and prints
+rows per second and latency for both. The database uses the same pragma
+profile and write serialization as the application.
+
+Usage:
+    python backend/scripts/benchmark_writes.py
+    python backend/scripts/benchmark_writes.py --rows 5000 --threads 32 --synchronous FULL
+
+Exit Codes:
+    0 - Success: Benchmark completed
+    1 - Error: Invalid arguments or database error
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.database import WriteSerializer, apply_sqlite_pragmas
+from app.models import Activity, Base, Contact, User
+from app.services.group_commit import GroupCommitWriter
+
+
+def run_workload(insert, rows: int, threads: int) -> dict:
+    """
+    Insert rows from concurrent threads and time each insert.
+
+    Args:
+        insert: Callable inserting one activity for a given sequence number
+        rows: Total rows to insert
+        threads: Number of concurrent writer threads
+
+    Returns:
+        Dictionary with elapsed seconds, rows per second and latency percentiles (ms)
+    """
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(start: int):
+        own = []
+        for i in range(start, rows, threads):
+            began = time.perf_counter()
+            insert(i)
+            own.append((time.perf_counter() - began) * 1000)
+        with lock:
+            latencies.extend(own)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "rows_per_second": rows / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1]
+    }
+
+
+def main():
+    """Main entry point for the write benchmark script."""
+    parser = argparse.ArgumentParser(
+        description='Compare per-row commits with group commit for activity inserts',
+        epilog='Example: python backend/scripts/benchmark_writes.py --rows 5000 --threads 32'
+    )
+    parser.add_argument('--rows', type=int, default=2000, help='Activities inserted per mode (default: 2000)')
+    parser.add_argument('--threads', type=int, default=16, help='Concurrent writer threads (default: 16)')
+    parser.add_argument(
+        '--window-ms',
+        type=float,
+        default=settings.GROUP_COMMIT_WINDOW_MS,
+        help=f'Group commit window (default: {settings.GROUP_COMMIT_WINDOW_MS})'
+    )
+    parser.add_argument(
+        '--max-batch',
+        type=int,
+        default=settings.GROUP_COMMIT_MAX_BATCH,
+        help=f'Group commit batch limit (default: {settings.GROUP_COMMIT_MAX_BATCH})'
+    )
+    parser.add_argument(
+        '--synchronous',
+        choices=['OFF', 'NORMAL', 'FULL'],
+        default=settings.SQLITE_SYNCHRONOUS.upper(),
+        help=f'SQLite synchronous pragma (default: {settings.SQLITE_SYNCHRONOUS})'
+    )
+
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.threads < 1 or args.max_batch < 1 or args.window_ms < 0:
+        print("Error: --rows, --threads and --max-batch must be positive, --window-ms non-negative",
+              file=sys.stderr)
+        sys.exit(1)
+
+    settings.SQLITE_SYNCHRONOUS = args.synchronous
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(
+            f"sqlite:///{Path(directory) / 'benchmark.db'}",
+            connect_args={"check_same_thread": False},
+            pool_size=args.threads + 1
+        )
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+        WriteSerializer(settings.SQLITE_WRITER_TIMEOUT_SECONDS).install(engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        try:
+            Base.metadata.create_all(bind=engine)
+            db = SessionLocal()
+            user = User(email="bench@example.com", full_name="Benchmark", hashed_password="x")
+            db.add(user)
+            db.flush()
+            contact = Contact(name="Benchmark Contact", email="contact@example.com", user_id=user.id)
+            db.add(contact)
+            db.commit()
+            contact_id = contact.id
+            db.close()
+        except Exception as e:
+            print("Error: Failed to prepare benchmark database", file=sys.stderr)
+            print(f"Details: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+
+        def build_activity(i: int) -> Activity:
+            return Activity(
+                contact_id=contact_id,
+                type="Note",
+                subject=f"Benchmark activity {i}",
+                activity_date=datetime.utcnow(),
+                pipeline_stage="Lead"
+            )
+
+        def insert_per_row(i: int) -> None:
+            db = SessionLocal()
+            try:
+                db.add(build_activity(i))
+                db.commit()
+            finally:
+                db.close()
+
+        writer = GroupCommitWriter(SessionLocal, window_ms=args.window_ms, max_batch=args.max_batch)
+
+        def insert_group_commit(i: int) -> None:
+            writer.insert(lambda: build_activity(i))
+
+        print(f"Inserting {args.rows} activities from {args.threads} threads "
+              f"(synchronous={args.synchronous}, window={args.window_ms} ms, max batch={args.max_batch})")
+        print()
+        print(f"  {'Mode':<14}{'Rows/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+
+        results = {}
+        for name, insert in (("per-row", insert_per_row), ("group commit", insert_group_commit)):
+            results[name] = run_workload(insert, args.rows, args.threads)
+            r = results[name]
+            print(f"  {name:<14}{r['rows_per_second']:>10.0f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+
+        writer.shutdown()
+        engine.dispose()
+
+    stats = writer.stats()
+    speedup = results["group commit"]["rows_per_second"] / results["per-row"]["rows_per_second"]
+    print()
+    print(f"Group commit: {stats['batches']} transactions, "
+          f"{stats['avg_batch_size']:.1f} rows each, {speedup:.1f}x throughput")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
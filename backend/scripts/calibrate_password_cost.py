@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Admin tool for calibrating the bcrypt cost factor for SimpleCRM.
+
+This script times password hashing on the current host at a range of bcrypt
+cost factors and recommends the highest cost whose hash time stays within a
+target latency. Set the result as PASSWORD_BCRYPT_ROUNDS; existing users are
+moved to the new cost transparently on their next successful login.
+
+Usage:
+    python backend/scripts/calibrate_password_cost.py --target-ms 250
+
+Requirements:
+    - Run on the same hardware class that serves production traffic
+    - No database access is needed
+
+Exit Codes:
+    0 - Success: Recommendation printed
+    1 - Error: Invalid arguments
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.services.password_service import PasswordService
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def recommend_rounds(target_ms: float, min_rounds: int, max_rounds: int, samples: int) -> int:
+    """
+    Find the highest bcrypt cost whose median hash time fits the target.
+
+    Each extra round doubles the work, so measurement stops as soon as a
+    cost exceeds the target.
+
+    Args:
+        target_ms: Target hash time in milliseconds
+        min_rounds: Lowest cost to consider
+        max_rounds: Highest cost to consider
+        samples: Hashes timed per cost
+
+    Returns:
+        int: Recommended cost factor (min_rounds if even that exceeds the target)
+    """
+    recommended = min_rounds
+
+    print(f"{'Cost':>6}  {'Median ms':>10}")
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed_ms = PasswordService.measure_hash_time(rounds, samples)
+        marker = "  (configured)" if rounds == settings.PASSWORD_BCRYPT_ROUNDS else ""
+        print(f"{rounds:>6}  {elapsed_ms:>10.1f}{marker}")
+
+        if elapsed_ms > target_ms:
+            break
+        recommended = rounds
+
+    return recommended
+
+
+def main():
+    """Main entry point for the calibration script."""
+    parser = argparse.ArgumentParser(
+        description='Measure bcrypt hash time on this host and recommend PASSWORD_BCRYPT_ROUNDS',
+        epilog='Example: python backend/scripts/calibrate_password_cost.py --target-ms 250'
+    )
+    parser.add_argument(
+        '--target-ms',
+        type=float,
+        default=250.0,
+        help='Target time for a single hash in milliseconds (default: 250)'
+    )
+    parser.add_argument(
+        '--min-rounds',
+        type=int,
+        default=10,
+        help='Lowest cost factor to measure (default: 10)'
+    )
+    parser.add_argument(
+        '--max-rounds',
+        type=int,
+        default=16,
+        help='Highest cost factor to measure (default: 16)'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=3,
+        help='Hashes timed per cost factor (default: 3)'
+    )
+
+    args = parser.parse_args()
+
+    if args.target_ms <= 0:
+        print("Error: --target-ms must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    if not MIN_ROUNDS <= args.min_rounds <= args.max_rounds <= MAX_ROUNDS:
+        print(
+            f"Error: rounds must satisfy {MIN_ROUNDS} <= --min-rounds <= --max-rounds <= {MAX_ROUNDS}",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+    if args.samples < 1:
+        print("Error: --samples must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Target hash time: {args.target_ms:.0f} ms\n")
+    recommended = recommend_rounds(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+
+    print()
+    print(f"Recommended: PASSWORD_BCRYPT_ROUNDS={recommended}")
+    if recommended != settings.PASSWORD_BCRYPT_ROUNDS:
+        print(
+            f"Currently configured: {settings.PASSWORD_BCRYPT_ROUNDS}. "
+            "Stored hashes are rehashed at the new cost on next login."
+        )
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,11 +7,13 @@ user accounts and all associated data (sessions) from the database.
 
 Usage:
     python backend/scripts/delete_user.py --email user@example.com
+    python backend/scripts/delete_user.py --email user@example.com --sessions-only
 
 Requirements:
     - Database must be accessible via DATABASE_URL environment variable
     - User will be deleted immediately without confirmation prompt
     - All associated sessions will be deleted (cascade)
+    - With --sessions-only, the user is kept and only logged out everywhere
 
 Exit Codes:
     0 - Success: User deleted successfully
@@ -23,6 +25,7 @@ import sys
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -32,6 +35,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from app.config import settings
 from app.models.user import User
 from app.models.session import Session as SessionModel
+from app.services.auth_service import AuthService
+from app.services.user_service import UserService
 
 
 def validate_email_format(email: str) -> bool:
@@ -98,6 +103,28 @@ def delete_user_by_email(db: Session, email: str) -> bool:
     return True
 
 
+def revoke_user_sessions_by_email(db: Session, email: str) -> Optional[int]:
+    """
+    Log a user out everywhere without deleting the account.
+
+    Args:
+        db: SQLAlchemy database session
+        email: User's email address (case-insensitive)
+
+    Returns:
+        Optional[int]: Number of sessions deleted, or None if user not found
+
+    Raises:
+        Exception: If database operation fails
+    """
+    user = UserService.get_user_by_email(db, email)
+
+    if not user:
+        return None
+
+    return AuthService.logout_everywhere(db, user.id)
+
+
 def main():
     """Main entry point for the delete user script."""
     parser = argparse.ArgumentParser(
@@ -109,6 +136,11 @@ def main():
         required=True,
         help='Email address of the user to delete (case-insensitive)'
     )
+    parser.add_argument(
+        '--sessions-only',
+        action='store_true',
+        help='Keep the account and only revoke all of its sessions (log out everywhere)'
+    )
 
     args = parser.parse_args()
     email = args.email.strip()
@@ -133,6 +165,27 @@ def main():
         print(f"Details: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
+    # Revoke sessions only
+    if args.sessions_only:
+        try:
+            count = revoke_user_sessions_by_email(db, email)
+
+            if count is not None:
+                print(f"Success: Revoked {count} sessions for user '{email}'.")
+                sys.exit(0)
+            else:
+                print(f"Error: User with email '{email}' not found in database.", file=sys.stderr)
+                sys.exit(1)
+
+        except Exception as e:
+            db.rollback()
+            print(f"Error: Failed to revoke sessions for '{email}'", file=sys.stderr)
+            print(f"Details: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+
+        finally:
+            db.close()
+
     # Delete user
     try:
         success = delete_user_by_email(db, email)
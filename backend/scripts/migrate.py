@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Admin tool for applying SimpleCRM database migrations.
+
+The application checks the schema version on startup and, unless
+SCHEMA_AUTO_MIGRATE is false, applies pending migrations itself. Run this
+script before a rolling restart so that no worker has to migrate while
+others are serving traffic.
+
+Usage:
+    python backend/scripts/migrate.py
+    python backend/scripts/migrate.py --status
+
+Requirements:
+    - Database must be accessible via DATABASE_URL environment variable
+
+Exit Codes:
+    0 - Success: Schema is current (or status reported)
+    1 - Error: Database or migration error
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from app.config import settings
+from app.migrations.runner import SCHEMA_VERSION, get_schema_version, migrate, pending_migrations
+
+
+def main():
+    """Main entry point for the migrate script."""
+    parser = argparse.ArgumentParser(
+        description='Apply pending SimpleCRM database migrations',
+        epilog='Example: python backend/scripts/migrate.py --status'
+    )
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='Only report the schema version and pending migrations'
+    )
+
+    args = parser.parse_args()
+
+    # Connect to database
+    try:
+        engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+        )
+        version = get_schema_version(engine)
+    except Exception as e:
+        print(f"Error: Failed to connect to database", file=sys.stderr)
+        print(f"Database URL: {settings.DATABASE_URL}", file=sys.stderr)
+        print(f"Details: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.status:
+        current = "untracked" if version is None else version
+        print(f"Schema version: {current} (expected: {SCHEMA_VERSION})")
+        for migration_version, name in pending_migrations(version):
+            print(f"  pending {migration_version}: {name}")
+        sys.exit(0)
+
+    try:
+        applied = migrate(engine)
+    except Exception as e:
+        print("Error: Migration failed", file=sys.stderr)
+        print(f"Details: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    if applied:
+        print(f"Success: Recorded {len(applied)} migrations ({', '.join(applied)}).")
+    else:
+        print("Success: Schema is already current.")
+    print(f"Schema version: {SCHEMA_VERSION}")
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Admin tool for deleting expired sessions from SimpleCRM.
+
+The application purges expired sessions in the background every
+SESSION_SWEEP_INTERVAL_SECONDS. This script runs the same sweep on demand,
+e.g. after the sweeper was disabled or to reclaim space before a backup.
+
+Usage:
+    python backend/scripts/sweep_sessions.py
+    python backend/scripts/sweep_sessions.py --batch-size 500 --dry-run
+
+Requirements:
+    - Database must be accessible via DATABASE_URL environment variable
+
+Exit Codes:
+    0 - Success: Sweep completed (or dry run reported)
+    1 - Error: Database error or invalid input
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.services.session_service import SessionService
+from app.services.token_revocation import TokenRevocationList
+
+
+def main():
+    """Main entry point for the sweep sessions script."""
+    parser = argparse.ArgumentParser(
+        description='Delete expired sessions from SimpleCRM in bounded batches',
+        epilog='Example: python backend/scripts/sweep_sessions.py --batch-size 500'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=settings.SESSION_SWEEP_BATCH_SIZE,
+        help=f'Maximum sessions deleted per transaction (default: {settings.SESSION_SWEEP_BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Only report how many expired sessions would be deleted'
+    )
+
+    args = parser.parse_args()
+
+    if args.batch_size < 1:
+        print("Error: --batch-size must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    # Connect to database
+    try:
+        engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+        )
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = SessionLocal()
+    except Exception as e:
+        print(f"Error: Failed to connect to database", file=sys.stderr)
+        print(f"Database URL: {settings.DATABASE_URL}", file=sys.stderr)
+        print(f"Details: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.dry_run:
+            expired = SessionService.count_expired_sessions(db)
+            print(f"Dry run: {expired} expired sessions would be deleted.")
+            sys.exit(0)
+
+        deleted = SessionService.purge_expired_sessions(db, batch_size=args.batch_size)
+        revocations = TokenRevocationList.purge_expired(db)
+        print(f"Success: Deleted {deleted} expired sessions and {revocations} expired token revocations.")
+        sys.exit(0)
+
+    except Exception as e:
+        db.rollback()
+        print("Error: Failed to sweep expired sessions", file=sys.stderr)
+        print(f"Details: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
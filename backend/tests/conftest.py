@@ -0,0 +1,22 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from app.services.auth_cache import auth_cache
+from app.services.token_revocation import token_revocations
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    """Isolate tests from users cached by earlier tests' session tokens."""
+    auth_cache.clear()
+    yield
+    auth_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_revocations():
+    """Isolate tests from revocations recorded by earlier tests."""
+    token_revocations.clear()
+    yield
+    token_revocations.clear()
@@ -0,0 +1,135 @@
+"""Tests for the async read path (ASYNC_DB_ENABLED)."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import dependencies
+from app.config import settings
+from app.database import async_database_url
+from app.dependencies import get_current_user_async, use_async_handler
+from app.models import Activity, Base, Contact, User
+from app.services.activity_service import ActivityService
+from app.services.contact_service import ContactService
+from app.services.session_service import SessionService
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """Create a database file with one user, two contacts and an activity."""
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    db = sessionmaker(bind=engine)()
+    user = User(email="async@example.com", full_name="Async User", hashed_password="hashed")
+    db.add(user)
+    db.flush()
+    for name in ("Alice", "Bob"):
+        db.add(Contact(name=name, email=f"{name.lower()}@example.com", user_id=user.id))
+    db.flush()
+    db.add(Activity(
+        contact_id=1,
+        type="Call",
+        subject="Kickoff call",
+        activity_date=datetime.utcnow(),
+        pipeline_stage="Lead"
+    ))
+    db.commit()
+    db.close()
+    engine.dispose()
+    return path
+
+
+def _run_async(database_path, work):
+    """Run work(async_session) against the database file via aiosqlite."""
+    async def main():
+        engine = create_async_engine(async_database_url(f"sqlite:///{database_path}"))
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await work(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_async_database_url_uses_aiosqlite():
+    """Test SQLite URLs are mapped to the aiosqlite driver."""
+    assert async_database_url("sqlite:///./simplecrm.db") == "sqlite+aiosqlite:///./simplecrm.db"
+    assert async_database_url("postgresql+asyncpg://u@h/db") == "postgresql+asyncpg://u@h/db"
+
+
+def test_async_database_url_maps_server_drivers(monkeypatch):
+    """Test server URLs get their async driver, or a clear error without one."""
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", None)
+    assert async_database_url("postgresql://u:pw@h/db") == "postgresql+asyncpg://u:pw@h/db"
+    assert async_database_url("postgresql+psycopg2://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert async_database_url("mysql+pymysql://u@h/db") == "mysql+aiomysql://u@h/db"
+
+    with pytest.raises(ValueError, match="ASYNC_DATABASE_URL"):
+        async_database_url("oracle://u@h/db")
+
+    monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", "postgresql+psycopg://u@h/db")
+    assert async_database_url("oracle://u@h/db") == "postgresql+psycopg://u@h/db"
+
+
+def test_async_services_match_sync_results(database_path):
+    """Test the async service counterparts return the same rows as the sync ones."""
+    async def work(db):
+        contacts, total = await ContactService.get_contacts_for_user_async(db, 1)
+        contact = await ContactService.get_contact_by_id_async(db, 1, 1)
+        activities = await ActivityService.get_activities_for_contact_async(db, 1, 1)
+        activity = await ActivityService.get_activity_by_id_async(db, 1, 1)
+        other_user = await ActivityService.get_activity_by_id_async(db, 1, 2)
+        return contacts, total, contact, activities, activity, other_user
+
+    contacts, total, contact, activities, activity, other_user = _run_async(database_path, work)
+
+    assert total == 2
+    assert {c.name for c in contacts} == {"Alice", "Bob"}
+    assert contact.name == "Alice"
+    assert [a.subject for a in activities] == ["Kickoff call"]
+    assert activity.subject == "Kickoff call"
+    assert other_user is None
+
+
+def test_get_current_user_async_validates_session(database_path):
+    """Test the async auth dependency accepts live tokens and rejects unknown ones."""
+    engine = create_engine(f"sqlite:///{database_path}")
+    db = sessionmaker(bind=engine)()
+    token = SessionService.create_session(db, 1).session_token
+    db.close()
+    engine.dispose()
+
+    user = _run_async(
+        database_path, lambda adb: get_current_user_async(token=f"Bearer {token}", db=adb)
+    )
+    assert user.email == "async@example.com"
+
+    with pytest.raises(HTTPException) as exc_info:
+        _run_async(database_path, lambda adb: get_current_user_async(token="Bearer unknown", db=adb))
+    assert exc_info.value.status_code == 401
+
+
+def test_use_async_handler_switches_on_async_engine(monkeypatch):
+    """Test the sync handler is kept unless the async engine is configured."""
+    def list_items():
+        """List items."""
+
+    async def list_items_async():
+        pass
+
+    assert use_async_handler(list_items_async)(list_items) is list_items
+
+    monkeypatch.setattr(dependencies, "AsyncSessionLocal", object())
+    handler = use_async_handler(list_items_async)(list_items)
+
+    assert handler is list_items_async
+    assert handler.__name__ == "list_items"
+    assert handler.__doc__ == "List items."
@@ -1,13 +1,17 @@
 """Tests for authentication middleware."""
 
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi import HTTPException
 from sqlalchemy.orm import Session as DBSession
 
 from app.database import Base, SessionLocal, engine
 from app.dependencies import get_current_user, get_current_user_optional
+from app.models.session import Session
 from app.models.user import User
 from app.services.auth_service import AuthService
+from app.services.session_activity import SessionActivityBuffer
 from app.services.session_service import SessionService
 
 
@@ -99,3 +103,240 @@ def test_get_current_user_optional_returns_user_for_valid(db: DBSession, authent
 
     assert current_user is not None
     assert current_user.id == user.id
+
+
+def test_get_current_user_served_from_auth_cache(db: DBSession, authenticated_user):
+    """Test repeat authentication hits the cache until logout invalidates it."""
+    from sqlalchemy import event
+
+    from app.services.auth_cache import auth_cache
+
+    user, session = authenticated_user
+    token = f"Bearer {session.session_token}"
+
+    get_current_user(token=token, db=db)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        cached_user = get_current_user(token=token, db=db)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert cached_user.id == user.id
+    assert cached_user.email == user.email
+    assert statements == []
+    assert auth_cache.stats()["hits"] == 1
+
+    AuthService.logout(db, session.session_token)
+
+    with pytest.raises(HTTPException):
+        get_current_user(token=token, db=db)
+
+
+def test_update_user_invalidates_auth_cache(db: DBSession, authenticated_user):
+    """Test profile updates are visible on the next authenticated request."""
+    from app.services.user_service import UserService
+
+    user, session = authenticated_user
+    token = f"Bearer {session.session_token}"
+
+    get_current_user(token=token, db=db)
+    UserService.update_user(db, user.id, {"full_name": "Renamed User"})
+
+    assert get_current_user(token=token, db=db).full_name == "Renamed User"
+
+
+def test_sliding_expiry_buffers_and_batches_renewals(db: DBSession, monkeypatch):
+    """Test sessions near expiry are renewed by one batched flush, not per request."""
+    from sqlalchemy import event
+
+    buffer = SessionActivityBuffer(duration_days=7, renew_threshold_seconds=3 * 24 * 3600)
+    monkeypatch.setattr("app.dependencies.session_activity", buffer)
+
+    tokens = []
+    for i in range(3):
+        user, session = AuthService.register(
+            db,
+            full_name=f"Sliding {i}",
+            email=f"sliding{i}@example.com",
+            password="password123"
+        )
+        tokens.append(session.session_token)
+
+    # Two sessions are close to expiry, one is fresh
+    soon = datetime.utcnow() + timedelta(hours=1)
+    for token in tokens[:2]:
+        db.query(Session).filter(Session.session_token == token).update({"expires_at": soon})
+    db.commit()
+
+    for token in tokens:
+        get_current_user(token=f"Bearer {token}", db=db)
+        get_current_user(token=f"Bearer {token}", db=db)  # cache hit
+
+    assert buffer.pending_count() == 2
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        assert buffer.flush(db) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    assert buffer.pending_count() == 0
+
+    db.expire_all()
+    renewed = db.query(Session).filter(Session.session_token.in_(tokens[:2])).all()
+    assert len(renewed) == 2
+    for renewed_session in renewed:
+        assert renewed_session.expires_at > datetime.utcnow() + timedelta(days=6)
+
+    # The flush renews the cached expiries too, so cache hits stop queueing
+    for token in tokens:
+        get_current_user(token=f"Bearer {token}", db=db)
+
+    assert buffer.pending_count() == 0
+
+
+def test_sliding_expiry_disabled_with_zero_threshold():
+    """Test a zero threshold never queues renewals."""
+    buffer = SessionActivityBuffer(duration_days=7, renew_threshold_seconds=0)
+
+    assert buffer.touch("token", datetime.utcnow() + timedelta(minutes=1)) is False
+    assert buffer.pending_count() == 0
+
+
+def test_signed_tokens_verify_without_session_lookup(db: DBSession, monkeypatch):
+    """Test signed tokens authenticate with no sessions row and DB tokens still work."""
+    from sqlalchemy import event
+
+    from app.config import settings
+
+    db_user, db_session = AuthService.register(
+        db,
+        full_name="Database Token",
+        email="dbtoken@example.com",
+        password="password123"
+    )
+
+    monkeypatch.setattr(settings, "SESSION_TOKEN_MODE", "signed")
+    user, session = AuthService.login(db, email="dbtoken@example.com", password="password123")
+    signed_token = session.session_token
+
+    assert signed_token.startswith("st1.")
+    assert db.query(Session).filter(Session.session_token == signed_token).count() == 0
+
+    # First request loads the user once; repeats are pure in-memory checks
+    assert get_current_user(token=f"Bearer {signed_token}", db=db).id == user.id
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        assert get_current_user(token=f"Bearer {signed_token}", db=db).id == user.id
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert statements == []
+
+    # Existing database-backed tokens keep working in signed mode
+    assert get_current_user(token=f"Bearer {db_session.session_token}", db=db).id == db_user.id
+
+
+def test_signed_token_rejected_when_tampered_or_revoked(db: DBSession, monkeypatch):
+    """Test signed tokens fail on tampering, logout and password change."""
+    from app.config import settings
+    from app.services.token_revocation import TokenRevocationList
+    from app.services.user_service import UserService
+
+    monkeypatch.setattr(settings, "SESSION_TOKEN_MODE", "signed")
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 4)
+    user, session = AuthService.register(
+        db,
+        full_name="Signed User",
+        email="signed@example.com",
+        password="password123"
+    )
+    user_id = user.id
+    token = session.session_token
+
+    body, _, signature = token.rpartition(".")
+    tampered = f"{body}.{signature[:-2]}AA"
+    with pytest.raises(HTTPException):
+        get_current_user(token=f"Bearer {tampered}", db=db)
+
+    # Logout revokes only that token
+    _, other_session = AuthService.login(db, email="signed@example.com", password="password123")
+    assert AuthService.logout(db, token) is True
+    with pytest.raises(HTTPException):
+        get_current_user(token=f"Bearer {token}", db=db)
+    assert get_current_user(token=f"Bearer {other_session.session_token}", db=db).id == user_id
+
+    # Password change revokes every token issued before it
+    UserService.update_user(db, user_id, {"password": "newpassword123"})
+    with pytest.raises(HTTPException):
+        get_current_user(token=f"Bearer {other_session.session_token}", db=db)
+
+    _, fresh_session = AuthService.login(db, email="signed@example.com", password="newpassword123")
+    assert get_current_user(token=f"Bearer {fresh_session.session_token}", db=db).id == user_id
+
+    # Revocations are persisted for other workers and restarts
+    reloaded = TokenRevocationList()
+    assert reloaded.load(db) == 2
+    assert reloaded.stats() == {"tokens": 1, "users": 1}
+
+
+@pytest.mark.parametrize("token", ["st1.é.x", "st1.abc.é", "st1.é"])
+def test_non_ascii_signed_token_is_rejected_not_crashing(db: DBSession, token):
+    """Test malformed signed-looking tokens get a 401, not a server error."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {token}".encode("utf-8")}
+
+    assert client.get("/api/contacts", headers=headers).status_code == 401
+    assert client.post("/api/auth/logout", headers=headers).status_code == 401
+
+
+def test_concurrent_revocation_of_same_token_is_idempotent(db: DBSession):
+    """Test a second revocation racing past the existence check does not fail."""
+    from app.models.token_revocation import TokenRevocation
+    from app.services.token_revocation import TokenRevocationList
+
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    other = SessionLocal()
+    try:
+        # The other request inserted the jti after this one's existence check
+        other.add(TokenRevocation(jti="raced-jti", expires_at=expires_at))
+        revocations = TokenRevocationList()
+        original_query = db.query
+
+        def query_hiding_revocation(*entities):
+            query = original_query(*entities)
+            if entities == (TokenRevocation.id,):
+                other.commit()
+                return original_query(*entities).filter(TokenRevocation.id == -1)
+            return query
+
+        db.query = query_hiding_revocation
+        revocations.revoke_token(db, "raced-jti", expires_at)
+    finally:
+        other.close()
+        del db.query
+
+    assert db.query(TokenRevocation).filter(TokenRevocation.jti == "raced-jti").count() == 1
+    assert revocations.stats()["tokens"] == 1
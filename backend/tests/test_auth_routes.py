@@ -164,3 +164,41 @@ def test_logout_with_invalid_session(client: TestClient):
     )
 
     assert response.status_code == 401
+
+
+def test_logout_all_revokes_every_session(client: TestClient, db: DBSession):
+    """Test POST /api/auth/logout-all revokes all of the user's sessions."""
+    user, session = AuthService.register(
+        db,
+        full_name="Everywhere User",
+        email="everywhere@example.com",
+        password="password"
+    )
+    other_user, other_session = AuthService.register(
+        db,
+        full_name="Other User",
+        email="other@example.com",
+        password="password"
+    )
+    _, second_session = AuthService.login(db, email="everywhere@example.com", password="password")
+    tokens = [session.session_token, second_session.session_token]
+
+    # Warm the auth cache for both tokens
+    for token in tokens:
+        assert client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+    response = client.post(
+        "/api/auth/logout-all",
+        headers={"Authorization": f"Bearer {tokens[0]}"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["sessions_revoked"] == 2
+    for token in tokens:
+        assert client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+
+    # Other users are unaffected
+    assert client.get(
+        "/api/users/me",
+        headers={"Authorization": f"Bearer {other_session.session_token}"}
+    ).status_code == 200
@@ -1,8 +1,11 @@
 """Tests for AuthService."""
 
+import asyncio
+
 import pytest
 from sqlalchemy.orm import Session as DBSession
 
+from app.config import settings
 from app.database import Base, SessionLocal, engine
 from app.models.user import User
 from app.services.auth_service import AuthService
@@ -141,3 +144,47 @@ def test_logout_deletes_session(db: DBSession):
     from app.services.session_service import SessionService
     validated = SessionService.validate_session(db, token)
     assert validated is None
+
+
+def test_login_rehashes_password_when_cost_changes(db: DBSession, monkeypatch):
+    """Test login transparently rehashes a stored hash at the configured cost."""
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 4)
+    AuthService.register(
+        db,
+        full_name="Rehash User",
+        email="rehash@example.com",
+        password="password123"
+    )
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 5)
+
+    user, _ = AuthService.login(db, email="rehash@example.com", password="password123")
+
+    assert PasswordService.get_rounds(user.hashed_password) == 5
+    assert PasswordService.verify_password("password123", user.hashed_password)
+
+    # Async login leaves a hash at the configured cost untouched
+    stored_hash = user.hashed_password
+    user, _ = asyncio.run(
+        AuthService.login_async(db, email="rehash@example.com", password="password123")
+    )
+    assert user.hashed_password == stored_hash
+
+
+def test_login_async_rehashes_password_when_cost_changes(db: DBSession, monkeypatch):
+    """Test async login rehashes on the worker pool when the cost differs."""
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 5)
+    AuthService.register(
+        db,
+        full_name="Async Rehash",
+        email="asyncrehash@example.com",
+        password="password123"
+    )
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 4)
+
+    user, _ = asyncio.run(
+        AuthService.login_async(db, email="asyncrehash@example.com", password="password123")
+    )
+
+    db.expire_all()
+    assert PasswordService.get_rounds(user.hashed_password) == 4
+    assert PasswordService.verify_password("password123", user.hashed_password)
@@ -0,0 +1,239 @@
+"""Tests for batched, resumable migrations."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from app.config import settings
+from app.migrations import add_current_stage_to_contacts, batched, make_activity_subject_nullable
+from app.migrations.batched import BatchedMigration, backfill_in_batches, rebuild_table_in_batches
+from app.models import Activity, Base
+from app.models.activity import ACTIVITIES_FTS_DDL
+
+LEGACY_ACTIVITIES_SQL = """
+    CREATE TABLE activities (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        contact_id INTEGER NOT NULL,
+        type VARCHAR(50) NOT NULL,
+        subject VARCHAR(255) NOT NULL,
+        notes TEXT,
+        activity_date DATETIME NOT NULL,
+        pipeline_stage VARCHAR(50) NOT NULL DEFAULT 'Lead',
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL,
+        FOREIGN KEY(contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+    )
+"""
+
+
+@pytest.fixture
+def bind(tmp_path, monkeypatch):
+    """Create a populated database that migrations also connect to."""
+    url = f"sqlite:///{tmp_path / 'batched.db'}"
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+    monkeypatch.setattr(settings, "BACKFILL_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "BACKFILL_PAUSE_MS", 1)
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (id, email, full_name, hashed_password, created_at, updated_at) "
+            "VALUES (1, 'u@example.com', 'User', 'x', :now, :now)"
+        ), {"now": now})
+        for i in range(1, 6):
+            conn.execute(text(
+                "INSERT INTO contacts (id, name, email, user_id, pipeline_stage, "
+                "current_pipeline_stage, created_at, updated_at) "
+                "VALUES (:i, :name, :email, 1, 'Lead', 'Lead', :now, :now)"
+            ), {"i": i, "name": f"Contact {i}", "email": f"c{i}@example.com", "now": now})
+            conn.execute(text(
+                "INSERT INTO activities (id, contact_id, type, subject, activity_date, "
+                "pipeline_stage, created_at, updated_at) "
+                "VALUES (:i, :i, 'Call', :subject, :now, 'Client', :now, :now)"
+            ), {"i": i, "subject": f"Activity {i}", "now": now})
+        conn.execute(text(
+            "INSERT INTO attachments (activity_id, original_filename, stored_filename, "
+            "file_path, file_size, mime_type, uploaded_at) "
+            "VALUES (1, 'a.txt', 'a.txt', '/tmp/a.txt', 1, 'text/plain', :now)"
+        ), {"now": now})
+
+    yield engine
+    engine.dispose()
+
+
+def _scalars(bind, sql, **params):
+    with bind.connect() as conn:
+        return conn.execute(text(sql), params).scalars().all()
+
+
+def _make_activities_legacy(bind):
+    """Recreate activities with the pre-migration NOT NULL subject."""
+    with bind.begin() as conn:
+        conn.execute(text("ALTER TABLE activities RENAME TO activities_legacy"))
+        conn.execute(text(LEGACY_ACTIVITIES_SQL))
+        conn.execute(text("INSERT INTO activities SELECT * FROM activities_legacy"))
+        conn.execute(text("DROP TABLE activities_legacy"))
+        for index in Activity.__table__.indexes:
+            index.create(conn)
+        for statement in ACTIVITIES_FTS_DDL:
+            conn.execute(text(statement))
+
+
+def _rebuild_activities(bind, after_swap=()):
+    columns = make_activity_subject_nullable.COLUMNS
+    return rebuild_table_in_batches(
+        bind,
+        "test.rebuild",
+        "activities",
+        create_sql=LEGACY_ACTIVITIES_SQL.replace("CREATE TABLE activities", "CREATE TABLE activities_new"),
+        columns=columns,
+        after_swap=after_swap,
+        pause_seconds=0,
+        progress=lambda line: None
+    )
+
+
+def _subject_nullable(bind):
+    return next(col for col in inspect(bind).get_columns("activities") if col["name"] == "subject")["nullable"]
+
+
+def test_backfill_runs_in_batches_and_resumes(bind):
+    """Test an interrupted backfill continues after the last committed batch."""
+    calls = []
+
+    def failing_batch(conn, after_key, up_to_key):
+        calls.append((after_key, up_to_key))
+        if len(calls) == 2:
+            raise RuntimeError("interrupted")
+        return conn.execute(
+            text("UPDATE contacts SET notes = 'done' WHERE id > :a AND id <= :b"),
+            {"a": after_key, "b": up_to_key}
+        ).rowcount
+
+    migration = BatchedMigration(bind, "test.notes", "contacts", pause_seconds=0)
+    with pytest.raises(RuntimeError):
+        migration.run(failing_batch)
+
+    assert migration.checkpoint()["last_key"] == 2
+    assert _scalars(bind, "SELECT COUNT(*) FROM contacts WHERE notes = 'done'") == [2]
+
+    rows = backfill_in_batches(bind, "test.notes", "contacts", "notes = 'done'", pause_seconds=0)
+
+    assert rows == 5
+    assert _scalars(bind, "SELECT COUNT(*) FROM contacts WHERE notes = 'done'") == [5]
+    assert migration.checkpoint()["completed_at"] is not None
+
+
+def test_current_stage_backfill_is_batched(bind):
+    """Test the current-stage backfill fixes every contact through checkpoints."""
+    add_current_stage_to_contacts.backfill()
+
+    assert set(_scalars(bind, "SELECT current_pipeline_stage FROM contacts")) == {"Client"}
+    checkpoint = BatchedMigration(bind, add_current_stage_to_contacts.BACKFILL_NAME, "contacts").checkpoint()
+    assert checkpoint["rows_done"] == 5
+    assert checkpoint["completed_at"] is not None
+
+
+def test_current_stage_backfill_resumes_after_crash_following_add_column(bind, monkeypatch):
+    """Test a crash between ADD COLUMN and the first batch still backfills on the next run."""
+    add_current_stage_to_contacts.downgrade()
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(add_current_stage_to_contacts, "backfill_in_batches", crash)
+        with pytest.raises(KeyboardInterrupt):
+            add_current_stage_to_contacts.upgrade()
+    assert set(_scalars(bind, "SELECT current_pipeline_stage FROM contacts")) == {"Lead"}
+
+    add_current_stage_to_contacts.upgrade()
+
+    assert set(_scalars(bind, "SELECT current_pipeline_stage FROM contacts")) == {"Client"}
+    checkpoint = BatchedMigration(bind, add_current_stage_to_contacts.BACKFILL_NAME, "contacts").checkpoint()
+    assert checkpoint["completed_at"] is not None
+
+
+def test_table_rebuild_keeps_concurrent_writes_and_resumes(bind, monkeypatch):
+    """Test the online rebuild mirrors writes made mid-copy and survives interruption."""
+    _make_activities_legacy(bind)
+    triggers = set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'"))
+    indexes = set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'index'"))
+
+    def write_then_interrupt(seconds):
+        # Runs between the first and second batch, like application traffic
+        now = datetime.utcnow()
+        with bind.begin() as conn:
+            conn.execute(text("UPDATE activities SET subject = 'Renamed' WHERE id = 1"))
+            conn.execute(text("DELETE FROM activities WHERE id = 2"))
+            conn.execute(text(
+                "INSERT INTO activities (id, contact_id, type, subject, activity_date, "
+                "pipeline_stage, created_at, updated_at) "
+                "VALUES (6, 1, 'Note', 'Added mid-copy', :now, 'Lead', :now, :now)"
+            ), {"now": now})
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(batched.time, "sleep", write_then_interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        make_activity_subject_nullable.upgrade()
+    monkeypatch.setattr(batched.time, "sleep", lambda seconds: None)
+
+    make_activity_subject_nullable.upgrade()
+
+    assert _scalars(bind, "SELECT id FROM activities ORDER BY id") == [1, 3, 4, 5, 6]
+    assert _scalars(bind, "SELECT subject FROM activities WHERE id = 1") == ["Renamed"]
+    assert _subject_nullable(bind)
+    assert set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'")) == triggers
+    assert set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'index'")) == indexes
+    assert _scalars(bind, "SELECT COUNT(*) FROM attachments") == [1]
+    assert _scalars(
+        bind, "SELECT rowid FROM activities_fts WHERE activities_fts MATCH 'renamed'"
+    ) == [1]
+
+
+def test_failed_table_swap_keeps_the_old_table(bind):
+    """Test a statement failing mid-swap rolls back the drop and rename."""
+    _make_activities_legacy(bind)
+    triggers = set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'"))
+
+    with pytest.raises(OperationalError):
+        _rebuild_activities(bind, after_swap=["CREATE INDEX ix_broken ON missing_table (id)"])
+
+    tables = inspect(bind).get_table_names()
+    assert "activities" in tables and "activities_new" in tables
+    assert not _subject_nullable(bind)
+    assert _scalars(bind, "SELECT id FROM activities ORDER BY id") == [1, 2, 3, 4, 5]
+    # Mirror triggers are still in place, so writes keep reaching the copy
+    assert {f"activities_new_mirror_{kind}" for kind in ("ai", "au", "ad")} <= set(
+        _scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    )
+    assert BatchedMigration(bind, "test.rebuild", "activities").checkpoint()["completed_at"] is None
+
+    assert _rebuild_activities(bind) == 5
+
+    assert "activities_new" not in inspect(bind).get_table_names()
+    assert _scalars(bind, "SELECT id FROM activities ORDER BY id") == [1, 2, 3, 4, 5]
+    assert set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'")) == triggers
+
+
+def test_failed_rebuild_setup_leaves_nothing_behind(bind, monkeypatch):
+    """Test the copy table and mirror triggers are only created with their checkpoint."""
+    _make_activities_legacy(bind)
+    triggers = set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'"))
+
+    def failing_start(self, conn):
+        raise RuntimeError("crashed before the checkpoint was written")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(BatchedMigration, "start", failing_start)
+        with pytest.raises(RuntimeError):
+            _rebuild_activities(bind)
+
+    assert "activities_new" not in inspect(bind).get_table_names()
+    assert set(_scalars(bind, "SELECT name FROM sqlite_master WHERE type = 'trigger'")) == triggers
+
+    assert _rebuild_activities(bind) == 5
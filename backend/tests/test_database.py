@@ -0,0 +1,153 @@
+"""Tests for database engine configuration."""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from starlette.requests import Request
+
+from app.config import settings
+from app.database import (
+    Base,
+    MeteredQueuePool,
+    SessionLocal,
+    engine,
+    engine_options,
+    get_db,
+    get_effective_pragmas,
+    pool_status,
+    read_engine,
+)
+
+
+@pytest.fixture
+def fresh_connections():
+    """Create tables on fresh pooled connections.
+
+    Connections pooled by earlier tests may hold schema cached before other
+    tests dropped and recreated the tables.
+    """
+    engine.dispose()
+    if read_engine is not None:
+        read_engine.dispose()
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+def _session_for(method: str):
+    """Open the session get_db would inject for a request with this method."""
+    generator = get_db(Request({"type": "http", "method": method, "headers": []}))
+    return generator, next(generator)
+
+
+def test_engine_applies_sqlite_pragma_profile():
+    """Test new connections run with the configured pragma profile."""
+    pragmas = get_effective_pragmas(engine)
+
+    assert pragmas["journal_mode"].upper() == settings.SQLITE_JOURNAL_MODE.upper()
+    assert pragmas["synchronous"] == 1  # NORMAL
+    assert pragmas["cache_size"] == settings.SQLITE_CACHE_SIZE
+    assert pragmas["temp_store"] == 2  # MEMORY
+    assert pragmas["busy_timeout"] == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert pragmas["foreign_keys"] == 1
+
+
+def test_get_db_uses_read_only_session_for_safe_methods(fresh_connections):
+    """Test GET requests get a read-only session and POST requests a writable one."""
+    read_gen, read_db = _session_for("GET")
+    try:
+        assert read_db.get_bind() is read_engine
+        assert read_db.execute(text("SELECT count(*) FROM users")).scalar() >= 0
+        with pytest.raises(OperationalError, match="readonly"):
+            read_db.execute(text("DELETE FROM users WHERE id = -1"))
+    finally:
+        read_db.rollback()
+        read_gen.close()
+
+    write_gen, write_db = _session_for("POST")
+    try:
+        assert write_db.get_bind() is engine
+        write_db.execute(text("DELETE FROM users WHERE id = -1"))
+        write_db.commit()
+    finally:
+        write_gen.close()
+
+
+def test_write_transactions_are_serialized(fresh_connections):
+    """Test a second writer waits until the first write transaction commits."""
+    events = []
+
+    def second_writer():
+        second = SessionLocal()
+        try:
+            second.execute(text("DELETE FROM users WHERE id = -2"))
+            events.append("second-write")
+            second.commit()
+        finally:
+            second.close()
+
+    first = SessionLocal()
+    try:
+        first.execute(text("DELETE FROM users WHERE id = -1"))
+        events.append("first-write")
+
+        thread = threading.Thread(target=second_writer)
+        thread.start()
+        time.sleep(0.2)
+        events.append("first-commit")
+        first.commit()
+    finally:
+        first.close()
+    thread.join(timeout=5)
+
+    assert events == ["first-write", "first-commit", "second-write"]
+
+
+def test_engine_options_are_dialect_aware():
+    """Test server databases get pool settings and SQLite only what it supports."""
+    server = engine_options("postgresql://user@localhost/simplecrm")
+    assert "connect_args" not in server
+    assert server["poolclass"] is MeteredQueuePool
+    assert server["pool_size"] == settings.DB_POOL_SIZE
+    assert server["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert server["pool_timeout"] == settings.DB_POOL_TIMEOUT_SECONDS
+    assert server["pool_recycle"] == settings.DB_POOL_RECYCLE_SECONDS
+    assert server["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+
+    sqlite_file = engine_options("sqlite:///./simplecrm.db")
+    assert sqlite_file["connect_args"] == {"check_same_thread": False}
+    assert sqlite_file["pool_size"] == settings.DB_POOL_SIZE
+    assert "pool_pre_ping" not in sqlite_file
+
+    assert engine_options("sqlite:///:memory:") == {"connect_args": {"check_same_thread": False}}
+
+
+def test_pool_status_reports_checkouts_and_timeouts(tmp_path):
+    """Test pool status tracks checked-out connections, overflow and waits."""
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    options = engine_options(url, pool_size=1, max_overflow=1)
+    options["pool_timeout"] = 0.1
+    bind = create_engine(url, **options)
+
+    first = bind.connect()
+    second = bind.connect()
+    try:
+        status = pool_status(bind)
+        assert status["checked_out"] == 2
+        assert status["overflow"] == 1
+
+        with pytest.raises(PoolTimeoutError):
+            bind.connect()
+    finally:
+        first.close()
+        second.close()
+
+    status = pool_status(bind)
+    bind.dispose()
+
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 3
+    assert status["timeouts"] == 1
+    assert status["max_wait_ms"] >= 100
@@ -0,0 +1,93 @@
+"""Tests for the Prometheus /metrics endpoint."""
+
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.services.metrics import metrics, render
+
+# A PID no live process uses (above the Linux pid_max limit)
+EXITED_PID = 2 ** 22 + 1
+
+
+@pytest.fixture
+def client():
+    """Create a test client (running startup migrations) with fresh request counters."""
+    metrics.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    metrics.clear()
+
+
+def _worker_snapshot(pid, requests):
+    return {
+        "pid": pid,
+        "counters": [
+            ["simplecrm_http_requests_total",
+             [["method", "GET"], ["route", "/api/contacts"], ["status", "200"]], requests],
+            ["simplecrm_attachment_bytes_total", [["direction", "in"]], 1024],
+        ],
+        "gauges": [["simplecrm_password_pool_tasks", [["state", "queued"]], 3]],
+        "histograms": [],
+    }
+
+
+def test_render_sums_workers_and_builds_cumulative_buckets():
+    """Test samples from several workers add up and histogram buckets accumulate."""
+    labels = [["method", "GET"], ["route", "/api/contacts"], ["status", "200"]]
+    first = _worker_snapshot(1, 2)
+    first["histograms"] = [[labels, [1] + [0] * 10 + [1, 0.2]]]
+    second = _worker_snapshot(2, 3)
+
+    text = render([first, second])
+
+    assert 'simplecrm_http_requests_total{method="GET",route="/api/contacts",status="200"} 5' in text
+    assert 'simplecrm_attachment_bytes_total{direction="in"} 2048' in text
+    assert 'simplecrm_password_pool_tasks{state="queued"} 6' in text
+    assert 'route="/api/contacts",status="200",le="0.005"} 1' in text
+    assert 'route="/api/contacts",status="200",le="+Inf"} 2' in text
+    assert 'simplecrm_http_request_duration_seconds_count{method="GET",route="/api/contacts",status="200"} 2' in text
+    assert "# TYPE simplecrm_http_request_duration_seconds histogram" in text
+
+
+def test_metrics_endpoint_reports_requests_and_components(client):
+    """Test /metrics exposes request counters and component gauges."""
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'simplecrm_http_requests_total{method="GET",route="/health",status="200"} 1' in response.text
+    for name in (
+        "simplecrm_db_pool_connections{",
+        "simplecrm_auth_cache_hit_ratio ",
+        "simplecrm_password_pool_tasks{",
+        'simplecrm_session_rows{state="active"}',
+    ):
+        assert name in response.text
+
+
+def test_metrics_aggregate_workers_through_shared_directory(client, tmp_path, monkeypatch):
+    """Test counters from every snapshot count, gauges only from live workers."""
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+    (tmp_path / f"{EXITED_PID}.json").write_text(json.dumps(_worker_snapshot(EXITED_PID, 7)))
+
+    response = client.get("/metrics")
+
+    assert (tmp_path / f"{os.getpid()}.json").exists()
+    assert 'simplecrm_http_requests_total{method="GET",route="/api/contacts",status="200"} 7' in response.text
+    assert 'simplecrm_attachment_bytes_total{direction="in"} 1024' in response.text
+    # Only this process's queue depth: the exited worker's gauge is dropped
+    assert 'simplecrm_password_pool_tasks{state="queued"} 0' in response.text
+
+
+def test_metrics_can_be_disabled(client, monkeypatch):
+    """Test METRICS_ENABLED=false hides the endpoint."""
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+
+    assert client.get("/metrics").status_code == 404
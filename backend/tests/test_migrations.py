@@ -0,0 +1,131 @@
+"""Tests for the schema version check and migration runner."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+
+from app.config import settings
+from app.migrations.runner import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    ensure_schema,
+    get_schema_version,
+    migrate,
+    migration_lock,
+)
+from app.models import Base
+
+
+@pytest.fixture
+def bind(tmp_path, monkeypatch):
+    """Create an engine on an empty database that migrations also connect to."""
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    monkeypatch.setattr(settings, "DATABASE_URL", url)
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+def _sqlite_objects(bind, kind):
+    """Names of the SQLite schema objects of one kind (table, index, trigger)."""
+    with bind.connect() as conn:
+        return {
+            row[0] for row in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = :kind"), {"kind": kind}
+            )
+        }
+
+
+def test_fresh_database_is_created_and_stamped(bind):
+    """Test a new database gets the full schema and every version recorded."""
+    assert get_schema_version(bind) is None
+
+    applied = ensure_schema(bind)
+
+    assert applied == [name for _, name in MIGRATIONS]
+    assert get_schema_version(bind) == SCHEMA_VERSION
+    assert {"users", "contacts", "activities", "schema_migrations"} <= set(inspect(bind).get_table_names())
+
+
+def test_current_schema_is_checked_with_one_query(bind):
+    """Test startup on an up-to-date database issues a single query and no DDL."""
+    ensure_schema(bind)
+
+    statements = []
+    event.listen(bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert ensure_schema(bind) == []
+    assert len(statements) == 1
+    assert "schema_migrations" in statements[0]
+
+
+def test_untracked_database_runs_all_migrations_without_losing_objects(bind):
+    """Test a database created before version tracking is migrated in place."""
+    Base.metadata.create_all(bind=bind)
+    with bind.begin() as conn:
+        conn.execute(text("DROP TABLE schema_migrations"))
+    triggers = _sqlite_objects(bind, "trigger")
+    indexes = _sqlite_objects(bind, "index")
+
+    applied = ensure_schema(bind)
+
+    assert applied == [name for _, name in MIGRATIONS]
+    assert get_schema_version(bind) == SCHEMA_VERSION
+    assert _sqlite_objects(bind, "trigger") == triggers
+    assert _sqlite_objects(bind, "index") == indexes
+
+
+def test_pending_migrations_refuse_start_without_auto_migrate(bind):
+    """Test a behind schema raises instead of migrating when auto-migrate is off."""
+    ensure_schema(bind)
+    with bind.begin() as conn:
+        conn.execute(text("DELETE FROM schema_migrations WHERE version = :v"), {"v": SCHEMA_VERSION})
+
+    with pytest.raises(RuntimeError, match="scripts/migrate.py"):
+        ensure_schema(bind, auto_migrate=False)
+
+    assert ensure_schema(bind) == [MIGRATIONS[-1][1]]
+    assert get_schema_version(bind) == SCHEMA_VERSION
+
+
+def test_concurrent_workers_migrate_once(bind):
+    """Test workers starting together on a fresh database migrate one at a time."""
+    script = (
+        "from sqlalchemy import create_engine\n"
+        "from app.config import settings\n"
+        "from app.migrations.runner import ensure_schema\n"
+        "print(len(ensure_schema(create_engine(settings.DATABASE_URL))))\n"
+    )
+    env = {**os.environ, "DATABASE_URL": str(bind.url)}
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        for _ in range(4)
+    ]
+    results = [worker.communicate(timeout=120) for worker in workers]
+
+    assert [worker.returncode for worker in workers] == [0] * 4, [err for _, err in results]
+    assert sorted(int(out) for out, _ in results) == [0, 0, 0, len(MIGRATIONS)]
+    assert get_schema_version(bind) == SCHEMA_VERSION
+
+
+def test_migrate_waits_for_the_migration_lock(bind, monkeypatch):
+    """Test migrate gives up while another process holds the lock."""
+    monkeypatch.setattr(settings, "SCHEMA_MIGRATION_LOCK_TIMEOUT_SECONDS", 0.1)
+
+    with migration_lock(bind):
+        with pytest.raises(RuntimeError, match="another process"):
+            migrate(bind)
+
+    assert get_schema_version(bind) is None
+    assert migrate(bind) == [name for _, name in MIGRATIONS]
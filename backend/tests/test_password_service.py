@@ -1,8 +1,12 @@
 """Tests for PasswordService."""
 
+import asyncio
+import threading
+
 import pytest
 
-from app.services.password_service import PasswordService
+from app.config import settings
+from app.services.password_service import PasswordQueueFullError, PasswordService
 
 
 def test_hash_password_produces_different_hash_each_time():
@@ -41,3 +45,97 @@ def test_verify_password_is_timing_safe():
     # This test verifies the function works correctly
     assert PasswordService.verify_password(password, hashed) is True
     assert PasswordService.verify_password("different", hashed) is False
+
+
+def test_async_hash_and_verify_use_worker_pool():
+    """Test async hashing and verification round-trip through the worker pool."""
+    async def run():
+        hashed = await PasswordService.hash_password_async("poolpassword")
+        ok = await PasswordService.verify_password_async("poolpassword", hashed)
+        bad = await PasswordService.verify_password_async("wrongpassword", hashed)
+        return hashed, ok, bad
+
+    completed_before = PasswordService.queue_stats()["completed"]
+    hashed, ok, bad = asyncio.run(run())
+
+    assert hashed.startswith("$2b$12$")
+    assert ok is True
+    assert bad is False
+    stats = PasswordService.queue_stats()
+    assert stats["completed"] == completed_before + 3
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+
+
+def test_async_hash_rejects_when_queue_full(monkeypatch):
+    """Test that work beyond workers + max queue is rejected, not queued."""
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 0)
+    monkeypatch.setattr(PasswordService, "_pending", 1)
+    rejected_before = PasswordService.queue_stats()["rejected"]
+
+    with pytest.raises(PasswordQueueFullError):
+        asyncio.run(PasswordService.hash_password_async("overflow"))
+
+    assert PasswordService.queue_stats()["rejected"] == rejected_before + 1
+
+
+def test_cancelled_request_keeps_its_slot_until_the_job_finishes(monkeypatch):
+    """Test cancelling the awaiting request does not free a slot bcrypt still occupies."""
+    monkeypatch.setattr(settings, "PASSWORD_HASH_EXECUTOR", "thread")
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 0)
+    PasswordService.shutdown_executor()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_job():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    async def run():
+        request = asyncio.create_task(PasswordService._run(slow_job))
+        await asyncio.to_thread(started.wait, 5)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+        # The worker is still busy, so there is no room for more work
+        assert PasswordService.queue_stats()["in_flight"] == 1
+        with pytest.raises(PasswordQueueFullError):
+            await PasswordService.hash_password_async("overflow")
+
+        # Once the job itself finishes, its slot is free again
+        release.set()
+        for _ in range(500):
+            if PasswordService.queue_stats()["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        return await PasswordService._run(lambda: "next")
+
+    try:
+        assert asyncio.run(run()) == "next"
+    finally:
+        release.set()
+        PasswordService.shutdown_executor()
+
+    assert PasswordService.queue_stats()["in_flight"] == 0
+
+
+def test_hash_password_uses_configured_rounds(monkeypatch):
+    """Test hashing honours PASSWORD_BCRYPT_ROUNDS."""
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 4)
+    hashed = PasswordService.hash_password("cheap")
+
+    assert PasswordService.get_rounds(hashed) == 4
+    assert PasswordService.needs_rehash(hashed) is False
+
+    monkeypatch.setattr(settings, "PASSWORD_BCRYPT_ROUNDS", 5)
+    assert PasswordService.needs_rehash(hashed) is True
+
+
+def test_get_rounds_rejects_unknown_format():
+    """Test get_rounds returns None for non-bcrypt strings."""
+    assert PasswordService.get_rounds("not-a-hash") is None
+    assert PasswordService.needs_rehash("not-a-hash") is True
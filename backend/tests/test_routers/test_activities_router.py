@@ -226,6 +226,51 @@ def test_list_all_activities_with_filter(client, db_session, test_session, test_
     assert data[0]["type"] == "Call"
 
 
+def test_list_activities_with_cursor_pagination(client, db_session, test_session, test_contact):
+    """Test keyset pagination on contact and user activity listings."""
+    db_session.add_all([
+        Activity(
+            contact_id=test_contact.id,
+            type="Note",
+            subject=f"Activity {i}",
+            activity_date=datetime(2025, 11, 18, 10, i)
+        )
+        for i in range(3)
+    ])
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {test_session.session_token}"}
+
+    # Contact timeline: next_cursor in the response body
+    response = client.get(
+        f"/api/contacts/{test_contact.id}/activities?limit=2", headers=headers
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert first_page["total"] == 3
+    assert [a["subject"] for a in first_page["activities"]] == ["Activity 2", "Activity 1"]
+
+    response = client.get(
+        f"/api/contacts/{test_contact.id}/activities?limit=2&cursor={first_page['next_cursor']}",
+        headers=headers
+    )
+    second_page = response.json()
+    assert [a["subject"] for a in second_page["activities"]] == ["Activity 0"]
+    assert second_page["total"] is None
+    assert second_page["next_cursor"] is None
+
+    # All activities: next cursor in the X-Next-Cursor header
+    response = client.get("/api/activities?limit=2", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    response = client.get(
+        f"/api/activities?limit=2&cursor={response.headers['X-Next-Cursor']}",
+        headers=headers
+    )
+    assert [a["subject"] for a in response.json()] == ["Activity 0"]
+    assert "X-Next-Cursor" not in response.headers
+
+
 def test_unauthorized_access(client):
     """Test accessing activity endpoints without authentication."""
     response = client.get("/api/activities")
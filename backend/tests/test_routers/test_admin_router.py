@@ -0,0 +1,59 @@
+"""Tests for Admin API endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return TestClient(app)
+
+
+def test_db_pool_disabled_without_admin_token(client, monkeypatch):
+    """Test admin endpoints are hidden while ADMIN_TOKEN is unset."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+
+    response = client.get("/api/admin/db-pool", headers={"X-Admin-Token": ""})
+
+    assert response.status_code == 404
+
+
+def test_db_pool_rejects_wrong_token(client, monkeypatch):
+    """Test a wrong or missing admin token is rejected."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+
+    assert client.get("/api/admin/db-pool").status_code == 403
+    assert client.get("/api/admin/db-pool", headers={"X-Admin-Token": "nope"}).status_code == 403
+
+
+def test_db_pool_reports_write_pool(client, monkeypatch):
+    """Test the pool status lists the write engine's pool counters."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+
+    response = client.get("/api/admin/db-pool", headers={"X-Admin-Token": "s3cret"})
+
+    assert response.status_code == 200
+    write = response.json()["engines"]["write"]
+    assert write["pool_class"] == "MeteredQueuePool"
+    assert write["size"] == settings.DB_POOL_SIZE
+    assert write["max_overflow"] == settings.DB_MAX_OVERFLOW
+    for key in ("checked_out", "overflow", "checkouts", "avg_wait_ms", "max_wait_ms"):
+        assert key in write
+
+
+def test_latency_lists_timed_routes(client, monkeypatch):
+    """Test the latency report includes routes served since startup."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+    headers = {"X-Admin-Token": "s3cret"}
+    client.get("/api/admin/db-pool", headers=headers)
+
+    response = client.get("/api/admin/latency", headers=headers)
+
+    assert response.status_code == 200
+    total = response.json()["routes"]["GET /api/admin/db-pool"]["total"]
+    assert total["count"] >= 1
+    assert total["p50_ms"] <= total["max_ms"]
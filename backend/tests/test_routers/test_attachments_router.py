@@ -11,6 +11,7 @@ from sqlalchemy.orm import sessionmaker
 from app.database import Base, get_db
 from app.main import app
 from app.models import Activity, Attachment, Contact, Session, User
+from app.services.metrics import metrics
 
 
 @pytest.fixture
@@ -141,3 +142,22 @@ def test_upload_without_authentication(client, test_activity):
         files=files
     )
     assert response.status_code == 401
+
+
+def test_upload_and_download_count_attachment_bytes(client, test_session, test_activity):
+    """Test uploaded and downloaded bytes are added to the attachment metrics."""
+    metrics.clear()
+    headers = {"Authorization": f"Bearer {test_session.session_token}"}
+    files = {"file": ("test.txt", BytesIO(b"0123456789"), "text/plain")}
+
+    upload = client.post(f"/api/activities/{test_activity.id}/attachments", files=files, headers=headers)
+    download = client.get(
+        f"/api/activities/{test_activity.id}/attachments/{upload.json()['id']}",
+        headers=headers
+    )
+
+    assert download.content == b"0123456789"
+    text = metrics.collect()
+    assert 'simplecrm_attachment_bytes_total{direction="in"} 10' in text
+    assert 'simplecrm_attachment_bytes_total{direction="out"} 10' in text
+    metrics.clear()
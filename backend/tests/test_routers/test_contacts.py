@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from datetime import datetime
 
 import pytest
 from fastapi.testclient import TestClient
@@ -139,6 +140,65 @@ def test_get_contacts_with_search(client, db_session, test_user, auth_headers):
     assert json_data["contacts"][0]["name"] == "Alice Anderson"
 
 
+def test_get_contacts_with_cursor_pagination(client, db_session, test_user, auth_headers):
+    """Test walking the contact list with next_cursor returns every contact once."""
+    created_at = datetime(2025, 11, 17, 10, 30)
+    contacts = [
+        # Shared timestamps exercise the id tie-breaker in the cursor
+        Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user.id, created_at=created_at)
+        for i in range(5)
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+
+    response = client.get("/api/contacts?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    json_data = response.json()
+    seen = [c["id"] for c in json_data["contacts"]]
+
+    while json_data["next_cursor"]:
+        response = client.get(
+            f"/api/contacts?limit=2&cursor={json_data['next_cursor']}",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        json_data = response.json()
+        # Only the first page counts the filtered set
+        assert json_data["total"] is None
+        seen.extend(c["id"] for c in json_data["contacts"])
+
+    assert seen == sorted((c.id for c in contacts), reverse=True)
+    assert json_data["has_more"] is False
+
+
+def test_get_contacts_with_invalid_cursor(client, auth_headers):
+    """Test that a malformed cursor is rejected."""
+    response = client.get("/api/contacts?cursor=not-a-cursor", headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+def test_suggest_contacts_by_prefix(client, db_session, test_user, auth_headers):
+    """Test typeahead suggestions match accent-folded prefixes."""
+    contacts = [
+        Contact(name="José Alvarez", email="jose@acme.com", company="Acme Corp", user_id=test_user.id),
+        Contact(name="Joanna Smith", email="joanna@example.com", user_id=test_user.id),
+        Contact(name="Bob Brown", email="bob@example.com", user_id=test_user.id),
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+
+    response = client.get("/api/contacts/suggest?q=jo", headers=auth_headers)
+
+    assert response.status_code == 200
+    suggestions = response.json()["suggestions"]
+    assert [s["name"] for s in suggestions] == ["Joanna Smith", "José Alvarez"]
+    assert set(suggestions[0]) == {"id", "name", "email", "company"}
+
+    response = client.get("/api/contacts/suggest?q=jose&limit=1", headers=auth_headers)
+    assert [s["company"] for s in response.json()["suggestions"]] == ["Acme Corp"]
+
+
 def test_get_contact_by_id(client, db_session, test_user, auth_headers):
     """Test getting a single contact by ID."""
     contact = Contact(
@@ -0,0 +1,115 @@
+"""Tests for Server-Timing headers and per-route latency histograms."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import Base, get_db
+from app.main import app
+from app.models import User
+from app.services.query_stats import query_recorder
+from app.services.request_timing import LatencyHistogram, route_latency
+from app.services.session_service import SessionService
+
+
+@pytest.fixture
+def db_session(tmp_path):
+    """Create a session on an instrumented temp file database."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'timing.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    query_recorder.install(engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(db_session):
+    """Create a test client with database override."""
+    def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    route_latency.clear()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    route_latency.clear()
+
+
+@pytest.fixture
+def auth_headers(db_session):
+    """Create a user and a bearer token for it."""
+    user = User(email="timing@example.com", full_name="Timing User", hashed_password="x")
+    db_session.add(user)
+    db_session.commit()
+    session = SessionService.create_session(db_session, user.id)
+    return {"Authorization": f"Bearer {session.session_token}"}
+
+
+def _server_timing(response) -> dict:
+    """Parse a Server-Timing header into metric name -> parameters."""
+    metrics = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+def test_histogram_percentiles_have_bounded_error():
+    """Test percentiles from the log-linear buckets stay within 2% of the truth."""
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 1000
+    assert summary["mean_ms"] == pytest.approx(500.5)
+    assert summary["p50_ms"] == pytest.approx(500, rel=0.02)
+    assert summary["p99_ms"] == pytest.approx(990, rel=0.02)
+    assert summary["max_ms"] == 1000
+
+
+def test_contacts_response_reports_phases(client, auth_headers):
+    """Test the contact list reports auth, db, handler and serialization time."""
+    response = client.get(
+        "/api/contacts",
+        headers={**auth_headers, "Origin": "http://localhost:5173"}
+    )
+
+    assert response.status_code == 200
+    metrics = _server_timing(response)
+    assert {"total", "auth", "db", "handler", "serialize"} <= set(metrics)
+    assert float(metrics["auth"]["dur"]) <= float(metrics["total"]["dur"])
+    assert metrics["db"]["desc"].endswith('queries"')
+    assert response.headers["timing-allow-origin"] == "http://localhost:5173"
+
+    histograms = route_latency.snapshot()["GET /api/contacts"]
+    assert histograms["total"]["count"] == 1
+    assert histograms["handler"]["count"] == 1
+
+
+def test_failed_auth_is_recorded_under_route_template(client):
+    """Test requests rejected by a dependency still count towards their route."""
+    response = client.get("/api/contacts/42")
+
+    assert response.status_code == 401
+    assert "auth" in _server_timing(response)
+    assert "handler" not in route_latency.snapshot()["GET /api/contacts/{contact_id}"]
+
+
+def test_server_timing_header_can_be_disabled(client, auth_headers, monkeypatch):
+    """Test SERVER_TIMING_HEADER=false keeps histograms but sends no header."""
+    monkeypatch.setattr(settings, "SERVER_TIMING_HEADER", False)
+
+    response = client.get("/api/users/me", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+    assert route_latency.snapshot()["GET /api/users/me"]["total"]["count"] == 1
@@ -1,14 +1,15 @@
 """Tests for ActivityService."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Activity, Base, Contact, User
 from app.schemas.activity import ActivityCreateSchema, ActivityUpdateSchema
 from app.services.activity_service import ActivityService
+from app.services.cursor_service import CursorService
 
 
 @pytest.fixture
@@ -231,3 +232,91 @@ def test_search_activities(db_session, test_user, test_contact):
 
     assert len(activities) == 1
     assert "requirements" in activities[0].subject
+
+
+def test_search_activities_ranked_with_snippets(db_session, test_user, test_contact):
+    """Test full-text activity search ranks subject hits first and returns snippets."""
+    db_session.add_all([
+        Activity(
+            contact_id=test_contact.id,
+            type="Note",
+            subject="Weekly sync",
+            notes="We briefly touched on the budget for next quarter",
+            activity_date=datetime.utcnow()
+        ),
+        Activity(
+            contact_id=test_contact.id,
+            type="Meeting",
+            subject="Budget review",
+            notes="Walked through the budget line by line",
+            activity_date=datetime.utcnow() - timedelta(days=7)
+        ),
+        Activity(
+            contact_id=test_contact.id,
+            type="Call",
+            subject="Intro call",
+            notes="No money talk yet",
+            activity_date=datetime.utcnow()
+        )
+    ])
+    db_session.commit()
+
+    activities = ActivityService.get_all_activities_for_user(
+        db_session, test_user.id, search="budg"
+    )
+
+    assert [a.subject for a in activities] == ["Budget review", "Weekly sync"]
+    assert "**budget**" in activities[1].search_snippet
+
+    # Cursor pages keep date order but still carry snippets
+    page, next_cursor = ActivityService.get_all_activities_for_user_after_cursor(
+        db_session, test_user.id, limit=1, search="budget"
+    )
+    assert [a.subject for a in page] == ["Weekly sync"]
+    assert page[0].search_snippet
+    assert next_cursor is not None
+
+
+def test_user_wide_cursor_page_seeks_activity_date_index(db_session, test_user):
+    """Test the all-contacts keyset seek starts at the cursor in the activity_date index."""
+    contacts = [
+        Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user.id)
+        for i in range(100)
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+    start = datetime(2025, 1, 1)
+    db_session.add_all(
+        Activity(
+            contact_id=contact.id,
+            type="Call",
+            subject="Call",
+            activity_date=start + timedelta(hours=i * 100 + j)
+        )
+        for j, contact in enumerate(contacts)
+        for i in range(5)
+    )
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+
+    statements = []
+    bind = db_session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM activities" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        cursor = CursorService.encode_cursor(start + timedelta(hours=250), 0)
+        ActivityService.get_all_activities_for_user_after_cursor(db_session, test_user.id, cursor, 10)
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+
+    statement, parameters = statements[0]
+    plan = " ".join(
+        row[3] for row in db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+    )
+    assert "SEARCH activities USING INDEX ix_activities_activity_date (activity_date<?)" in plan
@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Activity, Base, Contact, User
@@ -97,6 +97,78 @@ def test_contact_current_pipeline_stage_defaults_to_lead(db_session, test_user):
     assert contact.current_pipeline_stage == "Lead"
 
 
+def test_current_pipeline_stage_follows_activity_update_and_delete(db_session, test_user):
+    """Test that the materialized stage is recomputed when activities change."""
+    contact = Contact(name="Sam Stage", email="sam@example.com", user_id=test_user.id)
+    db_session.add(contact)
+    db_session.commit()
+
+    older = Activity(
+        contact_id=contact.id,
+        type="Note",
+        activity_date=datetime.utcnow() - timedelta(days=2),
+        pipeline_stage="Qualified"
+    )
+    newer = Activity(
+        contact_id=contact.id,
+        type="Call",
+        activity_date=datetime.utcnow(),
+        pipeline_stage="Proposal"
+    )
+    db_session.add_all([older, newer])
+    db_session.commit()
+    assert contact.current_pipeline_stage == "Proposal"
+
+    # Updating the latest activity's stage moves the contact with it
+    newer.pipeline_stage = "Client"
+    db_session.commit()
+    assert contact.current_pipeline_stage == "Client"
+
+    # Deleting the latest activity falls back to the previous one
+    db_session.delete(newer)
+    db_session.commit()
+    assert contact.current_pipeline_stage == "Qualified"
+
+    # Deleting the last activity resets to Lead
+    db_session.delete(older)
+    db_session.commit()
+    assert contact.current_pipeline_stage == "Lead"
+
+
+def test_get_contacts_for_user_filters_and_paginates_by_current_stage(db_session, test_user):
+    """Test that stage filtering, total count and paging use the current stage."""
+    contacts = [
+        Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user.id)
+        for i in range(5)
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+
+    for contact in contacts[:3]:
+        db_session.add(Activity(
+            contact_id=contact.id,
+            type="Note",
+            activity_date=datetime.utcnow(),
+            pipeline_stage="Qualified"
+        ))
+    db_session.commit()
+
+    page_one, total = ContactService.get_contacts_for_user(
+        db_session, test_user.id, page=1, limit=2, stage="Qualified"
+    )
+    page_two, _ = ContactService.get_contacts_for_user(
+        db_session, test_user.id, page=2, limit=2, stage="Qualified"
+    )
+
+    assert total == 3
+    assert len(page_one) == 2
+    assert len(page_two) == 1
+    assert {c.id for c in page_one + page_two} == {c.id for c in contacts[:3]}
+
+    _, lead_total = ContactService.get_contacts_for_user(db_session, test_user.id, stage="Lead")
+    assert lead_total == 2
+
+
 def test_pipeline_stats_returns_active_passive_counts(db_session, test_user):
     """Test that get_pipeline_stats returns active and passive stage counts."""
     # Create contacts with various stages
@@ -143,6 +215,46 @@ def test_pipeline_stats_returns_active_passive_counts(db_session, test_user):
     assert stats["passive_count"] == 0
 
 
+def test_pipeline_stats_query_count_is_constant(db_session, test_user):
+    """Test that pipeline stats issue the same number of queries at any size."""
+    user_id = test_user.id
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def stats_query_count(contact_count):
+        # Grow the dataset to contact_count contacts before measuring
+        existing = db_session.query(Contact).filter(Contact.user_id == user_id).count()
+        for i in range(existing, contact_count):
+            contact = Contact(name=f"N+1 {i}", email=f"n{i}@example.com", user_id=user_id)
+            db_session.add(contact)
+            db_session.flush()
+            db_session.add(Activity(
+                contact_id=contact.id,
+                type="Note",
+                activity_date=datetime.utcnow(),
+                pipeline_stage="Qualified"
+            ))
+        db_session.commit()
+        db_session.expunge_all()
+
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            stats = ContactService.get_pipeline_stats(db_session, user_id, search="n+1")
+            assert stats["active_stages"]["Qualified"] == contact_count
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        return len(statements)
+
+    engine = db_session.get_bind()
+    small = stats_query_count(3)
+    large = stats_query_count(30)
+
+    assert small == large == 1
+
+
 def test_pipeline_stats_includes_passive_stages(db_session, test_user):
     """Test that pipeline stats includes passive stage counts."""
     # Create contacts with passive stages
@@ -248,3 +360,38 @@ def test_filter_counts_includes_activity_type_counts(db_session, test_user):
     assert counts["activity_type_counts"]["Call"] == 1
     assert counts["activity_type_counts"]["Meeting"] == 1
     assert counts["activity_type_counts"]["Email"] == 1
+
+
+def test_filter_counts_use_fixed_queries_without_id_lists(db_session, test_user):
+    """Test that filter counts run a fixed number of queries with no ID lists."""
+    contacts = [
+        Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user.id)
+        for i in range(20)
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+    db_session.add_all([
+        Activity(contact_id=contact.id, type="Call", activity_date=datetime.utcnow(), pipeline_stage="Proposal")
+        for contact in contacts
+    ])
+    db_session.commit()
+    user_id = test_user.id
+    db_session.expire_all()
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        counts = ContactService.get_filter_counts(db_session, user_id, search="contact")
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert counts["stage_counts"] == {"Proposal": 20}
+    assert counts["activity_type_counts"] == {"Call": 20}
+    assert len(statements) == 2
+    # Contact IDs are never inlined as bound parameters
+    assert all(len(parameters) < 10 for _, parameters in statements)
@@ -125,6 +125,34 @@ def test_get_contacts_for_user_with_search(db_session, test_user):
     assert result[0].company == "Gamma LLC"
 
 
+def test_search_uses_full_text_prefix_index(db_session, test_user):
+    """Test prefix, accent-insensitive search and index sync on update/delete."""
+    renee = Contact(name="Renée Dubois", email="renee@example.com", company="Acme Widgets", user_id=test_user.id)
+    other = Contact(name="Bob Brown", email="bob@example.com", company="Beta Inc", user_id=test_user.id)
+    db_session.add_all([renee, other])
+    db_session.commit()
+
+    # Word prefixes across columns, accent-folded
+    result, total = ContactService.get_contacts_for_user(db_session, test_user.id, search="rene acm")
+    assert total == 1
+    assert result[0].id == renee.id
+
+    # Updates are reflected through the sync triggers
+    ContactService.update_contact(
+        db_session, renee.id, test_user.id, ContactUpdateSchema(company="Globex")
+    )
+    _, total = ContactService.get_contacts_for_user(db_session, test_user.id, search="acme")
+    assert total == 0
+    _, total = ContactService.get_contacts_for_user(db_session, test_user.id, search="glob")
+    assert total == 1
+
+    # Deleted contacts drop out of the index; a rebuild keeps results stable
+    ContactService.delete_contact(db_session, other.id, test_user.id)
+    ContactService.rebuild_search_index(db_session)
+    _, total = ContactService.get_contacts_for_user(db_session, test_user.id, search="bob")
+    assert total == 0
+
+
 def test_get_contacts_for_user_with_filter(db_session, test_user):
     """Test filtering contacts by pipeline stage."""
     contacts = [
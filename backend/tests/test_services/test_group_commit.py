@@ -0,0 +1,194 @@
+"""Tests for the group-commit writer."""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import httpx
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.main import app
+from app.models import Activity, Attachment, Base, Contact, User
+from app.schemas.activity import ActivityCreateSchema
+from app.services import activity_service, attachment_service
+from app.services.activity_service import ActivityService
+from app.services.group_commit import GroupCommitWriter
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Create a session factory on a file database shared across threads."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'group_commit.db'}",
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(session_factory):
+    """Create a writer with a window wide enough to batch concurrent callers."""
+    writer = GroupCommitWriter(session_factory, window_ms=100, max_batch=50)
+    yield writer
+    writer.shutdown()
+
+
+@pytest.fixture
+def test_user(session_factory):
+    """Create a test user."""
+    db = session_factory()
+    user = User(email="test@example.com", full_name="Test User", hashed_password="hashed")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _insert_concurrently(writer, factories):
+    """Insert from one thread per factory and collect ids or exceptions."""
+    results = [None] * len(factories)
+
+    def worker(index):
+        try:
+            results[index] = writer.insert(factories[index])
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(factories))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_concurrent_inserts_share_commits(writer, session_factory, test_user):
+    """Test concurrent inserts are committed in fewer transactions than rows."""
+    factories = [
+        (lambda i=i: Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user))
+        for i in range(20)
+    ]
+
+    ids = _insert_concurrently(writer, factories)
+
+    assert all(isinstance(row_id, int) for row_id in ids)
+    assert len(set(ids)) == 20
+    assert writer.inserts == 20
+    assert writer.batches < 20
+
+    db = session_factory()
+    names = {row_id: name for row_id, name in db.query(Contact.id, Contact.name)}
+    db.close()
+    for i, row_id in enumerate(ids):
+        assert names[row_id] == f"Contact {i}"
+
+
+def test_failed_insert_does_not_fail_its_batch(writer, session_factory, test_user):
+    """Test a bad row raises for its caller only while the rest commit."""
+    factories = [
+        (lambda i=i: Contact(name=f"Contact {i}", email=f"c{i}@example.com", user_id=test_user))
+        for i in range(5)
+    ]
+    factories.append(lambda: Contact(name=None, email="bad@example.com", user_id=test_user))
+
+    results = _insert_concurrently(writer, factories)
+
+    assert isinstance(results[-1], IntegrityError)
+    assert all(isinstance(row_id, int) for row_id in results[:-1])
+
+    db = session_factory()
+    assert db.query(Contact).count() == 5
+    db.close()
+
+
+def test_create_activity_uses_group_commit_when_enabled(
+    writer, session_factory, test_user, monkeypatch
+):
+    """Test ActivityService routes inserts through the writer when opted in."""
+    monkeypatch.setattr(settings, "GROUP_COMMIT_ENABLED", True)
+    monkeypatch.setattr(activity_service, "group_commit", writer)
+
+    db = session_factory()
+    contact = Contact(
+        name="John Doe",
+        email="john@example.com",
+        user_id=test_user,
+        current_pipeline_stage="Qualified"
+    )
+    db.add(contact)
+    db.commit()
+
+    activity = ActivityService.create_activity(
+        db,
+        contact.id,
+        test_user,
+        ActivityCreateSchema(type="Call", subject="Intro", activity_date=datetime.utcnow())
+    )
+
+    assert isinstance(activity, Activity)
+    assert activity.id is not None
+    assert activity.pipeline_stage == "Qualified"
+    assert writer.inserts == 1
+    db.close()
+
+
+def test_concurrent_uploads_share_a_group_commit(writer, session_factory, test_user, monkeypatch):
+    """Test async upload handlers wait for their batch without blocking the event loop."""
+    monkeypatch.setattr(settings, "GROUP_COMMIT_ENABLED", True)
+    monkeypatch.setattr(attachment_service, "group_commit", writer)
+
+    db = session_factory()
+    contact = Contact(name="John Doe", email="john@example.com", user_id=test_user)
+    db.add(contact)
+    db.commit()
+    activity = Activity(
+        contact_id=contact.id, type="Call", subject="Intro", activity_date=datetime.utcnow()
+    )
+    db.add(activity)
+    db.commit()
+    activity_id = activity.id
+    user = db.get(User, test_user)
+    db.close()
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: user
+
+    async def upload_twice():
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            return await asyncio.gather(*(
+                client.post(
+                    f"/api/activities/{activity_id}/attachments",
+                    files={"file": (f"note{i}.txt", b"content", "text/plain")}
+                )
+                for i in range(2)
+            ))
+
+    try:
+        responses = asyncio.run(upload_twice())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [201, 201]
+    assert writer.inserts == 2
+    assert writer.batches == 1
+
+    db = session_factory()
+    assert db.query(Attachment).count() == 2
+    db.close()
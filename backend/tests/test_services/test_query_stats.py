@@ -0,0 +1,84 @@
+"""Tests for per-request query statistics."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from app.middleware import QueryStatsMiddleware
+from app.services.query_stats import query_recorder, redact_parameters, statement_pattern
+
+
+@pytest.fixture
+def bind(tmp_path):
+    """Create an instrumented engine on a temp file database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'queries.db'}")
+    query_recorder.install(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, secret TEXT)"))
+        for i in range(1, 6):
+            conn.execute(text("INSERT INTO items (id, secret) VALUES (:id, 'hunter2')"), {"id": i})
+    yield engine
+    engine.dispose()
+
+
+def test_statement_pattern_collapses_whitespace_and_in_lists():
+    """Test repeated statements normalize to one pattern."""
+    assert statement_pattern("SELECT *\n  FROM items WHERE id IN (?, ?, ?)") == (
+        "SELECT * FROM items WHERE id IN (?)"
+    )
+    assert redact_parameters(("hunter2", 5)) == "(str, int)"
+    assert redact_parameters([("a",), ("b",)], executemany=True) == "<2 parameter sets>"
+
+
+def test_scope_counts_statements_and_warns_on_repeats(bind, monkeypatch, caplog):
+    """Test a loop of identical selects is counted and reported as N+1."""
+    monkeypatch.setattr(settings, "QUERY_N_PLUS_ONE_THRESHOLD", 5)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.services.query_stats"):
+        with query_recorder.scope("GET /items") as stats:
+            with bind.connect() as conn:
+                conn.execute(text("SELECT COUNT(*) FROM items")).scalar()
+                for i in range(1, 6):
+                    conn.execute(text("SELECT secret FROM items WHERE id = :id"), {"id": i}).scalar()
+
+    assert stats.statements == 6
+    assert stats.db_seconds > 0
+    assert stats.repeated(5) == [("SELECT secret FROM items WHERE id = ?", 5)]
+    assert "Possible N+1 in GET /items: statement ran 5 times" in caplog.text
+
+
+def test_slow_queries_are_logged_with_redacted_parameters(bind, monkeypatch, caplog):
+    """Test statements over the latency threshold are logged without their values."""
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0.000001)
+
+    with caplog.at_level(logging.WARNING, logger="app.slow_queries"):
+        with bind.connect() as conn:
+            conn.execute(text("SELECT id FROM items WHERE secret = :secret"), {"secret": "hunter2"})
+
+    assert "Slow query" in caplog.text
+    assert "SELECT id FROM items WHERE secret = ? params=(str)" in caplog.text
+    assert "hunter2" not in caplog.text
+
+
+def test_middleware_counts_statements_of_threadpool_handlers(bind, monkeypatch):
+    """Test statements run by sync handlers count towards their request."""
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    collected = []
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items")
+    def list_items(request: Request):
+        collected.append(request.state.query_stats)
+        with bind.connect() as conn:
+            return conn.execute(text("SELECT id FROM items")).scalars().all()
+
+    response = TestClient(app).get("/items")
+
+    assert response.json() == [1, 2, 3, 4, 5]
+    assert collected[0].statements == 1
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import pytest
 from sqlalchemy.orm import Session as DBSession
 
+from app.config import settings
 from app.database import Base, SessionLocal, engine
 from app.models.session import Session
 from app.models.user import User
@@ -86,6 +87,38 @@ def test_validate_session_with_expired_token(db: DBSession, test_user: User):
     assert validated_session is None
 
 
+def test_validate_session_with_user_uses_one_query(db: DBSession, test_user: User):
+    """Test joined validation returns session and user in a single statement."""
+    from sqlalchemy import event
+
+    valid = SessionService.create_session(db, test_user.id)
+    expired = Session(
+        session_token=SessionService.generate_token(),
+        user_id=test_user.id,
+        expires_at=datetime.utcnow() - timedelta(days=1)
+    )
+    db.add(expired)
+    db.commit()
+    valid_token, expired_token = valid.session_token, expired.session_token
+    db.expire_all()
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        session, user = SessionService.validate_session_with_user(db, valid_token)
+        assert user.email == "test@example.com"
+        assert session.user_id == user.id
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 1
+    assert SessionService.validate_session_with_user(db, expired_token) is None
+
+
 def test_delete_session(db: DBSession, test_user: User):
     """Test session deletion."""
     session = SessionService.create_session(db, test_user.id)
@@ -104,3 +137,104 @@ def test_delete_nonexistent_session(db: DBSession):
     """Test deleting a non-existent session returns False."""
     result = SessionService.delete_session(db, "nonexistent_token")
     assert result is False
+
+
+def test_create_session_evicts_oldest_beyond_cap(db: DBSession, test_user: User, monkeypatch):
+    """Test creating a session beyond the per-user cap evicts the oldest ones."""
+    monkeypatch.setattr(settings, "MAX_SESSIONS_PER_USER", 2)
+    first = SessionService.create_session(db, test_user.id)
+    first_token = first.session_token
+    second = SessionService.create_session(db, test_user.id)
+    third = SessionService.create_session(db, test_user.id)
+
+    remaining = {
+        s.session_token for s in db.query(Session).filter(Session.user_id == test_user.id)
+    }
+    assert remaining == {second.session_token, third.session_token}
+    assert SessionService.validate_session(db, first_token) is None
+
+
+def test_eviction_of_legacy_sessions_is_one_bounded_delete(db: DBSession, test_user: User, monkeypatch):
+    """Test an account far over the cap is trimmed by one DELETE with a fixed parameter count."""
+    from sqlalchemy import event
+
+    from app.services.auth_cache import auth_cache
+
+    monkeypatch.setattr(settings, "MAX_SESSIONS_PER_USER", 3)
+    created_at = datetime.utcnow() - timedelta(days=1)
+    expires_at = datetime.utcnow() + timedelta(days=6)
+    db.add_all([
+        Session(session_token=f"legacy-{i}", user_id=test_user.id, expires_at=expires_at, created_at=created_at)
+        for i in range(2000)
+    ])
+    db.commit()
+    auth_cache.clear()
+    auth_cache.set("legacy-0", test_user, expires_at)
+    auth_cache.set("legacy-1999", test_user, expires_at)
+
+    deletes = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE"):
+            deletes.append(parameters)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        session = SessionService.create_session(db, test_user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    # user_id twice, LIMIT and OFFSET: no per-row parameters
+    assert len(deletes) == 1
+    assert len(deletes[0]) == 4
+    remaining = {s.session_token for s in db.query(Session).filter(Session.user_id == test_user.id)}
+    assert remaining == {session.session_token, "legacy-1999", "legacy-1998"}
+    assert auth_cache.get("legacy-0") is None
+    assert auth_cache.get("legacy-1999") is not None
+
+
+def test_purge_expired_sessions_in_batches(db: DBSession, test_user: User):
+    """Test purge deletes only expired sessions, batch by batch."""
+    now = datetime.utcnow()
+    for i in range(5):
+        db.add(Session(
+            session_token=f"expired-{i}",
+            user_id=test_user.id,
+            expires_at=now - timedelta(hours=i + 1)
+        ))
+    live = SessionService.create_session(db, test_user.id)
+    db.commit()
+
+    assert SessionService.count_expired_sessions(db) == 5
+    assert SessionService.purge_expired_sessions(db, batch_size=2, max_batches=1) == 2
+    assert SessionService.purge_expired_sessions(db, batch_size=2) == 3
+    assert SessionService.count_expired_sessions(db) == 0
+    assert SessionService.validate_session(db, live.session_token) is not None
+
+
+def test_delete_all_sessions_uses_single_delete(db: DBSession, test_user: User):
+    """Test deleting all of a user's sessions is one set-based statement."""
+    from sqlalchemy import event
+
+    expires_at = datetime.utcnow() + timedelta(days=7)
+    db.add_all([
+        Session(session_token=f"bulk-{i}", user_id=test_user.id, expires_at=expires_at)
+        for i in range(2000)
+    ])
+    db.commit()
+    user_id = test_user.id
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        assert SessionService.delete_all_sessions(db, user_id) == 2000
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert [s for s in statements if s.startswith("DELETE")] == statements
+    assert len(statements) == 1
+    assert db.query(Session).filter(Session.user_id == user_id).count() == 0
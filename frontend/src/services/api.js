@@ -109,6 +109,11 @@ export async function getContacts(params = {}) {
   return apiGet(`/contacts${query ? '?' + query : ''}`)
 }
 
+export async function getContactSuggestions(q, limit = 10) {
+  const queryParams = new URLSearchParams({ q, limit })
+  return apiGet(`/contacts/suggest?${queryParams.toString()}`)
+}
+
 export async function getContactById(id) {
   return apiGet(`/contacts/${id}`)
 }